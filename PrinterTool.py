@@ -2,17 +2,40 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import asyncio
+import base64
+import concurrent.futures
+import csv
+import difflib
+import fnmatch
+import getpass
+import gzip
+import hashlib
 import json
 import logging
+import math
 import os
 import plistlib
+import queue
+import random
 import re
+import shutil
 import sys
+import tempfile
+import threading
+import time
 import traceback
+import tracemalloc
 
+from abc import ABC, abstractmethod
+from array import array
+from collections import Counter, OrderedDict, defaultdict, deque
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from functools import partial
 from typing import Union
+from urllib.parse import quote, urlsplit
 from xml.etree import ElementTree
 from xml.sax.saxutils import escape
 
@@ -85,7 +108,8 @@ Source code can be found on <a href="https://github.com/MLBZ521/JamfProPrinterTo
 
 CLASSIC_API_ENDPOINTS = {
 	"printers": "JSSResource/printers",
-	"printers_by_id": "JSSResource/printers/id"
+	"printers_by_id": "JSSResource/printers/id",
+	"printers_by_name": "JSSResource/printers/name"
 }
 
 PRO_API_ENDPOINTS = {
@@ -93,6 +117,45 @@ PRO_API_ENDPOINTS = {
 	"auth_token": "api/v1/auth/token"
 }
 
+# Methods that can be safely resent, e.g. after a 503 from a write the server had committed
+IDEMPOTENT_METHODS = { "get", "put", "update", "delete" }
+
+# PPD attributes that identify the driver a printer uses
+PPD_ATTRIBUTES = (
+	"Manufacturer", "ModelName", "NickName", "ShortNickName", "Product", "PCFileName",
+	"FileVersion", "FormatVersion", "LanguageVersion", "cupsVersion", "cupsModelNumber",
+	"1284DeviceID", "cupsFilter", "cupsFilter2"
+)
+
+# PPD attributes that can be listed more than once
+PPD_LIST_ATTRIBUTES = { "Product", "cupsFilter", "cupsFilter2" }
+
+# Matches main keyword lines, e.g. *NickName: "HP LaserJet 4250, 1.2"
+PPD_ATTRIBUTE_PATTERN = re.compile(
+	rf'^\*({"|".join(PPD_ATTRIBUTES)})(?:[ \t][^:\n]*)?:[ \t]*"?([^"\n]*)"?', re.MULTILINE)
+
+# Settings that can be overridden with a config file (--config) or command line arguments
+DEFAULT_SETTINGS = {
+	"bulk_workers": 4,
+	"cache_detail_ttl": 300,
+	"cache_list_ttl": 30,
+	"cache_max_bytes": 32 * 1024 * 1024,
+	"cache_spill_bytes": 0,
+	"hedge_percentile": None,
+	"lpadmin_path": "/usr/sbin/lpadmin",
+	"offline_retry_interval": 60,
+	"probe_cache_ttl": 60,
+	"probe_concurrency": 64,
+	"probe_timeout": 2.0,
+	"read_rate": 20,
+	"reference_printers": [],
+	"response_format": "xml",
+	"site_cache_ttl": 24 * 60 * 60,
+	"sites_unauthorized": [ "Site A", "Site 2", "Site C3" ],
+	"state_directory": "~/Library/Application Support/Jamf Pro Printer Tool",
+	"write_rate": 5
+}
+
 
 def log_setup():
 	"""Setup logging"""
@@ -157,6 +220,10 @@ class Ui_MainWindow(object):
 		self.combo_sites.setEnabled(False)
 		self.combo_sites.setGeometry(QtCore.QRect(130, 40, 231, 32))
 		self.combo_sites.setObjectName("combo_sites")
+		self.lineEdit_search = QtWidgets.QLineEdit(self.frame_sites)
+		self.lineEdit_search.setGeometry(QtCore.QRect(370, 40, 161, 32))
+		self.lineEdit_search.setClearButtonEnabled(True)
+		self.lineEdit_search.setObjectName("lineEdit_search")
 		self.frame_jps_printers = QtWidgets.QFrame(self.centralwidget)
 		self.frame_jps_printers.setGeometry(QtCore.QRect(10, 320, 541, 131))
 		self.frame_jps_printers.setFrameShape(QtWidgets.QFrame.StyledPanel)
@@ -165,6 +232,10 @@ class Ui_MainWindow(object):
 		self.label_printers = QtWidgets.QLabel(self.frame_jps_printers)
 		self.label_printers.setGeometry(QtCore.QRect(10, 10, 231, 31))
 		self.label_printers.setObjectName("label_printers")
+		self.label_loading_printers = QtWidgets.QLabel(self.frame_jps_printers)
+		self.label_loading_printers.setGeometry(QtCore.QRect(250, 10, 281, 31))
+		self.label_loading_printers.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+		self.label_loading_printers.setObjectName("label_loading_printers")
 		self.button_get_printers = QtWidgets.QPushButton(self.frame_jps_printers)
 		self.button_get_printers.setEnabled(False)
 		self.button_get_printers.setGeometry(QtCore.QRect(10, 50, 112, 32))
@@ -181,6 +252,10 @@ class Ui_MainWindow(object):
 		self.button_delete_printer.setEnabled(False)
 		self.button_delete_printer.setGeometry(QtCore.QRect(280, 90, 112, 32))
 		self.button_delete_printer.setObjectName("button_delete_printer")
+		self.button_compare_ppd = QtWidgets.QPushButton(self.frame_jps_printers)
+		self.button_compare_ppd.setEnabled(False)
+		self.button_compare_ppd.setGeometry(QtCore.QRect(410, 90, 112, 32))
+		self.button_compare_ppd.setObjectName("button_compare_ppd")
 		self.frame_local_printers = QtWidgets.QFrame(self.centralwidget)
 		self.frame_local_printers.setGeometry(QtCore.QRect(10, 110, 541, 191))
 		self.frame_local_printers.setFrameShape(QtWidgets.QFrame.StyledPanel)
@@ -193,9 +268,12 @@ class Ui_MainWindow(object):
 		self.button_create_printers.setEnabled(False)
 		self.button_create_printers.setGeometry(QtCore.QRect(200, 150, 112, 32))
 		self.button_create_printers.setObjectName("button_create_printers")
-		self.qlist_local_printers = QtWidgets.QListWidget(self.frame_local_printers)
+		self.qlist_local_printers = QtWidgets.QListView(self.frame_local_printers)
 		self.qlist_local_printers.setEnabled(True)
 		self.qlist_local_printers.setGeometry(QtCore.QRect(10, 30, 511, 111))
+		self.qlist_local_printers.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+		self.qlist_local_printers.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+		self.qlist_local_printers.setUniformItemSizes(True)
 		self.qlist_local_printers.setObjectName("qlist_local_printers")
 		self.frame_printer_info = QtWidgets.QFrame(self.centralwidget)
 		self.frame_printer_info.setGeometry(QtCore.QRect(570, 10, 351, 441))
@@ -261,10 +339,19 @@ class Ui_MainWindow(object):
 			QtCore.Qt.AlignLeading | QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
 		self.label_printer_ppd_contents.setObjectName("label_printer_ppd_contents")
 		self.gridLayout.addWidget(self.label_printer_ppd_contents, 9, 0, 1, 1)
-		self.textEdit_printer_ppd_contents = QtWidgets.QTextEdit(self.layoutWidget)
+		self.textEdit_printer_ppd_contents = QtWidgets.QPlainTextEdit(self.layoutWidget)
 		self.textEdit_printer_ppd_contents.setReadOnly(True)
+		self.textEdit_printer_ppd_contents.setUndoRedoEnabled(False)
+		self.textEdit_printer_ppd_contents.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
 		self.textEdit_printer_ppd_contents.setObjectName("textEdit_printer_ppd_contents")
 		self.gridLayout.addWidget(self.textEdit_printer_ppd_contents, 9, 2, 1, 1)
+		self.lineEdit_ppd_search = QtWidgets.QLineEdit(self.layoutWidget)
+		self.lineEdit_ppd_search.setClearButtonEnabled(True)
+		self.lineEdit_ppd_search.setObjectName("lineEdit_ppd_search")
+		self.gridLayout.addWidget(self.lineEdit_ppd_search, 10, 2, 1, 1)
+		self.label_ppd_summary = QtWidgets.QLabel(self.layoutWidget)
+		self.label_ppd_summary.setObjectName("label_ppd_summary")
+		self.gridLayout.addWidget(self.label_ppd_summary, 11, 2, 1, 1)
 		self.label_printer_display_name = QtWidgets.QLabel(self.layoutWidget)
 		self.label_printer_display_name.setObjectName("label_printer_display_name")
 		self.gridLayout.addWidget(self.label_printer_display_name, 0, 0, 1, 1)
@@ -291,6 +378,8 @@ class Ui_MainWindow(object):
 		self.menuFile.setObjectName("menuFile")
 		self.menuSettings = QtWidgets.QMenu(self.menubar)
 		self.menuSettings.setObjectName("menuSettings")
+		self.menuBulk = QtWidgets.QMenu(self.menubar)
+		self.menuBulk.setObjectName("menuBulk")
 		MainWindow.setMenuBar(self.menubar)
 		self.statusBar = QtWidgets.QStatusBar(MainWindow)
 		self.statusBar.setObjectName("statusBar")
@@ -298,28 +387,65 @@ class Ui_MainWindow(object):
 		self.actionClearAPIToken = QtGui.QAction(MainWindow)
 		self.actionClearAPIToken.setShortcutVisibleInContextMenu(False)
 		self.actionClearAPIToken.setObjectName("actionClearAPIToken")
+		self.actionCancel = QtGui.QAction(MainWindow)
+		self.actionCancel.setObjectName("actionCancel")
 		self.actionExit = QtGui.QAction(MainWindow)
 		self.actionExit.setObjectName("actionExit")
 		self.actionShow_Details = QtGui.QAction(MainWindow)
 		self.actionShow_Details.setObjectName("actionShow_Details")
 		self.actionAbout = QtGui.QAction(MainWindow)
 		self.actionAbout.setObjectName(u"actionAbout")
+		self.actionReconcile = QtGui.QAction(MainWindow)
+		self.actionReconcile.setObjectName("actionReconcile")
+		self.actionDriftReport = QtGui.QAction(MainWindow)
+		self.actionDriftReport.setObjectName("actionDriftReport")
+		self.actionDriverQuery = QtGui.QAction(MainWindow)
+		self.actionDriverQuery.setObjectName("actionDriverQuery")
+		self.actionConflicts = QtGui.QAction(MainWindow)
+		self.actionConflicts.setObjectName("actionConflicts")
+		self.actionProbe = QtGui.QAction(MainWindow)
+		self.actionProbe.setObjectName("actionProbe")
+		self.actionInstallLocally = QtGui.QAction(MainWindow)
+		self.actionInstallLocally.setObjectName("actionInstallLocally")
+		self.actionRetag = QtGui.QAction(MainWindow)
+		self.actionRetag.setObjectName("actionRetag")
+		self.actionBulkDelete = QtGui.QAction(MainWindow)
+		self.actionBulkDelete.setObjectName("actionBulkDelete")
+		self.actionResume = QtGui.QAction(MainWindow)
+		self.actionResume.setObjectName("actionResume")
+		self.actionPending = QtGui.QAction(MainWindow)
+		self.actionPending.setObjectName("actionPending")
+		self.menuFile.addAction(self.actionCancel)
 		self.menuFile.addAction(self.actionExit)
 		self.menuFile.addAction(self.actionAbout)
 		self.menuSettings.addAction(self.actionClearAPIToken)
 		self.menuSettings.addAction(self.actionShow_Details)
+		self.menuBulk.addAction(self.actionReconcile)
+		self.menuBulk.addAction(self.actionDriftReport)
+		self.menuBulk.addAction(self.actionDriverQuery)
+		self.menuBulk.addAction(self.actionConflicts)
+		self.menuBulk.addAction(self.actionProbe)
+		self.menuBulk.addAction(self.actionRetag)
+		self.menuBulk.addAction(self.actionBulkDelete)
+		self.menuBulk.addAction(self.actionInstallLocally)
+		self.menuBulk.addSeparator()
+		self.menuBulk.addAction(self.actionResume)
+		self.menuBulk.addAction(self.actionPending)
 		self.menubar.addAction(self.menuFile.menuAction())
 		self.menubar.addAction(self.menuSettings.menuAction())
+		self.menubar.addAction(self.menuBulk.menuAction())
 
 		QtWidgets.QWidget.setTabOrder(self.button_get_sites, self.combo_sites)
-		QtWidgets.QWidget.setTabOrder(self.combo_sites, self.qlist_local_printers)
+		QtWidgets.QWidget.setTabOrder(self.combo_sites, self.lineEdit_search)
+		QtWidgets.QWidget.setTabOrder(self.lineEdit_search, self.qlist_local_printers)
 		QtWidgets.QWidget.setTabOrder(self.qlist_local_printers, self.button_create_printers)
 		QtWidgets.QWidget.setTabOrder(self.button_create_printers, self.button_get_printers)
 		QtWidgets.QWidget.setTabOrder(self.button_get_printers, self.combo_printers)
 		QtWidgets.QWidget.setTabOrder(self.combo_printers, self.button_update_printer)
 		QtWidgets.QWidget.setTabOrder(self.button_update_printer, self.button_delete_printer)
+		QtWidgets.QWidget.setTabOrder(self.button_delete_printer, self.button_compare_ppd)
 		QtWidgets.QWidget.setTabOrder(
-			self.button_delete_printer, self.lineEdit_printer_display_name)
+			self.button_compare_ppd, self.lineEdit_printer_display_name)
 		QtWidgets.QWidget.setTabOrder(
 			self.lineEdit_printer_display_name, self.lineEdit_printer_location)
 		QtWidgets.QWidget.setTabOrder(self.lineEdit_printer_location, self.lineEdit_printer_model)
@@ -333,6 +459,7 @@ class Ui_MainWindow(object):
 		QtWidgets.QWidget.setTabOrder(self.lineEdit_site, self.lineEdit_created_by)
 		QtWidgets.QWidget.setTabOrder(self.lineEdit_created_by, self.lineEdit_updated_by)
 		QtWidgets.QWidget.setTabOrder(self.lineEdit_updated_by, self.textEdit_printer_ppd_contents)
+		QtWidgets.QWidget.setTabOrder(self.textEdit_printer_ppd_contents, self.lineEdit_ppd_search)
 
 		self.retranslate_ui(MainWindow)
 		QtCore.QMetaObject.connectSlotsByName(MainWindow)
@@ -342,13 +469,16 @@ class Ui_MainWindow(object):
 		MainWindow.setWindowTitle(_translate("MainWindow", "Jamf Pro Printer Tool"))
 		self.label_sites.setText(_translate("MainWindow", "Select the Site to work in:"))
 		self.button_get_sites.setText(_translate("MainWindow", "Get Sites"))
+		self.lineEdit_search.setPlaceholderText(_translate("MainWindow", "Search printers"))
 		self.label_printers.setText(
 			_translate("MainWindow", "Select the printer you want to modify:"))
+		self.label_loading_printers.setText("")
 		self.button_get_printers.setText(_translate("MainWindow", "Get Printers"))
 		self.button_update_printer.setText(_translate("MainWindow", "Update Printer"))
 		self.button_delete_printer.setText(_translate("MainWindow", "Delete Printer"))
+		self.button_compare_ppd.setText(_translate("MainWindow", "Compare PPD"))
 		self.label_create.setText(_translate(
-			"MainWindow", "Select the printer you want to use to create or update in Jamf Pro:"))
+			"MainWindow", "Select the printer(s) you want to use to create or update in Jamf Pro:"))
 		self.button_create_printers.setText(_translate("MainWindow", "Create"))
 		self.label_updated_by.setText(_translate("MainWindow", "Updated By"))
 		self.label_created_by.setText(_translate("MainWindow", "Created By"))
@@ -358,16 +488,31 @@ class Ui_MainWindow(object):
 		self.label_site.setText(_translate("MainWindow", "Site"))
 		self.label_printer_ppd_path.setText(_translate("MainWindow", "PPD File Path"))
 		self.label_printer_ppd_contents.setText(_translate("MainWindow", "PPD Contents"))
+		self.lineEdit_ppd_search.setPlaceholderText(_translate("MainWindow", "Find in PPD"))
 		self.label_printer_display_name.setText(_translate("MainWindow", "Display Name"))
 		self.label_printer_location.setText(_translate("MainWindow", "Location"))
 		self.menuFile.setTitle(_translate("MainWindow", "FIle"))
 		self.menuSettings.setTitle(_translate("MainWindow", "Settings"))
 		self.actionClearAPIToken.setText(_translate("MainWindow", "Clear API Token"))
 		self.actionClearAPIToken.setShortcut(_translate("MainWindow", "Ctrl+C"))
+		self.actionCancel.setText(_translate("MainWindow", "Cancel Operation"))
+		self.actionCancel.setShortcut(_translate("MainWindow", "Ctrl+."))
 		self.actionExit.setText(_translate("MainWindow", "Exit"))
 		self.actionShow_Details.setText(_translate("MainWindow", "Show Details"))
 		self.actionShow_Details.setShortcut(_translate("MainWindow", "Ctrl+D"))
 		self.actionAbout.setText(_translate("MainWindow", u"About", None))
+		self.menuBulk.setTitle(_translate("MainWindow", "Bulk Actions"))
+		self.actionReconcile.setText(
+			_translate("MainWindow", "Reconcile Site with Local Printers..."))
+		self.actionDriftReport.setText(_translate("MainWindow", "Drift Report..."))
+		self.actionDriverQuery.setText(_translate("MainWindow", "Find Printers by Driver..."))
+		self.actionConflicts.setText(_translate("MainWindow", "Find Duplicate Printers..."))
+		self.actionProbe.setText(_translate("MainWindow", "Check Printer Connectivity..."))
+		self.actionInstallLocally.setText(_translate("MainWindow", "Install Printers Locally..."))
+		self.actionRetag.setText(_translate("MainWindow", "Move Printers to Another Site..."))
+		self.actionBulkDelete.setText(_translate("MainWindow", "Delete Printers..."))
+		self.actionResume.setText(_translate("MainWindow", "Resume Interrupted Operation..."))
+		self.actionPending.setText(_translate("MainWindow", "Pending Changes..."))
 
 
 class Ui_LoginWindow(object):
@@ -525,6 +670,48 @@ class Ui_About(object):
 		self.textBrowser_label.setText(QtCore.QCoreApplication.translate("About", __about__, None))
 
 
+class Ui_BulkResults(object):
+	def setup_ui(self, BulkResults):
+		if not BulkResults.objectName():
+			BulkResults.setObjectName(u"BulkResults")
+		BulkResults.resize(600, 400)
+		self.verticalLayout = QtWidgets.QVBoxLayout(BulkResults)
+		self.verticalLayout.setObjectName(u"verticalLayout")
+		self.label_summary = QtWidgets.QLabel(BulkResults)
+		self.label_summary.setObjectName(u"label_summary")
+		self.verticalLayout.addWidget(self.label_summary)
+		self.table_results = QtWidgets.QTableWidget(BulkResults)
+		self.table_results.setObjectName(u"table_results")
+		self.table_results.setColumnCount(3)
+		self.table_results.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+		self.table_results.setSortingEnabled(True)
+		self.table_results.horizontalHeader().setStretchLastSection(True)
+		self.verticalLayout.addWidget(self.table_results)
+		self.buttonLayout = QtWidgets.QHBoxLayout()
+		self.buttonLayout.setObjectName(u"buttonLayout")
+		self.buttonExport = QtWidgets.QPushButton(BulkResults)
+		self.buttonExport.setObjectName(u"buttonExport")
+		self.buttonLayout.addWidget(self.buttonExport)
+		self.buttonClose = QtWidgets.QPushButton(BulkResults)
+		self.buttonClose.setObjectName(u"buttonClose")
+		self.buttonLayout.addWidget(self.buttonClose)
+		self.verticalLayout.addLayout(self.buttonLayout)
+
+		self.retranslate_ui(BulkResults)
+		QtCore.QMetaObject.connectSlotsByName(BulkResults)
+
+	def retranslate_ui(self, BulkResults):
+		_translate = QtCore.QCoreApplication.translate
+		BulkResults.setWindowTitle(_translate("BulkResults", "Results"))
+		self.table_results.setHorizontalHeaderLabels([
+			_translate("BulkResults", "Printer"),
+			_translate("BulkResults", "Result"),
+			_translate("BulkResults", "Details")
+		])
+		self.buttonExport.setText(_translate("BulkResults", "Export..."))
+		self.buttonClose.setText(_translate("BulkResults", "Close"))
+
+
 class About(QtWidgets.QDialog, Ui_About):
 	def __init__(self, parent=None):
 		QtWidgets.QDialog.__init__(self, parent)
@@ -532,6 +719,69 @@ class About(QtWidgets.QDialog, Ui_About):
 		self.parent = parent
 
 
+class BulkResults(QtWidgets.QDialog, Ui_BulkResults):
+	def __init__(self, parent=None):
+		QtWidgets.QDialog.__init__(self, parent)
+		self.setup_ui(self)
+		self.parent = parent
+
+		self.results = []
+
+		##### Setup actions, buttons, triggers, etc
+		self.buttonClose.clicked.connect(self.close)
+		self.buttonExport.clicked.connect(self.export)
+
+
+	def populate(self, title, results):
+		"""
+		Fills the table with the outcome of each item
+
+		Args:
+			title:  Title of the window (str)
+			results:  list of dicts with the "printer", "status", and "details" of each item
+		"""
+
+		self.setWindowTitle(title)
+		self.results = results
+
+		# Count each outcome for the summary
+		outcomes = {}
+
+		for result in results:
+			outcomes[result.get("status")] = outcomes.get(result.get("status"), 0) + 1
+
+		self.label_summary.setText(
+			",  ".join(f"{status}:  {count}" for status, count in sorted(outcomes.items())))
+
+		# Disable sorting while inserting so rows are not reordered mid-insert
+		self.table_results.setSortingEnabled(False)
+		self.table_results.setRowCount(len(results))
+
+		for row, result in enumerate(results):
+			for column, value in enumerate((
+				result.get("printer"),
+				result.get("status"),
+				result.get("details", f"ID:  {result.get('id', '')}")
+			)):
+				self.table_results.setItem(row, column, QtWidgets.QTableWidgetItem(str(value)))
+
+		self.table_results.setSortingEnabled(True)
+		self.table_results.resizeColumnsToContents()
+
+
+	def export(self):
+		"""
+		Handles saving the results as JSON or CSV
+		"""
+
+		report_file, _ = QtWidgets.QFileDialog.getSaveFileName(
+			self, "Export Results", f"{self.windowTitle()}.json", "JSON (*.json);;CSV (*.csv)")
+
+		if report_file:
+			write_report(self.results, report_file)
+			log.info(f"Results saved to:  {report_file}")
+
+
 class LoginWindow(QtWidgets.QDialog, Ui_LoginWindow):
 	def __init__(self, parent=None):
 		QtWidgets.QDialog.__init__(self, parent)
@@ -620,11 +870,29 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 		# Create a list to add each printer into
 		self.jps_printer_list = []
 
+		# Metadata of the PPDs in use, parsed once per unique PPD
+		self.ppd_index = PPDIndex()
+		self.refresh_timing = None
+
+		# Models behind the local printer list and the JPS printer ComboBox
+		self.local_printer_model = PrinterListModel(self)
+		self.local_printer_proxy = PrinterFilterProxyModel(self.local_printer_model, self)
+		self.qlist_local_printers.setModel(self.local_printer_proxy)
+		self.jps_printer_model = PrinterListModel(
+			self, key=lambda printer: printer.printer_id)
+		self.jps_printer_model.printers_added.connect(self.jps_printers_shown)
+		self.jps_printer_proxy = PrinterFilterProxyModel(self.jps_printer_model, self)
+		self.jps_printer_proxy.set_site("")
+		self.combo_printers.setModel(self.jps_printer_proxy)
+
 		##### Setup actions, buttons, triggers, etc
 
 		# When the Exit Action is triggered
 		self.actionExit.triggered.connect(self.shutdown)
 
+		# When the Cancel Operation Action is triggered
+		self.actionCancel.triggered.connect(self.cancel_operations)
+
 		# When the About Action is triggered
 		self.actionAbout.triggered.connect(self.show_about)
 
@@ -634,12 +902,48 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 		# When the Clear API Token Action is triggered
 		self.actionClearAPIToken.triggered.connect(self.clear_api_token)
 
+		# When the Reconcile Action is triggered
+		self.actionReconcile.triggered.connect(self.run_reconcile_printers)
+
+		# When the Drift Report Action is triggered
+		self.actionDriftReport.triggered.connect(self.run_drift_report)
+
+		# When the Find Printers by Driver Action is triggered
+		self.actionDriverQuery.triggered.connect(self.run_driver_query)
+
+		# When the Find Duplicate Printers Action is triggered
+		self.actionConflicts.triggered.connect(self.run_find_conflicts)
+
+		# When the Check Printer Connectivity Action is triggered
+		self.actionProbe.triggered.connect(self.run_probe_printers)
+
+		# When the Install Printers Locally Action is triggered
+		self.actionInstallLocally.triggered.connect(self.run_install_printers)
+
+		# When the Move Printers Action is triggered
+		self.actionRetag.triggered.connect(self.run_retag_printers)
+
+		# When the Delete Printers Action is triggered
+		self.actionBulkDelete.triggered.connect(self.run_bulk_delete_printers)
+
+		# When the Resume Interrupted Operation Action is triggered
+		self.actionResume.triggered.connect(self.run_resume_operation)
+
+		# When the Pending Changes Action is triggered
+		self.actionPending.triggered.connect(self.run_pending_changes)
+
 		# When Get Sites button is clicked
 		self.button_get_sites.clicked.connect(self.run_get_site_access)
 
 		# When a printer is selected in the QList of local printers
-		self.qlist_local_printers.currentTextChanged.connect(self.display_printer_details)
-		self.qlist_local_printers.currentTextChanged.connect(self.button_handler)
+		self.qlist_local_printers.selectionModel().currentChanged.connect(
+			self.display_printer_details)
+		self.qlist_local_printers.selectionModel().currentChanged.connect(self.button_handler)
+
+		# When the admin searches for a printer
+		self.lineEdit_search.textChanged.connect(self.local_printer_proxy.set_search)
+		self.lineEdit_search.textChanged.connect(self.jps_printer_proxy.set_search)
+		self.lineEdit_search.textChanged.connect(self.select_best_matches)
 
 		# When the Site ComboBox value has changed
 		self.combo_sites.currentTextChanged.connect(self.populate_printer_combo_box)
@@ -651,8 +955,9 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 
 		# When the Create Printer button is clicked
 		self.button_create_printers.clicked.connect(self.run_create_printer)
-		# For selecting multiple printers...?
-		# self.qlist_local_printers.itemSelectionChanged.connect(self.selectedLocalPrinter)
+
+		# When multiple local printers are selected
+		self.qlist_local_printers.selectionModel().selectionChanged.connect(self.button_handler)
 
 		# When the Get Printers button is clicked
 		self.button_get_printers.clicked.connect(self.run_get_jps_printers)
@@ -663,10 +968,35 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 		# When the Delete Printer is clicked
 		self.button_delete_printer.clicked.connect(self.run_delete_printer)
 
+		# When the Compare PPD is clicked
+		self.button_compare_ppd.clicked.connect(self.run_compare_ppd)
+
 		# Setup to display login window/login prompt
 		self.displayLoginWindow = WorkerSignals()
 		self.displayLoginWindow.prompt.connect(self.login_prompt)
 
+		# Setup to display the results of a bulk operation
+		self.displayResults = WorkerSignals()
+		self.displayResults.result.connect(self.show_results)
+
+		# Setup to display a PPD that is loaded in the background.  Selection changes are
+		# debounced so scrolling through the printer lists only loads the PPD it stops on.
+		self.ppd_contents = None
+		self.ppd_generation = 0
+		self.ppd_document = None
+		self.ppd_timer = QtCore.QTimer(self)
+		self.ppd_timer.setSingleShot(True)
+		self.ppd_timer.setInterval(150)
+		self.ppd_timer.timeout.connect(self.load_ppd)
+
+		# When the admin searches the PPD
+		self.lineEdit_ppd_search.textChanged.connect(partial(self.find_in_ppd, from_start=True))
+		self.lineEdit_ppd_search.returnPressed.connect(self.find_in_ppd)
+
+		# Setup to display a confirmation prompt
+		self.displayConfirmation = WorkerSignals()
+		self.displayConfirmation.confirm.connect(self.confirmation_prompt)
+
 		# Site Admin Account
 		self.site_admin_account = {}
 
@@ -679,6 +1009,56 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 		# Flag that can be set to stop all current events/threads
 		self.full_stop = False
 
+		# Cancellation tokens of the running operations
+		self.operations = set()
+
+		# Application settings (configured at launch)
+		self.settings = dict(DEFAULT_SETTINGS)
+
+		# Guards changes to the printer lists made by concurrent workers
+		self.registry_lock = threading.Lock()
+
+		# Whether the JPS printers changed since the printer model was last synced
+		self.jps_printers_changed = False
+
+		# Changes made while the Jamf Pro Server is unreachable are queued and sent later
+		self.offline_queue = None
+		self.offline_flushing = False
+		self.offline_last_flush = 0
+		self.offline_timer = QtCore.QTimer(self)
+		self.offline_timer.timeout.connect(self.check_offline_queue)
+		self.offline_timer.start(5000)
+
+		# Counters used to report on API activity
+		self.api_metrics = ApiMetrics()
+
+		# Optional request hedging for idempotent GETs (configured at launch)
+		self.request_hedger = None
+
+		# Paces all API traffic (configured at launch)
+		self.rate_limiter = None
+
+		# Caches GET responses (configured at launch)
+		self.response_cache = None
+
+		# Checks whether printers accept connections (configured at launch)
+		self.uri_prober = DeviceURIProber()
+
+		# Installs printers on this Mac (configured at launch)
+		self.lpadmin_installer = LpadminInstaller()
+
+		# Sites the Site Admin is authorized for
+		self.site_names = set()
+
+		# Sites that are never listed, even if the Site Admin has access (configured at launch)
+		self.sites_unauthorized = compile_site_patterns(DEFAULT_SETTINGS.get("sites_unauthorized"))
+
+		# Concurrent lookups of the same resource share one request
+		self.single_flight = SingleFlight(metrics = self.api_metrics)
+
+		# Parses printer records from the Classic API (configured at launch)
+		self.response_codec = PRINTER_CODECS.get(DEFAULT_SETTINGS.get("response_format"))
+
 	################################################################################################
 	# Threading Functions
 
@@ -706,20 +1086,310 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 		self.worker_thread(self.clicked_delete_printer)
 
 
+	def run_reconcile_printers(self):
+		self.worker_thread(self.clicked_reconcile_printers)
+
+
+	def run_drift_report(self):
+		self.worker_thread(self.clicked_drift_report)
+
+
+	def run_install_printers(self):
+		"""
+		Prompts for which printers to install on this Mac, then starts the worker
+		"""
+
+		site = self.selected_combo_box_value(self.combo_sites)
+
+		if site is None or not self.jps_printer_list:
+			self.statusBar.showMessage(
+				"Select a Site and get printers from Jamf Pro before installing printers.")
+			return
+
+		name_filter, accepted = QtWidgets.QInputDialog.getText(
+			self, "Install Printers Locally",
+			f"Install printers from [{site}] whose name matches (wildcards allowed):",
+			text=self.selected_combo_box_value(self.combo_printers) or "*"
+		)
+
+		if not accepted:
+			return
+
+		self.worker_thread(partial(
+			self.clicked_install_printers,
+			site = site,
+			name_filter = name_filter or "*"
+		))
+
+
+	def run_probe_printers(self):
+		"""
+		Starts the worker that checks whether the device URIs of the JPS printers in the
+		selected Site, or every Site when one is not selected, accept connections
+		"""
+
+		self.worker_thread(self.clicked_probe_printers)
+
+
+	def run_find_conflicts(self):
+		"""
+		Starts the worker that reports the JPS printers that duplicate or collide with other
+		printers
+		"""
+
+		self.worker_thread(self.clicked_find_conflicts)
+
+
+	def run_driver_query(self):
+		"""
+		Prompts for the driver to look for, then starts the worker
+		"""
+
+		driver, accepted = QtWidgets.QInputDialog.getText(
+			self, "Find Printers by Driver",
+			"Find printers whose PPD model, nickname, or CUPS filter matches "
+			"(wildcards allowed):",
+			text="*"
+		)
+
+		if not accepted:
+			return
+
+		version_below, accepted = QtWidgets.QInputDialog.getText(
+			self, "Find Printers by Driver",
+			"Only include PPDs with a version lower than (leave blank for any version):"
+		)
+
+		if not accepted:
+			return
+
+		self.worker_thread(partial(
+			self.clicked_driver_query,
+			driver = driver or "*",
+			version_below = version_below.strip() or None
+		))
+
+
+	def run_bulk_delete_printers(self):
+		"""
+		Prompts for which printers to delete, then starts the worker
+		"""
+
+		site = self.selected_combo_box_value(self.combo_sites)
+
+		if site is None or not self.jps_printer_list:
+			self.statusBar.showMessage(
+				"Select a Site and get printers from Jamf Pro before deleting printers.")
+			return
+
+		name_filter, accepted = QtWidgets.QInputDialog.getText(
+			self, "Delete Printers",
+			f"Delete printers in [{site}] whose name matches (wildcards allowed):",
+			text="*"
+		)
+
+		if not accepted:
+			return
+
+		not_installed = QtWidgets.QMessageBox.question(
+			self, "Delete Printers",
+			"Only delete printers that are not installed on this Mac "
+			"(or any configured reference Macs)?"
+		) == QtWidgets.QMessageBox.Yes
+
+		self.worker_thread(partial(
+			self.clicked_bulk_delete_printers,
+			site = site,
+			name_filter = name_filter or "*",
+			not_installed = not_installed
+		))
+
+
+	def run_resume_operation(self):
+		"""
+		Prompts for which interrupted operation to resume or discard, then starts the worker
+		"""
+
+		journals = OperationJournal.find(os.path.expanduser(self.settings.get("state_directory")))
+
+		if not journals:
+			self.statusBar.showMessage("There are no interrupted operations to resume.")
+			return
+
+		if not self.jps_printer_list:
+			self.statusBar.showMessage(
+				"Get printers from Jamf Pro before resuming an interrupted operation.")
+			return
+
+		labels = [
+			f"{count}.  {journal.description}  "
+			f"({len(journal.pending())} remaining, started {journal.opened})"
+			for count, journal in enumerate(journals, start=1)
+		]
+
+		label, accepted = QtWidgets.QInputDialog.getItem(
+			self, "Resume Interrupted Operation", "Operation:", labels, 0, False)
+
+		if not accepted:
+			return
+
+		journal = journals[labels.index(label)]
+
+		message_box = QtWidgets.QMessageBox(self)
+		message_box.setWindowTitle("Resume Interrupted Operation")
+		message_box.setText(
+			f"{journal.description}\n\n"
+			f"{len(journal.steps) - len(journal.pending())} of {len(journal.steps)} step(s) "
+			"completed before the operation was interrupted.  Completed steps are not repeated."
+		)
+		message_box.setDetailedText(journal.report())
+		button_resume = message_box.addButton("Resume", QtWidgets.QMessageBox.AcceptRole)
+		button_discard = message_box.addButton("Discard", QtWidgets.QMessageBox.DestructiveRole)
+		message_box.addButton(QtWidgets.QMessageBox.Cancel)
+		message_box.exec()
+
+		if message_box.clickedButton() == button_discard:
+			journal.remove()
+			self.statusBar.showMessage(f"Discarded:  {journal.description}")
+
+		elif message_box.clickedButton() == button_resume:
+			self.worker_thread(partial(self.clicked_resume_operation, journal = journal))
+
+
+	def run_pending_changes(self):
+		"""
+		Displays the changes queued while Jamf Pro was unreachable; they can be sent now
+		or discarded
+		"""
+
+		pending_queue = self.get_offline_queue()
+
+		if pending_queue is None or not pending_queue.pending():
+			self.statusBar.showMessage("There are no pending changes.")
+			return
+
+		pending_keys = { step.get("key") for step in pending_queue.pending() }
+
+		message_box = QtWidgets.QMessageBox(self)
+		message_box.setWindowTitle("Pending Changes")
+		message_box.setText(
+			f"{len(pending_keys)} change(s) were made while Jamf Pro was unreachable.  They are "
+			"sent automatically once it can be reached again."
+		)
+		message_box.setDetailedText(
+			"\n".join(
+				f"[{step.get('queued')}]  {step.get('action').title()} {step.get('printer')}"
+				for step in pending_queue.pending()
+			)
+		)
+		button_send = message_box.addButton("Send Now", QtWidgets.QMessageBox.AcceptRole)
+		button_discard = message_box.addButton("Discard", QtWidgets.QMessageBox.DestructiveRole)
+		message_box.addButton(QtWidgets.QMessageBox.Close)
+		message_box.exec()
+
+		if message_box.clickedButton() == button_discard:
+
+			with self.registry_lock:
+				pending_queue.remove()
+				self.offline_queue = None
+
+			self.check_offline_queue()
+			self.statusBar.showMessage("Discarded the pending changes")
+
+		elif message_box.clickedButton() == button_send and not self.offline_flushing:
+			self.offline_last_flush = 0
+			self.check_offline_queue()
+
+
+	def check_offline_queue(self):
+		"""
+		Shows how many changes are pending and periodically starts a worker to send them
+		"""
+
+		pending_queue = self.get_offline_queue()
+		pending = len(pending_queue.pending()) if pending_queue else 0
+
+		self.actionPending.setText(
+			f"Pending Changes ({pending})..." if pending else "Pending Changes...")
+
+		if (
+			pending and
+			not self.offline_flushing and
+			not self.full_stop and
+			self.site_admin_account and
+			getattr(self, "jps_url", None) and
+			time.monotonic() - self.offline_last_flush >=
+				self.settings.get("offline_retry_interval")
+		):
+			self.offline_last_flush = time.monotonic()
+			self.offline_flushing = True
+			self.worker_thread(self.flush_offline_queue)
+
+
+	def run_retag_printers(self):
+		"""
+		Prompts for the printers to move and where to, then starts the worker
+		"""
+
+		source_site = self.selected_combo_box_value(self.combo_sites)
+		destination_sites = sorted(
+			site for site in self.site_names if site and site != source_site)
+
+		if source_site is None or not self.jps_printer_list or not destination_sites:
+			self.statusBar.showMessage(
+				"Select a Site and get printers from Jamf Pro before moving printers.")
+			return
+
+		destination_site, accepted = QtWidgets.QInputDialog.getItem(
+			self, "Move Printers", f"Move printers from [{source_site}] to:",
+			destination_sites, 0, False
+		)
+
+		if not accepted:
+			return
+
+		name_filter, accepted = QtWidgets.QInputDialog.getText(
+			self, "Move Printers", "Only move printers whose name matches (wildcards allowed):",
+			text="*"
+		)
+
+		if not accepted:
+			return
+
+		self.worker_thread(partial(
+			self.clicked_retag_printers,
+			source_site = source_site,
+			destination_site = destination_site,
+			name_filter = name_filter or "*"
+		))
+
+
 	def run_get_jps_printer_details(self, id_printer):
-		self.worker_thread(partial(self.get_jps_printer_details, printer_id=id_printer))
+		self.worker_thread(
+			partial(self.get_jps_printer_details, printer_id=id_printer),
+			token = CancellationToken.current()
+		)
 
 
-	def worker_thread(self, function):
+	def worker_thread(self, function, token = None):
 		"""
 		Sets up worker threads that are added to a QThreadPool
 
 		Args:
 			function:  A function that will be executed
+			token:  CancellationToken of the operation the worker belongs to; a new
+				operation is started when not provided
 		"""
 
+		if token is None:
+			token = CancellationToken()
+
+			# Forget operations that have finished
+			self.operations = { operation for operation in self.operations if operation.active }
+			self.operations.add(token)
+
 		# Pass the function to execute
-		self.worker = Worker(function)
+		self.worker = Worker(function, token = token)
 		self.worker.signals.finished.connect(self.finished_worker)
 		self.worker.signals.progress.connect(self.update_worker)
 		self.worker.signals.warning.connect(self.warning_worker)
@@ -733,6 +1403,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 
 		log.debug("Application is shutting down!")
 		self.full_stop = True
+		self.cancel_operations()
 
 		if (background_threads := self.threadpool.activeThreadCount()) > 0:
 			log.debug(f"Background threads running:  {background_threads}")
@@ -740,9 +1411,27 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 			self.threadpool.waitForDone(1000)
 			self.condition.wakeAll()
 
+			# Bulk operations are journaled and can be resumed after the next launch
+			log.info("Interrupted bulk operations can be resumed from the Bulk Actions menu")
+
 		self.close_window()
 
 
+	def cancel_operations(self):
+		"""
+		Cancels every running operation
+		"""
+
+		operations, self.operations = self.operations, set()
+
+		for operation in operations:
+			operation.cancel()
+
+		if operations:
+			log.info(f"Canceled {len(operations)} operation(s)")
+			self.statusBar.showMessage("Canceling...")
+
+
 	def update_worker(self, notification):
 		"""
 		Callback function to updated the progress and status bars
@@ -755,6 +1444,12 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 
 		self.statusBar.showMessage(message)
 
+		if "loading" in notification:
+			self.label_loading_printers.setText(
+				f"Loading {notification.get('loading')} more..."
+				if notification.get("loading") else ""
+			)
+
 		if progressBar_type == "Pulse":
 
 			# Pulse Progress Bar
@@ -773,12 +1468,13 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 		"""
 
 		self.statusBar.showMessage(msg)
+		self.label_loading_printers.clear()
 
 		# Stop Progress Bar
 		self.progress_bar.setRange(0,1)
 
-		# Update the Printer ComboBox
-		self.populate_printer_combo_box()
+		# Show any changes the worker made to the JPS printers
+		self.sync_jps_printer_model()
 
 		# Update Button State
 		self.button_handler()
@@ -790,6 +1486,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 		"""
 
 		self.statusBar.showMessage(msg)
+		self.label_loading_printers.clear()
 
 		# Stop Progress Bar
 		self.progress_bar.setRange(0,1)
@@ -859,6 +1556,72 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 		self.condition.wakeAll()
 
 
+	def confirmation_prompt(self, details):
+		"""
+		Handles displaying a confirmation prompt
+
+		Args:
+			details:  dict containing the "msg" to display, optional "details" to preview,
+				and the "answer" dict of the confirm() call waiting on it
+		"""
+
+		prompt = QtWidgets.QMessageBox(self)
+		prompt.setWindowTitle("Confirm")
+		prompt.setText(details.get("msg"))
+
+		if details.get("details"):
+			prompt.setDetailedText(details.get("details"))
+
+		prompt.setStandardButtons(QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.Cancel)
+		prompt.setDefaultButton(QtWidgets.QMessageBox.Cancel)
+		answer = details.get("answer")
+		answer["confirmed"] = prompt.exec() == QtWidgets.QMessageBox.Yes
+
+		# Wake up the worker that asked
+		answer["answered"].set()
+
+
+	def confirm(self, message, details = None):
+		"""
+		Helper function for worker threads to ask the admin to confirm an action
+
+		Args:
+			message:  Question to ask (str)
+			details:  Preview of what will happen (str)
+		Returns:
+			Whether the admin confirmed the action as a bool
+		"""
+
+		# Each call waits on its own answer so concurrent prompts and other wake ups
+		# cannot hand it someone else's
+		answer = { "confirmed": False, "answered": threading.Event() }
+
+		# Calls self.confirmation_prompt() to display a QMessageBox
+		self.displayConfirmation.confirm.emit(
+			{ "msg": message, "details": details, "answer": answer })
+
+		# Wait here
+		while not answer["answered"].wait(0.1):
+
+			if self.full_stop or CancellationToken.current().cancelled:
+				return False
+
+		return answer["confirmed"]
+
+
+	def show_results(self, results):
+		"""
+		Handles displaying the outcome of a bulk operation
+
+		Args:
+			results:  dict containing a "title" and a list of "results" dicts
+		"""
+
+		self.results_window = BulkResults(parent=self)
+		self.results_window.populate(results.get("title"), results.get("results"))
+		self.results_window.show()
+
+
 	def selected_combo_box_value(self, combo_object):
 		"""
 		Helper function to get the selected value of a QComboBox Widget
@@ -876,21 +1639,28 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 
 	def selected_list_value(self, list_object):
 		"""
-		Helper function to get the selected value of a QListWidget
+		Helper function to get the selected value of a QListView
 
 		Args:
-			list_object:  QListWidget to get the selected value from
+			list_object:  QListView to get the selected value from
 		Returns:
 			Value of the selected item as a str or None
 		"""
 
-		try:
-			return list_object.currentItem().text()
-		except AttributeError:
-			return None
+		return list_object.currentIndex().data()
+
+
+	def selected_list_values(self, list_object):
+		"""
+		Helper function to get the selected values of a multi-select QListView
+
+		Args:
+			list_object:  QListView to get the selected values from
+		Returns:
+			Values of the selected items as a list of str
+		"""
 
-		# For selecting multiple printers...?
-		# print([item.text() for item in self.qlist_local_printers.selectedItems()])
+		return [ index.data() for index in list_object.selectionModel().selectedRows() ]
 
 
 	################################################################################################
@@ -991,8 +1761,8 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 			# Add printer object to list
 			self.local_printer_list.append(printer_object)
 
-			# Add each item to the QListWidget
-			self.qlist_local_printers.addItem(printer_object.display_name)
+			# Add each item to the list of local printers
+			self.local_printer_model.enqueue([ printer_object ])
 
 			local_count = local_count + 1
 
@@ -1092,6 +1862,9 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 		"""
 		Handles the Create Printer button click.
 
+		Multiple selected printers are created concurrently and journaled so an interrupted
+		run can be resumed.
+
 		Args:
 			progress_callback:  A callback function to update the progress and status bars
 			finished_callback:  A callback function to update the progress and status bars
@@ -1103,17 +1876,17 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 
 		# Update Status Bar and Pulse Progress Bar
 		progress_callback.emit({
-			"msg": "Creating selected printer in Jamf Pro...",
+			"msg": "Creating selected printer(s) in Jamf Pro...",
 			"pb_type": "Pulse"
 		})
 
 		# Get the selected values
 		selected_site = self.selected_combo_box_value(self.combo_sites)
-		selected_local_printer = self.selected_list_value(self.qlist_local_printers)
-		log.info(f"Selected printer to CREATE '{selected_local_printer}' in '{selected_site}'")
+		selected_local_printers = set(self.selected_list_values(self.qlist_local_printers))
+		log.info(f"Selected printer(s) to CREATE {selected_local_printers} in '{selected_site}'")
 
 		# Ensure both of the required items have a selection
-		if selected_site is None or selected_local_printer is None:
+		if selected_site is None or not selected_local_printers:
 
 			# Update Status Bar and Progress Bar
 			finished_callback.emit(
@@ -1122,76 +1895,163 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 
 			return
 
-		# Loop through the list of printers
-		for printer in self.local_printer_list:
-
-			if printer.display_name == selected_local_printer:
-
-				# Build the printer payload xml
-				payload = self.build_printer_xml_payload(
-					display_name = printer.display_name,
-					device_uri = printer.device_uri,
-					cups_name = printer.cups_name,
-					location = printer.location,
-					model = printer.model,
-					ppd_contents = printer.ppd_contents,
-					ppd_path = printer.ppd_path,
-					site = selected_site,
-					created = get_timestamp(),
-					created_by = self.site_admin_account.get("username")
-				)
+		printers = [
+			printer
+			for printer in self.local_printer_list
+			if printer.display_name in selected_local_printers
+		]
 
-				# POST to create a new printer in the JPS.
-				response_create_printer = self.jamf_pro_api(
-					api_account = self.jps_privileged_api_account,
-					method = "post",
-					endpoint = f"{CLASSIC_API_ENDPOINTS.get('printers_by_id')}/0",
-					receive_content_type = "xml",
-					data = payload.encode("utf-8"),
-					warning_callback = warning_callback
-				)
+		journal = OperationJournal.start(
+			self.state_path(
+				"create", selected_site, *sorted(printer.cups_name for printer in printers)),
+			f"Create printers in {selected_site}"
+		)
+		journal.plan([ journal_step("create", printer, selected_site) for printer in printers ])
+
+		# Create the printers in parallel
+		results = self.run_journaled(
+			journal,
+			warning_callback,
+			progress_callback = progress_callback,
+			message = "Creating printers in Jamf Pro..."
+		)
 
-				if response_create_printer.status_code == 409:
+		# Steps that raised have no result
+		results = [ result or { "status": "Failed" } for result in results ]
+		created_ids = [
+			result.get("id") for result in results if result.get("status") == "Created" ]
 
-					# Update Status Bar and Pulse Progress Bar
-					warning_callback.emit("ERROR:  Printer name already exists in Jamf Pro")
-					log.warning("Failed to create printer due duplicate name")
+		# Look up all of the newly created printers in one pass so they can be added to the list
+		if created_ids:
 
-				elif response_create_printer.status_code != 201:
+			new_printers = self.run_concurrently(
+				partial(self.fetch_jps_printer, warning_callback = warning_callback),
+				created_ids,
+				progress_callback = progress_callback,
+				message = "Fetching the created printers..."
+			)
 
-					# Update Status Bar and Pulse Progress Bar
-					warning_callback.emit(
-						"ERROR:  Failed to create the selected printer in Jamf Pro")
-					log.error(
-						"Failed to create the printer!\n"
-						f"\tStatus Code:  {response_create_printer.status_code}\n"
-						f"\tURI:  {CLASSIC_API_ENDPOINTS.get('printers_by_id')}/0\n"
-						f"\tResponse:  {response_create_printer.text}"
-					)
+			self.add_jps_printers(new_printers)
 
-				else:
+		if len(results) == 1:
 
-					# Get the Printer ID of the newly created printer
-					response_create_printer_xml = ElementTree.fromstring(
-						response_create_printer.text)
-					printer_id = response_create_printer_xml.find("id").text
+			if results[0].get("status") == "Duplicate":
 
-					# Set the number of printers and create a counter
-					self.lookup_count = 0
-					self.total_jps_printers = 1
+				# Update Status Bar and Pulse Progress Bar
+				warning_callback.emit("ERROR:  Printer name already exists in Jamf Pro")
 
-					# Get the newly created printer details so that it can be added to the list
-					self.worker_thread(partial(
-						self.get_jps_printer_details, printer_id=printer_id))
+			elif results[0].get("status") == "Queued":
 
-					# Wait here for until printer details are collected
-					self.lock_mutex(True)
+				# Update Status Bar and Progress Bar
+				finished_callback.emit(
+					"Jamf Pro is unreachable; queued the creation of the selected printer")
 
-					# Update Status Bar and Progress Bar
-					finished_callback.emit(
-						"Creating selected printer in Jamf Pro...  [COMPLETE]")
+			elif results[0].get("status") != "Created":
+
+				# Update Status Bar and Pulse Progress Bar
+				warning_callback.emit("ERROR:  Failed to create the selected printer in Jamf Pro")
+
+			else:
+
+				# Update Status Bar and Progress Bar
+				finished_callback.emit("Creating selected printer in Jamf Pro...  [COMPLETE]")
+
+			return
+
+		# Display the outcome of each printer
+		self.displayResults.result.emit({
+			"title": f"Create Printers in {selected_site}",
+			"results": results
+		})
+
+		# Update Status Bar and Progress Bar
+		finished_callback.emit(
+			"Creating selected printers in Jamf Pro...  "
+			f"[{len(created_ids)}/{len(results)} CREATED]"
+		)
+
+
+	def create_jps_printer(self, printer, site, warning_callback):
+		"""
+		Helper function that creates a local printer in Jamf Pro.
+
+		Args:
+			printer:  Printer object to create (Printer)
+			site:  Site to assign the printer to (str)
+			warning_callback:  A callback function to update the progress and status bars
+		Returns:
+			dict of the printer's name, the "status" of the request, and the new printer's "id"
+				or the "details" of the failure
+		"""
+
+		# Build the printer payload xml
+		payload = self.build_printer_xml_payload(
+			display_name = printer.display_name,
+			device_uri = printer.device_uri,
+			cups_name = printer.cups_name,
+			location = printer.location,
+			model = printer.model,
+			ppd_contents = printer.ppd_contents,
+			ppd_path = printer.ppd_path,
+			site = site,
+			created = get_timestamp(datetime.now()),
+			created_by = self.site_admin_account.get("username")
+		)
+
+		# POST to create a new printer in the JPS.
+		response_create_printer = self.jamf_pro_api(
+			api_account = self.jps_privileged_api_account,
+			method = "post",
+			endpoint = f"{CLASSIC_API_ENDPOINTS.get('printers_by_id')}/0",
+			receive_content_type = "xml",
+			data = payload,
+			warning_callback = warning_callback
+		)
+
+		if response_create_printer is None:
+
+			return {
+				"printer": printer.display_name,
+				"status": "Failed",
+				"details": "Failed to connect to the Jamf Pro Server",
+				"unreachable": True
+			}
+
+		if response_create_printer.status_code == 409:
+
+			log.warning(f"Failed to create printer '{printer.display_name}' due duplicate name")
 
-		##### End Loop
+			return {
+				"printer": printer.display_name,
+				"status": "Duplicate",
+				"details": "Printer name already exists in Jamf Pro"
+			}
+
+		if response_create_printer.status_code != 201:
+
+			log.error(
+				"Failed to create the printer!\n"
+				f"\tPrinter:  {printer.display_name}\n"
+				f"\tStatus Code:  {response_create_printer.status_code}\n"
+				f"\tURI:  {CLASSIC_API_ENDPOINTS.get('printers_by_id')}/0\n"
+				f"\tResponse:  {response_create_printer.text}"
+			)
+
+			return {
+				"printer": printer.display_name,
+				"status": "Failed",
+				"details": f"Status Code:  {response_create_printer.status_code}",
+				"status_code": response_create_printer.status_code
+			}
+
+		# Get the Printer ID of the newly created printer
+		response_create_printer_xml = ElementTree.fromstring(response_create_printer.text)
+
+		return {
+			"printer": printer.display_name,
+			"status": "Created",
+			"id": response_create_printer_xml.find("id").text
+		}
 
 
 	def get_jps_printers(self, progress_callback, finished_callback, warning_callback):
@@ -1213,6 +2073,9 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 		# Create a fail set
 		self.set_of_printers_that_failed_lookup = set()
 
+		# Time the refresh until the first printer is shown and until it completes
+		self.refresh_timing = { "started": time.monotonic(), "first_printer": None }
+
 		# Update Status Bar and Pulse Progress Bar
 		progress_callback.emit({
 			"msg": "Fetching list of all printers in Jamf Pro...",
@@ -1221,24 +2084,28 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 
 		try:
 
-			# GET all printers from the JPS
-			response_get_all_printers = self.jamf_pro_api(
-				api_account = self.jps_privileged_api_account,
-				endpoint = CLASSIC_API_ENDPOINTS.get("printers"),
-				method = "get",
-				receive_content_type = "xml",
-				warning_callback = warning_callback
+			# GET all printers from the JPS; a refresh already in flight is shared
+			response_get_all_printers = self.single_flight.do(
+				CLASSIC_API_ENDPOINTS.get("printers"),
+				partial(
+					self.jamf_pro_api,
+					api_account = self.jps_privileged_api_account,
+					endpoint = CLASSIC_API_ENDPOINTS.get("printers"),
+					method = "get",
+					receive_content_type = self.response_codec.content_type,
+					warning_callback = warning_callback
+				)
 			)
 
 			# Verify response status code
-			if response_get_all_printers.status_code != 200:
+			if response_get_all_printers is None or response_get_all_printers.status_code != 200:
 
 				# Update Status Bar and Pulse Progress Bar
 				warning_callback.emit("ERROR:  Failed to fetch printers from Jamf Pro")
 				log.error(
 					"Failed to get printers!\n"
-					f"\tStatus Code:  {response_get_all_printers.status_code}\n"
-					f"\tResponse:  {response_get_all_printers.text}"
+					f"\tStatus Code:  {getattr(response_get_all_printers, 'status_code', None)}\n"
+					f"\tResponse:  {getattr(response_get_all_printers, 'text', None)}"
 				)
 
 				# Enable Buttons
@@ -1253,51 +2120,82 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 
 			return
 
-		# Extract XML response
-		all_printers = ElementTree.fromstring(response_get_all_printers.text)
+		# Extract the Printer IDs from the response
+		printer_ids = self.response_codec.printer_ids(response_get_all_printers.content)
 
 		# Get the number of printers and create a counter
-		self.total_jps_printers = all_printers.find("size").text
+		self.total_jps_printers = len(printer_ids)
 		self.lookup_count = 0
 
 		# Update Status Bar and Progress Bar
 		progress_callback.emit({
 			"msg": f"Fetching printer details...  [0/{self.total_jps_printers}]",
 			"total": self.total_jps_printers,
-			"count": self.lookup_count
+			"count": self.lookup_count,
+			"loading": self.total_jps_printers
 		})
 
-		# Clear the current list if it exists
-		self.jps_printer_list = []
+		# Printers are shown as soon as they are fetched, replacing the version from the last
+		# refresh.  Printers that no longer exist are only dropped once the refresh completes.
+		self.refreshed_printer_list = []
+		with self.registry_lock:
+			self.refresh_positions = {
+				printer.printer_id: index for index, printer in enumerate(self.jps_printer_list) }
+		token = CancellationToken.current()
 
 		# Loop through each printer
-		for printer in all_printers.findall(".//printer"):
+		for printer_id in printer_ids:
 
 			# Check if the worker should be stopped
-			if self.full_stop:
+			if self.full_stop or token.cancelled:
 				# Re-enable Button
 				self.button_get_printers.setEnabled(True)
 				self.button_get_sites.setEnabled(True)
+				token.check()
 				return
 
-			# Get the Printer ID
-			printer_id = printer.find("id").text
-
 			self.run_get_jps_printer_details(printer_id)
 
 		##### Loop complete
 
-		# Wait here for all printers to be collected
-		self.lock_mutex(True)
+		# Wait here for all printers to be collected or for the refresh to be canceled
+		self.mutex.lock()
 
-		# Update the Printer ComboBox
-		self.populate_printer_combo_box()
+		while self.lookup_count < self.total_jps_printers and not token.cancelled:
+			self.condition.wait(self.mutex, 100)
+
+		self.mutex.unlock()
+
+		if token.cancelled:
+
+			# Re-enable Button
+			self.button_get_printers.setEnabled(True)
+			self.button_get_sites.setEnabled(True)
+			token.check()
+
+		with self.registry_lock:
+			self.jps_printer_list = self.refreshed_printer_list
+			self.jps_printers_changed = True
 
 		# Clear the fail list set
 		self.set_of_printers_that_failed_lookup.clear()
 
+		# Report on API activity
+		self.log_api_metrics()
+
+		# Report how long it took until the first printer was shown and until all were fetched
+		completed = time.monotonic() - self.refresh_timing.get("started")
+		first_printer = self.refresh_timing.get("first_printer")
+		log.info(
+			f"Fetched {self.total_jps_printers} printers in {completed:.2f}s; the first printer "
+			+ (f"was shown after {first_printer:.2f}s" if first_printer is not None
+				else "for the selected Site was never shown")
+		)
+		self.refresh_timing = None
+
 		# Update Status Bar and Progress Bar
-		finished_callback.emit("Fetching printer details...  [COMPLETE]")
+		finished_callback.emit(
+			f"Fetching printer details...  [COMPLETE in {completed:.1f}s]")
 
 		# Enable Buttons
 		self.button_get_printers.setEnabled(True)
@@ -1317,35 +2215,23 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 		"""
 
 		# Check if the worker should be stopped
-		if self.full_stop:
+		if self.full_stop or CancellationToken.current().cancelled:
 			return
 
 		try:
 
 			# GET printer details from the JPS
-			response_get_printer = self.jamf_pro_api(
-				api_account = self.jps_privileged_api_account,
-				method = "get",
-				endpoint = f"{CLASSIC_API_ENDPOINTS.get('printers_by_id')}/{printer_id}",
-				receive_content_type = "xml",
-				warning_callback = warning_callback
-			)
+			printer_object = self.fetch_jps_printer(printer_id, warning_callback)
 
-		except Exception:
-
-			# Increment counter
-			self.lookup_count = self.lookup_count + 1
-
-			# Wait until all printers details have been fetched
-			if int(self.lookup_count) == int(self.total_jps_printers):
+		except OperationCancelled:
+			return
 
-				# Wake Up
-				self.condition.wakeAll()
+		except Exception:
 
+			self.count_printer_lookup()
 			return
 
-		# Verify response status code
-		if response_get_printer.status_code != 200:
+		if printer_object is None:
 
 			# Attempt to retry getting the printer again
 			if printer_id not in self.set_of_printers_that_failed_lookup:
@@ -1354,7 +2240,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 				self.set_of_printers_that_failed_lookup.add(printer_id)
 
 				# Attempt to query the printer again
-				self.worker_thread(partial(self.get_jps_printer_details, printer_id=printer_id))
+				self.run_get_jps_printer_details(printer_id)
 
 				# Started a new thread for this printer_id; stopping this thread here
 
@@ -1369,85 +2255,112 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 					"total": self.total_jps_printers,
 					"count": self.lookup_count
 				})
-				log.warning(
-					"Failed to get a printer from Jamf Pro!\n"
-					f"\tStatus Code:  {response_get_printer.status_code}"
-					f"\tResponse:  {response_get_printer.text}"
-				)
-
-			return
-
-		# Extract XML response
-		printer_details = ElementTree.fromstring(response_get_printer.text)
 
-		# Doing some hackery to get custom details
-		try:
-			embedded_json = json.loads(printer_details.find("notes").text)
-		except Exception:
-			embedded_json = {}
+				# Give up on this printer so the refresh can finish
+				self.count_printer_lookup()
 
-		site = embedded_json.get("Site", "unassigned")
-		created = embedded_json.get("Created", "unknown")
-		created_by = embedded_json.get("Created_by", "unknown")
-		updated = embedded_json.get("Updated", "unknown")
-		updated_by = embedded_json.get("Updated_by", "unknown")
-
-		# log.debug(
-		# 	f"Config details for Printer ID {printer_id}:"
-		# 	f"\tID:  {printer_details.find('id').text}\n"
-		# 	f"\tDisplay Name:  {printer_details.find('name').text}\n"
-		# 	f"\tCUPS Name:  {printer_details.find('CUPS_name').text}\n"
-		# 	f"\tLocation:  {printer_details.find('location').text}\n"
-		# 	f"\tDevice URI:  {printer_details.find('uri').text}\n"
-		# 	f"\tModel:  {printer_details.find('model').text}\n"
-		# 	f"\tNotes:  {printer_details.find('notes').text}\n"
-		# 	f"\tSite:  {site}\n"
-		# 	f"\tCreated:  {created}\n"
-		# 	f"\tCreated By:  {created_by}\n"
-		# 	f"\tUpdated:  {updated}\n"
-		# 	f"\tUpdated By:  {updated_by}"
-		# )
+			return
 
 		# If the Printer's "assigned Site" is in the list of Sites the
 		# Site Admin has Enroll Permissions to, add it to a list.
-		if site in self.site_names:
-
-			# Create Printer Object
-			printer_object = Printer(
-				printer_id = printer_details.find("id").text,
-				display_name = printer_details.find("name").text,
-				cups_name = printer_details.find("CUPS_name").text,
-				location = printer_details.find("location").text,
-				device_uri = printer_details.find("uri").text,
-				model = printer_details.find("model").text,
-				ppd_path = printer_details.find("ppd").text,
-				ppd_contents = printer_details.find("ppd_contents").text,
-				site = site,
-				created = created,
-				created_by = created_by,
-				updated = updated,
-				updated_by = updated_by
-			)
+		if printer_object.site in self.site_names:
 
 			# Add printer to list
-			self.jps_printer_list.append(printer_object)
+			self.show_jps_printer(printer_object)
 
-		# Increment counter
-		self.lookup_count = self.lookup_count + 1
+		lookup_count = self.count_printer_lookup()
 
 		# Update Status Bar and Progress Bar
 		progress_callback.emit({
-			"msg": f"Fetching printer details...  [{self.lookup_count}/{self.total_jps_printers}]",
+			"msg": f"Fetching printer details...  [{lookup_count}/{self.total_jps_printers}]",
 			"total": self.total_jps_printers,
-			"count": self.lookup_count
+			"count": lookup_count,
+			"loading": self.total_jps_printers - lookup_count
 		})
 
+
+	def show_jps_printer(self, printer_object):
+		"""
+		Helper function to add a printer fetched by a refresh to the list of printers and show
+		it right away, replacing the version from the last refresh
+
+		Args:
+			printer_object (Printer): The fetched printer
+		"""
+
+		with self.registry_lock:
+
+			self.refreshed_printer_list.append(printer_object)
+			index = self.refresh_positions.get(printer_object.printer_id)
+
+			# The list may have shifted if a printer was deleted during the refresh
+			if index is not None and (
+				index >= len(self.jps_printer_list)
+				or self.jps_printer_list[index].printer_id != printer_object.printer_id
+			):
+				index = next(
+					(
+						position for position, printer in enumerate(self.jps_printer_list)
+						if printer.printer_id == printer_object.printer_id
+					),
+					None
+				)
+
+			if index is None:
+				self.refresh_positions[printer_object.printer_id] = len(self.jps_printer_list)
+				self.jps_printer_list.append(printer_object)
+
+			else:
+				self.jps_printer_list[index] = printer_object
+
+		self.jps_printer_model.enqueue([ printer_object ])
+
+
+	def jps_printers_shown(self, printers):
+		"""
+		Callback function for printers added to the JPS printer list; records when a refresh
+		first shows a printer and makes the list usable while the refresh continues
+
+		Args:
+			printers (list): Printer objects that were added or replaced
+		"""
+
+		timing = self.refresh_timing
+
+		if (
+			timing and timing.get("first_printer") is None
+			and any(self.jps_printer_proxy.accepts(printer) for printer in printers)
+		):
+			timing["first_printer"] = time.monotonic() - timing.get("started")
+			log.debug(f"First printer shown after {timing.get('first_printer'):.2f}s")
+
+		self.combo_printers.setEnabled(True)
+		self.button_handler()
+
+
+	def count_printer_lookup(self):
+		"""
+		Helper function to count a finished printer lookup and wake the refresh once every
+		printer has been looked up
+
+		Returns:
+			int: Number of printers looked up so far
+		"""
+
+		self.mutex.lock()
+		self.lookup_count = self.lookup_count + 1
+		lookup_count = self.lookup_count
+
 		# Wait until all printers details have been fetched
-		if int(self.lookup_count) == int(self.total_jps_printers):
+		if int(lookup_count) == int(self.total_jps_printers):
 
 			# Wake Up
 			self.condition.wakeAll()
 
+		self.mutex.unlock()
+
+		return lookup_count
+
 
 	def clicked_update_printer(self, progress_callback, finished_callback, warning_callback):
 		"""
@@ -1491,7 +2404,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 		# Will need a couple details from the existing printer configuration
 		jps_printer = [
 			printer
-			for printer in self.jps_printer_list
+			for printer in self.jps_printers()
 			if selected_jps_printer == printer.display_name
 		]
 
@@ -1513,48 +2426,69 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 			# Ensure that the display names match on both printer objects
 			if local_printer.display_name == jps_printer.display_name:
 
-				# Build the printer payload xml
-				payload = self.build_printer_xml_payload(
-					id = jps_printer.printer_id,
-					display_name = local_printer.display_name,
-					device_uri = local_printer.device_uri,
-					cups_name = local_printer.cups_name,
-					location = local_printer.location,
-					model = local_printer.model,
-					ppd_contents = local_printer.ppd_contents,
-					ppd_path = local_printer.ppd_path,
-					site = selected_site,
-					created = jps_printer.created,
-					created_by = jps_printer.created_by,
-					updated = get_timestamp(),
-					updated_by = self.site_admin_account.get("username")
-				)
+				# Determine what would change
+				changes = local_printer.differences(jps_printer)
 
-				# PUT to update a new printer in the JPS.
-				response_update_printer = self.jamf_pro_api(
-					api_account = self.jps_privileged_api_account,
-					method = "put",
-					endpoint = (
-						f"{CLASSIC_API_ENDPOINTS.get('printers_by_id')}/{jps_printer.printer_id}"
+				if jps_printer.site != selected_site:
+					changes["site"] = (jps_printer.site, selected_site)
+
+				if not changes:
+
+					# Update Status Bar and Progress Bar
+					finished_callback.emit(
+						f"[{selected_jps_printer}] is already up to date in Jamf Pro")
+					log.info(f"Skipped updating '{selected_jps_printer}', nothing has changed")
+
+					return
+
+				include_ppd = Printer.requires_ppd(changes)
+
+				# Preview the changes
+				if not self.confirm(
+					(
+						f"Update [{selected_jps_printer}] in Jamf Pro?"
+						if include_ppd else
+						f"Only the metadata of [{selected_jps_printer}] has changed.  "
+						"Update it in Jamf Pro?  The PPD will not be uploaded."
 					),
-					send_content_type = "xml",
-					data = payload.encode("utf-8"),
-					warning_callback = warning_callback
+					describe_changes(changes)
+				):
+
+					# Update Status Bar and Progress Bar
+					finished_callback.emit(f"Updating [{selected_jps_printer}]...  [CANCELED]")
+
+					return
+
+				# Update Status Bar and Pulse Progress Bar
+				progress_callback.emit({
+					"msg": (
+						f"Updating [{selected_jps_printer}] in Jamf Pro..."
+						if include_ppd else
+						f"Updating the metadata of [{selected_jps_printer}] in Jamf Pro..."
+					),
+					"pb_type": "Pulse"
+				})
+
+				result = self.queue_if_offline(
+					journal_step("update", local_printer, selected_site, jps_printer),
+					self.update_jps_printer(
+						local_printer, jps_printer, selected_site, warning_callback, changes)
 				)
 
-				if response_update_printer.status_code != 201:
+				if result.get("status") == "Queued":
+
+					# Update Status Bar and Progress Bar
+					finished_callback.emit(
+						f"Jamf Pro is unreachable; queued the update of [{selected_jps_printer}]")
+
+				elif result.get("status") != "Updated":
 
 					# Update Status Bar and Pulse Progress Bar
 					warning_callback.emit(
 						f"ERROR:  Failed to update [{selected_jps_printer}] in Jamf Pro")
-					log.error("Failed to update the printer!\n"
-						f"\tStatus Code:  {response_update_printer.status_code}\n"
-						f"\tURI:  '{CLASSIC_API_ENDPOINTS.get('printers_by_id')}"
-						f"/{jps_printer.printer_id}'\n"
-						f"\tResponse:  {response_update_printer.text}"
-					)
 
 				else:
+
 					# Update Status Bar and Progress Bar
 					finished_callback.emit(
 						f"Updating [{selected_jps_printer}] in Jamf Pro...  [COMPLETE]")
@@ -1573,778 +2507,6038 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 			log.warning("There was an issue identifying which printer(s) are selected.")
 
 
-	def clicked_delete_printer(self, progress_callback, finished_callback, warning_callback):
+	def update_jps_printer(self, local_printer, jps_printer, site, warning_callback, changes=None):
 		"""
-		Handles the "Delete Printer" in JPS button click.
+		Helper function that updates a printer in Jamf Pro with a local printer's configuration.
+
+		Only changed values are sent; the PPD is left out when it has not changed.
 
 		Args:
-			progress_callback:  A callback function to update the progress and status bars
-			finished_callback:  A callback function to update the progress and status bars
+			local_printer:  Printer object with the desired configuration (Printer)
+			jps_printer:  Printer object of the printer in Jamf Pro (Printer)
+			site:  Site to assign the printer to (str)
 			warning_callback:  A callback function to update the progress and status bars
+			changes:  Precomputed differences between the printers (dict)
+		Returns:
+			dict of the printer's name, the "status" of the request, and its "details"
 		"""
 
-		# Disable Buttons
-		self.button_delete_printer.setEnabled(False)
-		self.button_update_printer.setEnabled(False)
+		if changes is None:
 
-		selected_jps_printer = self.selected_combo_box_value(self.combo_printers)
-		log.info(f"Selected printer to DELETE:  '{selected_jps_printer}'")
+			changes = local_printer.differences(jps_printer)
 
-		# Update Status Bar and Pulse Progress Bar
-		progress_callback.emit({
-			"msg": f"Deleting [{selected_jps_printer}] in Jamf Pro...",
-			"pb_type": "Pulse"
-		})
+			if jps_printer.site != site:
+				changes["site"] = (jps_printer.site, site)
 
-		# Will need a couple details from the existing printer configuration
-		jps_printer = [
-			printer
-			for printer in self.jps_printer_list
-			if selected_jps_printer == printer.display_name
-		]
+		if not changes:
 
-		# Ensure only one matching object was found
-		if len(jps_printer) == 1:
+			return {
+				"printer": jps_printer.display_name,
+				"status": "Unchanged",
+				"details": "Already up to date"
+			}
 
-			# Pull object out of its list
-			jps_printer = jps_printer[0]
+		include_ppd = Printer.requires_ppd(changes)
 
-			# Delete printer in the JPS.
-			response_delete_printer = self.jamf_pro_api(
-				api_account = self.jps_privileged_api_account,
-				method = "delete",
-				endpoint = (
-					f"{CLASSIC_API_ENDPOINTS.get('printers_by_id')}/{jps_printer.printer_id}"
-				),
-				warning_callback = warning_callback
-			)
+		# Build the printer payload xml
+		payload = self.build_printer_xml_payload(
+			include_ppd = include_ppd,
+			id = jps_printer.printer_id,
+			display_name = local_printer.display_name,
+			device_uri = local_printer.device_uri,
+			cups_name = local_printer.cups_name,
+			location = local_printer.location,
+			model = local_printer.model,
+			ppd_contents = local_printer.ppd_contents,
+			ppd_path = local_printer.ppd_path,
+			site = site,
+			created = jps_printer.created,
+			created_by = jps_printer.created_by,
+			updated = get_timestamp(datetime.now()),
+			updated_by = self.site_admin_account.get("username")
+		)
 
-			if response_delete_printer.status_code != 200:
+		# PUT to update a new printer in the JPS.
+		response_update_printer = self.jamf_pro_api(
+			api_account = self.jps_privileged_api_account,
+			method = "put",
+			endpoint = f"{CLASSIC_API_ENDPOINTS.get('printers_by_id')}/{jps_printer.printer_id}",
+			send_content_type = "xml",
+			data = payload,
+			warning_callback = warning_callback
+		)
 
-				# Update Status Bar and Pulse Progress Bar
-				warning_callback.emit(
-					f"ERROR:  Failed to delete [{selected_jps_printer}] in Jamf Pro")
-				log.error(
-					"Failed to delete the printer!\n"
-					f"\tStatus Code:  {response_delete_printer.status_code}\n"
-					f"\tURI:  '{CLASSIC_API_ENDPOINTS.get('printers_by_id')}"
-					f"/{jps_printer.printer_id}'\n"
-					f"\tResponse:  {response_delete_printer.text}"
-				)
+		if response_update_printer is None or response_update_printer.status_code != 201:
 
-			else:
+			log.error("Failed to update the printer!\n"
+				f"\tPrinter:  {jps_printer.display_name}\n"
+				f"\tStatus Code:  {getattr(response_update_printer, 'status_code', None)}\n"
+				f"\tURI:  '{CLASSIC_API_ENDPOINTS.get('printers_by_id')}"
+				f"/{jps_printer.printer_id}'\n"
+				f"\tResponse:  {getattr(response_update_printer, 'text', None)}"
+			)
 
-				# Remove printer from the list
-				self.jps_printer_list.remove(jps_printer)
+			return {
+				"printer": jps_printer.display_name,
+				"status": "Failed",
+				"details": (
+					f"Status Code:  {response_update_printer.status_code}"
+					if response_update_printer is not None else
+					"Failed to connect to the Jamf Pro Server"
+				),
+				"status_code": getattr(response_update_printer, "status_code", None),
+				"unreachable": response_update_printer is None
+			}
 
-				# Update Status Bar and Progress Bar
-				finished_callback.emit(
-					f"Delete [{selected_jps_printer}] in Jamf Pro...  [COMPLETE]")
+		# Keep the JPS printer in sync with what was sent
+		with self.registry_lock:
 
-		else:
+			for field in changes.keys() - { "site" }:
+				setattr(jps_printer, field, getattr(local_printer, field))
 
-			# Update Status Bar and Pulse Progress Bar
-			warning_callback.emit("There was a problem identifying the printer.")
+			jps_printer.site = site
+			jps_printer.updated = get_timestamp(datetime.now())
+			jps_printer.updated_by = self.site_admin_account.get("username")
+			self.jps_printers_changed = True
 
+		return {
+			"printer": jps_printer.display_name,
+			"status": "Updated",
+			"details": describe_changes(changes).replace("\n", ";  ")
+		}
 
-	################################################################################################
-	# Main Helpers
 
-	def jamf_pro_url(self):
+	def clicked_reconcile_printers(self, progress_callback, finished_callback, warning_callback):
 		"""
-		Helper function to return the Jamf Pro URL the device is enrolled with
+		Handles the "Reconcile Site with Local Printers" action.
+
+		Every local printer is matched to its JPS counterpart in the selected Site; printers
+		missing from Jamf Pro are created and drifted printers are updated concurrently after
+		the admin reviews the plan.  The run is journaled so it can be resumed if interrupted.
+
+		Args:
+			progress_callback:  A callback function to update the progress and status bars
+			finished_callback:  A callback function to update the progress and status bars
+			warning_callback:  A callback function to update the progress and status bars
 		"""
 
-		# Define Variables
-		jamf_plist = "/Library/Preferences/com.jamfsoftware.jamf.plist"
+		selected_site = self.selected_combo_box_value(self.combo_sites)
 
-		# Get the systems' Jamf Pro Server
-		if os.path.exists(jamf_plist):
+		if selected_site is None or not self.local_printer_list:
 
-			with open(jamf_plist, "rb") as jamf_plist:
+			# Update Status Bar and Progress Bar
+			finished_callback.emit("You must select a Site and have local printers to reconcile.")
+			return
 
-				jamf_plist_contents = plistlib.load(jamf_plist)
-				self.jps_url = jamf_plist_contents.get("jss_url")
-				log.debug(f"Jamf Pro Server URL:  {self.jps_url}")
+		# Update Status Bar and Pulse Progress Bar
+		progress_callback.emit({
+			"msg": f"Comparing local printers to [{selected_site}]...",
+			"pb_type": "Pulse"
+		})
 
-		else:
-			log.error("Missing the Jamf Pro configuration file!")
-			sys.exit(1)
+		plan = reconcile_printers(self.local_printer_list, self.jps_printers(), selected_site)
 
+		# Summarize the plan for the dry-run preview
+		summary = {}
 
-	def jamf_pro_api(self, api_account: dict, method: str, endpoint: str,
-		receive_content_type: str = "json", send_content_type = "xml",
-		data: Union[str, dict, None] = None, **kwargs):
-		"""Helper function to interact with the Jamf Pro API(s).
+		for item in plan:
+			summary.setdefault(item.get("status"), []).append(item)
 
-		Args:
-			api_account (dict): Dict contain the username and password to use
-				when interacting with the Jamf Pro API.
-			method (str): HTTP Method that should be used.
-			endpoint (str): The API's endpoint URL
-			receive_content_type (str, optional): The content type to request the API to
-				respond with. Defaults to "json".
-			send_content_type (str, optional): The content type that will be sent to the API.
-				Defaults to "xml".
-			data (str | dict | None, optional): A data payload that will be sent to the API.
-				Defaults to None.
+		details = []
 
-		Returns:
-			requests.response: A request.response object
-		"""
+		for status in ("Missing", "Drifted", "Conflict", "Identical"):
+			for item in summary.get(status, []):
+				details.append(f"[{status}]  {item.get('printer').display_name}")
 
-		warning_callback = kwargs.get("warning_callback")
+				if item.get("changes"):
+					changes = describe_changes(item.get("changes"))
+					details.extend(f"    {line}" for line in changes.split("\n"))
 
-		if (
-			not api_account.get("api_token") or
-			self.is_token_expired(api_account.get("api_token_expires"))
-		):
-			api_account |= self.get_token(
-				api_account.get("username"),
-				api_account.get("password")
-			)
+				elif item.get("details"):
+					details.append(f"    {item.get('details')}")
+
+		actions = summary.get("Missing", []) + summary.get("Drifted", [])
+
+		if not actions:
+
+			# Update Status Bar and Progress Bar
+			finished_callback.emit(f"[{selected_site}] is already in sync with the local printers")
+			return
+
+		if not self.confirm(
+			(
+				f"Reconcile [{selected_site}]?\n\n"
+				f"Create:  {len(summary.get('Missing', []))}\n"
+				f"Update:  {len(summary.get('Drifted', []))}\n"
+				f"Identical:  {len(summary.get('Identical', []))}\n"
+				f"Conflicts (skipped):  {len(summary.get('Conflict', []))}"
+			),
+			"\n".join(details)
+		):
+
+			# Update Status Bar and Progress Bar
+			finished_callback.emit(f"Reconciling [{selected_site}]...  [CANCELED]")
+			return
+
+		journal = OperationJournal.start(
+			self.state_path("reconcile", selected_site), f"Reconcile {selected_site}")
+		journal.plan([
+			journal_step(
+				"create" if item.get("status") == "Missing" else "update",
+				item.get("printer"),
+				selected_site,
+				item.get("jps_printer")
+			)
+			for item in actions
+		])
+
+		results = self.run_journaled(
+			journal,
+			warning_callback,
+			progress_callback = progress_callback,
+			message = f"Reconciling [{selected_site}]..."
+		)
+
+		# Look up the created printers in one pass so they can be added to the list
+		if created_ids := [
+			result.get("id") for result in results if result.get("status") == "Created"
+		]:
+
+			new_printers = self.run_concurrently(
+				partial(self.fetch_jps_printer, warning_callback = warning_callback),
+				created_ids,
+				progress_callback = progress_callback,
+				message = "Fetching the created printers..."
+			)
+
+			self.add_jps_printers(new_printers)
+
+		# Display the outcome of each printer
+		self.displayResults.result.emit({
+			"title": f"Reconcile {selected_site}",
+			"results": results + [
+				{
+					"printer": item.get("printer").display_name,
+					"status": item.get("status"),
+					"details": item.get("details", "")
+				}
+				for item in summary.get("Conflict", []) + summary.get("Identical", [])
+			]
+		})
+
+		failed = sum(result.get("status") == "Failed" for result in results)
+
+		# Update Status Bar and Progress Bar
+		finished_callback.emit(
+			f"Reconciling [{selected_site}]...  [{len(results) - failed}/{len(results)} COMPLETE]")
+
+
+	def clicked_drift_report(self, progress_callback, finished_callback, warning_callback):
+		"""
+		Handles the "Drift Report" action.
+
+		Compares the local printers to the JPS printers in the selected Site, or all of the
+		admin's Sites when one is not selected.
+
+		Args:
+			progress_callback:  A callback function to update the progress and status bars
+			finished_callback:  A callback function to update the progress and status bars
+			warning_callback:  A callback function to update the progress and status bars
+		"""
+
+		selected_site = self.selected_combo_box_value(self.combo_sites)
+
+		if not self.jps_printer_list:
+
+			# Update Status Bar and Progress Bar
+			finished_callback.emit("Get the printers from Jamf Pro before running a drift report.")
+			return
+
+		# Update Status Bar and Pulse Progress Bar
+		progress_callback.emit({ "msg": "Comparing printers...", "pb_type": "Pulse" })
+
+		report = drift_report(
+			self.local_printer_list,
+			[
+				printer
+				for printer in self.jps_printers()
+				if selected_site is None or printer.site == selected_site
+			]
+		)
+
+		# Display the report
+		self.displayResults.result.emit({
+			"title": f"Drift Report - {selected_site or 'All Sites'}",
+			"results": report
+		})
+
+		drifted = sum(row.get("status") != "Identical" for row in report)
+
+		# Update Status Bar and Progress Bar
+		finished_callback.emit(f"Comparing printers...  [{drifted}/{len(report)} DIFFER]")
+
+
+	def clicked_driver_query(
+			self, progress_callback, finished_callback, warning_callback, driver, version_below):
+		"""
+		Handles the "Find Printers by Driver" action.
+
+		Searches the PPDs of the local printers and of the JPS printers that have been fetched.
+
+		Args:
+			progress_callback:  A callback function to update the progress and status bars
+			finished_callback:  A callback function to update the progress and status bars
+			warning_callback:  A callback function to update the progress and status bars
+			driver:  Wildcard pattern to match drivers against (str)
+			version_below:  Only include PPDs with a lower version, if provided (str | None)
+		"""
+
+		# Update Status Bar and Pulse Progress Bar
+		progress_callback.emit({ "msg": "Indexing PPDs...", "pb_type": "Pulse" })
+
+		self.index_ppds(progress_callback)
+		results = self.ppd_index.query(driver, version_below)
+
+		# Display the results
+		self.displayResults.result.emit({
+			"title": f"Printers Using {driver}"
+				+ (f" Older Than {version_below}" if version_below else ""),
+			"results": results
+		})
+
+		# Update Status Bar and Progress Bar
+		finished_callback.emit(f"Indexing PPDs...  [{len(results)} PRINTERS MATCHED]")
+
+
+	def index_ppds(self, progress_callback = None):
+		"""
+		Helper function to index the PPDs of the local and JPS printers; PPDs that were
+		already indexed are not parsed again
+
+		Args:
+			progress_callback:  A callback function to update the progress and status bars
+		"""
+
+		with self.registry_lock:
+			inventories = {
+				"Local": list(self.local_printer_list),
+				"Jamf Pro": list(self.jps_printer_list)
+			}
+
+		parsed = self.ppd_index.update(
+			inventories,
+			lambda function, items: self.run_concurrently(
+				function, items, progress_callback, "Parsing PPDs...")
+		)
+
+		log.info(f"Indexed {len(self.ppd_index.metadata)} unique PPDs ({parsed} parsed)")
+
+
+	def clicked_find_conflicts(self, progress_callback, finished_callback, warning_callback):
+		"""
+		Handles the "Find Duplicate Printers" action.
+
+		Looks for duplicates among the JPS printers in every Site that has been fetched.
+
+		Args:
+			progress_callback:  A callback function to update the progress and status bars
+			finished_callback:  A callback function to update the progress and status bars
+			warning_callback:  A callback function to update the progress and status bars
+		"""
+
+		if not self.jps_printer_list:
+
+			# Update Status Bar and Progress Bar
+			finished_callback.emit("Get the printers from Jamf Pro before looking for duplicates.")
+			return
+
+		# Update Status Bar and Pulse Progress Bar
+		progress_callback.emit({ "msg": "Looking for duplicate printers...", "pb_type": "Pulse" })
+
+		with self.registry_lock:
+			conflicts = find_conflicts(list(self.jps_printer_list))
+
+		# Display the results
+		self.displayResults.result.emit({ "title": "Duplicate Printers", "results": conflicts })
+
+		# Update Status Bar and Progress Bar
+		finished_callback.emit(
+			f"Looking for duplicate printers...  [{len(conflicts)} PRINTERS IN CONFLICT]")
+
+
+	def clicked_install_printers(
+			self, progress_callback, finished_callback, warning_callback, site, name_filter):
+		"""
+		Handles the "Install Printers Locally" action.
+
+		Installs JPS printers on this Mac with lpadmin, using the PPD stored in Jamf Pro.
+		Several printers are installed at once, up to the bulk worker limit.
+
+		Args:
+			progress_callback:  A callback function to update the progress and status bars
+			finished_callback:  A callback function to update the progress and status bars
+			warning_callback:  A callback function to update the progress and status bars
+			site:  Site to install printers from (str)
+			name_filter:  Only install printers whose name matches this wildcard pattern (str)
+		"""
+
+		with self.registry_lock:
+			printers = [
+				printer
+				for printer in self.jps_printer_list
+				if printer.site == site and fnmatch.fnmatchcase(printer.display_name, name_filter)
+			]
+
+		if not printers:
+
+			# Update Status Bar and Progress Bar
+			finished_callback.emit(f"No printers in [{site}] match [{name_filter}]")
+			return
+
+		if not self.confirm(
+			f"Install {len(printers)} printer(s) from [{site}] on this Mac?",
+			"\n".join(sorted(printer.display_name for printer in printers))
+		):
+
+			# Update Status Bar and Progress Bar
+			finished_callback.emit("Installing printers...  [CANCELED]")
+			return
+
+		installed_count = 0
+
+		def count_install(result):
+
+			nonlocal installed_count
+			installed_count += 1
+
+			# Update Status Bar and Progress Bar
+			progress_callback.emit({
+				"msg": f"Installing printers...  [{installed_count}/{len(printers)}]",
+				"total": len(printers),
+				"count": installed_count
+			})
+
+		results = self.lpadmin_installer.install(
+			printers, CancellationToken.current(), count_install)
+
+		installed = sum(result.get("status") == "Installed" for result in results)
+
+		# Display the outcome of each printer
+		self.displayResults.result.emit(
+			{ "title": f"Install Printers from {site}", "results": results })
+
+		# Update Status Bar and Progress Bar
+		finished_callback.emit(
+			f"Installing printers...  [{installed}/{len(results)} INSTALLED]")
+
+
+	def clicked_probe_printers(self, progress_callback, finished_callback, warning_callback):
+		"""
+		Handles the "Check Printer Connectivity" action.
+
+		Connects to the device URI of each JPS printer in the selected Site, or all of the
+		admin's Sites when one is not selected.
+
+		Args:
+			progress_callback:  A callback function to update the progress and status bars
+			finished_callback:  A callback function to update the progress and status bars
+			warning_callback:  A callback function to update the progress and status bars
+		"""
+
+		selected_site = self.selected_combo_box_value(self.combo_sites)
+
+		with self.registry_lock:
+			printers = [
+				printer
+				for printer in self.jps_printer_list
+				if selected_site is None or printer.site == selected_site
+			]
+
+		if not printers:
+
+			# Update Status Bar and Progress Bar
+			finished_callback.emit("Get the printers from Jamf Pro before checking connectivity.")
+			return
+
+		# Update Status Bar and Pulse Progress Bar
+		progress_callback.emit({ "msg": "Checking printer connectivity...", "pb_type": "Pulse" })
+
+		probes = self.uri_prober.probe(
+			[ printer.device_uri for printer in printers ], CancellationToken.current())
+
+		results = []
+
+		for printer in printers:
+
+			probe = probes.get(printer.device_uri)
+			results.append({
+				"printer": printer.display_name,
+				"status": probe.get("status"),
+				"details": probe.get("details"),
+				"id": printer.printer_id,
+				"site": printer.site,
+				"device_uri": printer.device_uri,
+				"latency_ms": probe.get("latency_ms")
+			})
+
+		# Display the results
+		self.displayResults.result.emit({
+			"title": f"Printer Connectivity - {selected_site or 'All Sites'}",
+			"results": results
+		})
+
+		unreachable = sum(result.get("status") == "Unreachable" for result in results)
+
+		# Update Status Bar and Progress Bar
+		finished_callback.emit(
+			f"Checking printer connectivity...  [{unreachable}/{len(results)} UNREACHABLE]")
+
+
+	def authorize_sites(self, sites, console):
+		"""
+		Limits the Sites requested on the command line to those the Site Admin is authorized
+		for.  The Site Admin's credentials are prompted for on the console.
+
+		Args:
+			sites:  Sites requested (list)
+			console:  A ConsoleCallback
+		Returns:
+			set of the requested Sites the Site Admin is authorized for, or None if the Site
+			Admin could not be authenticated
+		"""
+
+		if not sites:
+			return set()
+
+		self.site_admin_account = {
+			"username": input("Site Admin username:  ").strip(),
+			"password": getpass.getpass("Site Admin password:  ")
+		}
+
+		if (authorized := self.resolve_site_access(console)) is None:
+			return None
+
+		for site in sorted(set(sites) - authorized):
+			log.warning(f"Skipping Site '{site}'; the Site Admin is not authorized for it")
+
+		return set(sites) & authorized
+
+
+	def export_conflict_report(self, report_file, sites):
+		"""
+		Collects the JPS printers and saves the duplicates among them without the GUI.
+
+		Args:
+			report_file:  Path to save the report to (str)
+			sites:  Sites to include (list)
+		Returns:
+			An exit code as an int
+		"""
+
+		console = ConsoleCallback()
+
+		if not (site_names := self.authorize_sites(sites, console)):
+			log.error("None of the requested Sites are authorized")
+			return 1
+
+		self.site_names = site_names
+
+		self.get_jps_printers(console, console, console)
+
+		try:
+			write_report(find_conflicts(self.jps_printers()), report_file)
+		except OSError:
+			log.error(f"Failed to save the duplicates report to:  {report_file}")
+			return 1
+
+		log.info(f"Duplicates report saved to:  {report_file}")
+
+		return 0
+
+
+	def export_driver_report(self, report_file, sites, driver, version_below):
+		"""
+		Collects the local and JPS printers and saves the printers using a driver without
+		the GUI.
+
+		Args:
+			report_file:  Path to save the report to (str)
+			sites:  Sites to include (list)
+			driver:  Wildcard pattern to match drivers against (str)
+			version_below:  Only include PPDs with a lower version, if provided (str | None)
+		Returns:
+			An exit code as an int
+		"""
+
+		console = ConsoleCallback()
+
+		if (site_names := self.authorize_sites(sites, console)) is None or sites and not site_names:
+			log.error("None of the requested Sites are authorized")
+			return 1
+
+		self.site_names = site_names
+
+		self.get_local_printers(console, console, console)
+
+		if site_names:
+			self.get_jps_printers(console, console, console)
+
+		self.index_ppds()
+
+		try:
+			write_report(self.ppd_index.query(driver, version_below), report_file)
+		except OSError:
+			log.error(f"Failed to save the driver report to:  {report_file}")
+			return 1
+
+		log.info(f"Driver report saved to:  {report_file}")
+
+		return 0
+
+
+	def export_drift_report(self, report_file, sites):
+		"""
+		Collects the local and JPS printers and saves a drift report without the GUI.
+
+		Args:
+			report_file:  Path to save the report to (str)
+			sites:  Sites to compare (list)
+		Returns:
+			An exit code as an int
+		"""
+
+		console = ConsoleCallback()
+
+		if not (site_names := self.authorize_sites(sites, console)):
+			log.error("None of the requested Sites are authorized")
+			return 1
+
+		self.site_names = site_names
+
+		self.get_local_printers(console, console, console)
+		self.get_jps_printers(console, console, console)
+
+		try:
+			write_report(drift_report(self.local_printer_list, self.jps_printers()), report_file)
+		except OSError:
+			log.error(f"Failed to save the drift report to:  {report_file}")
+			return 1
+
+		log.info(f"Drift report saved to:  {report_file}")
+
+		return 0
+
+
+	def clicked_retag_printers(self, progress_callback, finished_callback, warning_callback,
+		source_site, destination_site, name_filter):
+		"""
+		Handles the "Move Printers to Another Site" action.
+
+		Only the notes of each printer are sent, so PPDs are not uploaded again.  The run is
+		journaled so an interrupted move skips the printers that were already moved.
+
+		Args:
+			progress_callback:  A callback function to update the progress and status bars
+			finished_callback:  A callback function to update the progress and status bars
+			warning_callback:  A callback function to update the progress and status bars
+			source_site:  Site to move printers from (str)
+			destination_site:  Site to move printers to (str)
+			name_filter:  Only move printers whose name matches this wildcard pattern (str)
+		"""
+
+		printers = [
+			printer
+			for printer in self.jps_printers()
+			if printer.site == source_site
+			and fnmatch.fnmatchcase(printer.display_name, name_filter)
+		]
+
+		if not printers:
+
+			# Update Status Bar and Progress Bar
+			finished_callback.emit(f"No printers in [{source_site}] match '{name_filter}'")
+			return
+
+		journal = OperationJournal.start(
+			self.state_path("retag", source_site, destination_site, name_filter),
+			f"Move printers from {source_site} to {destination_site}"
+		)
+		journal.plan([ journal_step("retag", printer, destination_site) for printer in printers ])
+		pending = journal.pending()
+
+		if not self.confirm(
+			f"Move {len(pending)} printer(s) from [{source_site}] to [{destination_site}]?",
+			"\n".join(sorted(step.get("printer") for step in pending))
+		):
+
+			# Update Status Bar and Progress Bar
+			finished_callback.emit("Moving printers...  [CANCELED]")
+			return
+
+		results = self.run_journaled(
+			journal,
+			warning_callback,
+			progress_callback = progress_callback,
+			message = f"Moving printers to [{destination_site}]..."
+		)
+
+		moved = sum(result.get("status") == "Moved" for result in results)
+
+		# Display the outcome of each printer
+		self.displayResults.result.emit({
+			"title": f"Move Printers to {destination_site}", "results": results })
+
+		# Update Status Bar and Progress Bar
+		finished_callback.emit(
+			f"Moving printers to [{destination_site}]...  [{moved}/{len(pending)} MOVED]")
+
+
+	def retag_jps_printer(self, printer, site, warning_callback):
+		"""
+		Helper function that assigns a printer in Jamf Pro to another Site by rewriting
+		only its notes.
+
+		Args:
+			printer:  Printer object of the printer in Jamf Pro (Printer)
+			site:  Site to assign the printer to (str)
+			warning_callback:  A callback function to update the progress and status bars
+		Returns:
+			dict of the printer's name, the "status" of the request, and its "details"
+		"""
+
+		updated = get_timestamp(datetime.now())
+		updated_by = self.site_admin_account.get("username")
+
+		payload = PrinterPayload(fields = [
+			(
+				"notes",
+				self.create_custom_printer_notes(
+					site, printer.created, printer.created_by, updated, updated_by)
+			)
+		])
+
+		# PUT to update the printer's notes in the JPS.
+		response_update_printer = self.jamf_pro_api(
+			api_account = self.jps_privileged_api_account,
+			method = "put",
+			endpoint = f"{CLASSIC_API_ENDPOINTS.get('printers_by_id')}/{printer.printer_id}",
+			send_content_type = "xml",
+			data = payload,
+			warning_callback = warning_callback
+		)
+
+		if response_update_printer is None or response_update_printer.status_code != 201:
+
+			log.error(
+				"Failed to move the printer!\n"
+				f"\tPrinter:  {printer.display_name}\n"
+				f"\tStatus Code:  {getattr(response_update_printer, 'status_code', None)}\n"
+				f"\tResponse:  {getattr(response_update_printer, 'text', None)}"
+			)
+
+			return {
+				"printer": printer.display_name,
+				"status": "Failed",
+				"details": (
+					f"Status Code:  {response_update_printer.status_code}"
+					if response_update_printer is not None else
+					"Failed to connect to the Jamf Pro Server"
+				),
+				"status_code": getattr(response_update_printer, "status_code", None),
+				"unreachable": response_update_printer is None
+			}
+
+		details = f"Moved from '{printer.site}'"
+
+		# Keep the JPS printer in sync with what was sent
+		with self.registry_lock:
+			printer.site = site
+			printer.updated = updated
+			printer.updated_by = updated_by
+			self.jps_printers_changed = True
+
+		return { "printer": printer.display_name, "status": "Moved", "details": details }
+
+
+	def clicked_resume_operation(self, progress_callback, finished_callback, warning_callback,
+		journal):
+		"""
+		Handles the "Resume Interrupted Operation" action.
+
+		Steps that completed are skipped; steps that were interrupted mid-request are sent
+		again, which is safe as a repeated create is rejected as a duplicate (and the printer
+		the interrupted request created is looked up) and a repeated delete finds the printer
+		already gone.
+
+		Args:
+			progress_callback:  A callback function to update the progress and status bars
+			finished_callback:  A callback function to update the progress and status bars
+			warning_callback:  A callback function to update the progress and status bars
+			journal:  Journal of the interrupted operation (OperationJournal)
+		"""
+
+		# Outcomes of the steps completed by the interrupted run
+		previous = [
+			dict(journal.outcomes[key], details = "Completed before the interruption")
+			for key in journal.steps
+			if key in journal.completed
+		]
+
+		results = self.run_journaled(
+			journal,
+			warning_callback,
+			progress_callback = progress_callback,
+			message = f"Resuming:  {journal.description}..."
+		)
+
+		# Look up the created printers in one pass so they can be added to the list
+		if created_ids := [
+			result.get("id") for result in results if result.get("status") == "Created"
+		]:
+
+			new_printers = self.run_concurrently(
+				partial(self.fetch_jps_printer, warning_callback = warning_callback),
+				created_ids,
+				progress_callback = progress_callback,
+				message = "Fetching the created printers..."
+			)
+
+			self.add_jps_printers(new_printers)
+
+		# Display the outcome of each printer
+		self.displayResults.result.emit(
+			{ "title": journal.description, "results": results + previous })
+
+		failed = sum(result.get("status") == "Failed" for result in results)
+
+		# Update Status Bar and Progress Bar
+		finished_callback.emit(
+			f"Resuming:  {journal.description}...  "
+			f"[{len(results) - failed}/{len(results)} COMPLETE]"
+		)
+
+
+	def flush_offline_queue(self, progress_callback, finished_callback, warning_callback):
+		"""
+		Sends the changes that were queued while Jamf Pro was unreachable.
+
+		A queued change to a printer that has since been changed or deleted in Jamf Pro is
+		reported as a conflict instead of being sent.
+
+		Args:
+			progress_callback:  A callback function to update the progress and status bars
+			finished_callback:  A callback function to update the progress and status bars
+			warning_callback:  A callback function to update the progress and status bars
+		"""
+
+		try:
+
+			pending_queue = self.get_offline_queue()
+
+			if pending_queue is None or not pending_queue.pending():
+				return
+
+			if not self.jps_is_reachable():
+				log.debug("Jamf Pro is still unreachable; keeping the pending changes queued")
+				return
+
+			results = self.run_journaled(
+				pending_queue,
+				warning_callback,
+				progress_callback = progress_callback,
+				message = "Sending pending changes to Jamf Pro...",
+				queue_offline = False,
+				park_rejected = True
+			)
+
+			with self.registry_lock:
+				if pending_queue.pending() == []:
+					self.offline_queue = None
+
+			# Look up the created printers in one pass so they can be added to the list
+			if created_ids := [
+				result.get("id") for result in results if result.get("status") == "Created"
+			]:
+
+				new_printers = self.run_concurrently(
+					partial(self.fetch_jps_printer, warning_callback = warning_callback),
+					created_ids,
+					progress_callback = progress_callback,
+					message = "Fetching the created printers..."
+				)
+
+				self.add_jps_printers(new_printers)
+
+			# Display the outcome of each change
+			self.displayResults.result.emit({ "title": "Pending Changes", "results": results })
+
+			sent = sum(
+				result.get("status") not in { "Failed", "Conflict", "Rejected" }
+				for result in results
+			)
+
+			# Update Status Bar and Progress Bar
+			finished_callback.emit(
+				f"Sending pending changes to Jamf Pro...  [{sent}/{len(results)} SENT]")
+
+		finally:
+			self.offline_flushing = False
+
+
+	def clicked_delete_printer(self, progress_callback, finished_callback, warning_callback):
+		"""
+		Handles the "Delete Printer" in JPS button click.
+
+		Args:
+			progress_callback:  A callback function to update the progress and status bars
+			finished_callback:  A callback function to update the progress and status bars
+			warning_callback:  A callback function to update the progress and status bars
+		"""
+
+		# Disable Buttons
+		self.button_delete_printer.setEnabled(False)
+		self.button_update_printer.setEnabled(False)
+
+		selected_jps_printer = self.selected_combo_box_value(self.combo_printers)
+		log.info(f"Selected printer to DELETE:  '{selected_jps_printer}'")
+
+		# Update Status Bar and Pulse Progress Bar
+		progress_callback.emit({
+			"msg": f"Deleting [{selected_jps_printer}] in Jamf Pro...",
+			"pb_type": "Pulse"
+		})
+
+		# Will need a couple details from the existing printer configuration
+		jps_printer = [
+			printer
+			for printer in self.jps_printers()
+			if selected_jps_printer == printer.display_name
+		]
+
+		# Ensure only one matching object was found
+		if len(jps_printer) == 1:
+
+			# Pull object out of its list
+			jps_printer = jps_printer[0]
+
+			# Delete printer in the JPS.
+			result = self.queue_if_offline(
+				journal_step("delete", jps_printer, jps_printer.site),
+				self.delete_jps_printer(jps_printer, warning_callback)
+			)
+
+			if result.get("status") == "Queued":
+
+				# Update Status Bar and Progress Bar
+				finished_callback.emit(
+					f"Jamf Pro is unreachable; queued the deletion of [{selected_jps_printer}]")
+
+			elif result.get("status") != "Deleted":
+
+				# Update Status Bar and Pulse Progress Bar
+				warning_callback.emit(
+					f"ERROR:  Failed to delete [{selected_jps_printer}] in Jamf Pro")
+
+			else:
+
+				# Update Status Bar and Progress Bar
+				finished_callback.emit(
+					f"Delete [{selected_jps_printer}] in Jamf Pro...  [COMPLETE]")
+
+		else:
+
+			# Update Status Bar and Pulse Progress Bar
+			warning_callback.emit("There was a problem identifying the printer.")
+
+
+	def clicked_bulk_delete_printers(self, progress_callback, finished_callback, warning_callback,
+		site, name_filter, not_installed):
+		"""
+		Handles the "Delete Printers" bulk action.
+
+		Printers are deleted concurrently; the rate limiter throttles the DELETEs and each
+		failure is retried with backoff.  The run is journaled so it can be resumed if interrupted.
+
+		Args:
+			progress_callback:  A callback function to update the progress and status bars
+			finished_callback:  A callback function to update the progress and status bars
+			warning_callback:  A callback function to update the progress and status bars
+			site:  Site to delete printers from (str)
+			name_filter:  Only delete printers whose name matches this wildcard pattern (str)
+			not_installed:  Only delete printers that are not installed on a reference Mac (bool)
+		"""
+
+		printers = [
+			printer
+			for printer in self.jps_printers()
+			if printer.site == site and fnmatch.fnmatchcase(printer.display_name, name_filter)
+		]
+
+		if not_installed:
+
+			# Printers installed on this Mac and any other reference Macs
+			installed = load_reference_printers(self.settings.get("reference_printers"))
+			installed |= { printer.display_name for printer in self.local_printer_list }
+			installed |= { printer.cups_name for printer in self.local_printer_list }
+
+			printers = [
+				printer
+				for printer in printers
+				if printer.display_name not in installed and printer.cups_name not in installed
+			]
+
+		if not printers:
+
+			# Update Status Bar and Progress Bar
+			finished_callback.emit(f"No printers in [{site}] match the criteria")
+			return
+
+		if not self.confirm(
+			(
+				f"Permanently delete {len(printers)} printer(s) from [{site}] in Jamf Pro?\n\n"
+				f"Name filter:  {name_filter}\n"
+				"Only printers not installed on a reference Mac:  "
+				f"{'Yes' if not_installed else 'No'}"
+			),
+			"\n".join(sorted(printer.display_name for printer in printers))
+		):
+
+			# Update Status Bar and Progress Bar
+			finished_callback.emit("Deleting printers...  [CANCELED]")
+			return
+
+		journal = OperationJournal.start(
+			self.state_path("delete", site, name_filter, not_installed),
+			f"Delete printers from {site}"
+		)
+		journal.plan([ journal_step("delete", printer, site) for printer in printers ])
+
+		results = self.run_journaled(
+			journal,
+			warning_callback,
+			progress_callback = progress_callback,
+			message = f"Deleting printers from [{site}]..."
+		)
+
+		deleted = sum(result.get("status") == "Deleted" for result in results)
+
+		# Display the outcome of each printer
+		self.displayResults.result.emit(
+			{ "title": f"Delete Printers from {site}", "results": results })
+
+		# Update Status Bar and Progress Bar
+		finished_callback.emit(
+			f"Deleting printers from [{site}]...  [{deleted}/{len(results)} DELETED]")
+
+
+	def delete_jps_printer(self, printer, warning_callback, retries = 3):
+		"""
+		Helper function that deletes a printer in Jamf Pro, retrying failures with backoff.
+
+		Only transient failures are retried:  connection errors, 429, and 5xx responses.
+
+		Args:
+			printer:  Printer object of the printer in Jamf Pro (Printer)
+			warning_callback:  A callback function to update the progress and status bars
+			retries:  Times to retry a failed request (int)
+		Returns:
+			dict of the printer's name, the "status" of the request, and its "details"
+		"""
+
+		for attempt in range(retries + 1):
+
+			if attempt:
+				CancellationToken.current().sleep(backoff_delay(attempt))
+
+			response_delete_printer = self.jamf_pro_api(
+				api_account = self.jps_privileged_api_account,
+				method = "delete",
+				endpoint = f"{CLASSIC_API_ENDPOINTS.get('printers_by_id')}/{printer.printer_id}",
+				warning_callback = warning_callback
+			)
+
+			status_code = getattr(response_delete_printer, "status_code", None)
+
+			# A 404 means the printer is already gone
+			if status_code in { 200, 404 }:
+
+				# Remove printer from the list
+				with self.registry_lock:
+					if printer in self.jps_printer_list:
+						self.jps_printer_list.remove(printer)
+						self.jps_printers_changed = True
+
+				return {
+					"printer": printer.display_name,
+					"status": "Deleted",
+					"details": f"Attempts:  {attempt + 1}"
+				}
+
+			# Other client errors, e.g. 401 or 403, will not succeed on a retry
+			if status_code is not None and status_code != 429 and status_code < 500:
+				break
+
+		log.error(
+			"Failed to delete the printer!\n"
+			f"\tPrinter:  {printer.display_name}\n"
+			f"\tStatus Code:  {getattr(response_delete_printer, 'status_code', None)}\n"
+			f"\tURI:  '{CLASSIC_API_ENDPOINTS.get('printers_by_id')}/{printer.printer_id}'\n"
+			f"\tResponse:  {getattr(response_delete_printer, 'text', None)}"
+		)
+
+		return {
+			"printer": printer.display_name,
+			"status": "Failed",
+			"details": (
+				f"Status Code:  {response_delete_printer.status_code}"
+				if response_delete_printer is not None else
+				"Failed to connect to the Jamf Pro Server"
+			),
+			"status_code": getattr(response_delete_printer, "status_code", None),
+			"unreachable": response_delete_printer is None
+		}
+
+
+	################################################################################################
+	# Main Helpers
+
+	def jamf_pro_url(self):
+		"""
+		Helper function to return the Jamf Pro URL the device is enrolled with
+		"""
+
+		# Define Variables
+		jamf_plist = "/Library/Preferences/com.jamfsoftware.jamf.plist"
+
+		# Get the systems' Jamf Pro Server
+		if os.path.exists(jamf_plist):
+
+			with open(jamf_plist, "rb") as jamf_plist:
+
+				jamf_plist_contents = plistlib.load(jamf_plist)
+				self.jps_url = jamf_plist_contents.get("jss_url")
+				log.debug(f"Jamf Pro Server URL:  {self.jps_url}")
+
+		else:
+			log.error("Missing the Jamf Pro configuration file!")
+			sys.exit(1)
+
+
+	def jamf_pro_api(self, api_account: dict, method: str, endpoint: str,
+		receive_content_type: str = "json", send_content_type = "xml",
+		data: Union[str, dict, None] = None, **kwargs):
+		"""Helper function to interact with the Jamf Pro API(s).
+
+		Args:
+			api_account (dict): Dict contain the username and password to use
+				when interacting with the Jamf Pro API.
+			method (str): HTTP Method that should be used.
+			endpoint (str): The API's endpoint URL
+			receive_content_type (str, optional): The content type to request the API to
+				respond with. Defaults to "json".
+			send_content_type (str, optional): The content type that will be sent to the API.
+				Defaults to "xml".
+			data (str | dict | None, optional): A data payload that will be sent to the API.
+				Defaults to None.
+			hedge (bool, optional): Whether an idempotent GET may be hedged when request
+				hedging is enabled.  Defaults to False.
+			cache (bool, optional): Whether a GET may be answered from the response cache.
+				Defaults to True.
+
+		Returns:
+			requests.response | None: A request.response object, or None if the Jamf Pro
+				Server could not be reached
+
+		Raises:
+			OperationCancelled: The operation was canceled
+		"""
+
+		warning_callback = kwargs.get("warning_callback")
+		cache_key = (api_account.get("username"), endpoint, receive_content_type)
+
+		if (
+			method == "get" and
+			self.response_cache and
+			kwargs.get("cache", True) and
+			(cached_response := self.response_cache.get(cache_key)) is not None
+		):
+			return cached_response
+
+		if (
+			not api_account.get("api_token") or
+			self.is_token_expired(api_account.get("api_token_expires"))
+		):
+			api_account |= self.get_token(
+				api_account.get("username"),
+				api_account.get("password")
+			)
 
 		# Setup API URL and Headers
 		url = f"{self.jps_url}{endpoint}"
 		headers = {
 			"Authorization": f"jamf-token {api_account.get('api_token')}",
 			"Accept": f"application/{receive_content_type}",
+			"Accept-Encoding": "gzip",
 			"Content-Type": f"application/{send_content_type}"
 		}
 
-		try:
+		# Map the method to the requests function that sends it
+		request_method = {
+			"get": "get",
+			"post": "post",
+			"create": "post",
+			"put": "put",
+			"update": "put",
+			"delete": "delete"
+		}.get(method)
+
+		if not request_method:
+			return None
+
+		token = CancellationToken.current()
+
+		# A write that lands while this GET is in flight keeps its response out of the cache
+		if method == "get" and self.response_cache:
+			generation = self.response_cache.generation(endpoint)
+
+		def acquire():
+			# Every request, including a hedged duplicate, spends a rate limit token
+			if self.rate_limiter:
+				self.rate_limiter.acquire(method, token)
+
+		def send(attempt = NEVER_CANCELED):
+			with requests.Session() as session:
+
+				with token.track(session), attempt.track(session):
+					response = getattr(session, request_method)(
+						url=url, headers=headers, data=data, stream=True)
+
+				# Read the body while it can still be interrupted by canceling the operation,
+				# or by a hedged duplicate winning
+				with token.track(response), attempt.track(response):
+					response.content
+
+			return response
+
+		try:
+
+			# Only requests that can be safely resent are retried when the server is overloaded
+			retries = (
+				self.rate_limiter.max_retries
+				if self.rate_limiter and method in IDEMPOTENT_METHODS else 0
+			)
+
+			for _ in range(retries + 1):
+
+				# Waiting on the rate limiter happens outside the timed (hedged) request
+				if method == "get" and self.request_hedger and kwargs.get("hedge"):
+					response = self.request_hedger.execute(send, acquire)
+				else:
+					acquire()
+					response = send()
+
+				if not self.rate_limiter:
+					break
+
+				if response.status_code not in { 429, 503 }:
+					self.rate_limiter.recover(method)
+					break
+
+				# The server asked us to back off
+				self.rate_limiter.throttle(method, response.headers.get("Retry-After"))
+
+			self.record_transfer(response)
+
+			if self.response_cache:
+
+				if method == "get":
+					self.response_cache.put(cache_key, response, generation)
+				else:
+					self.response_cache.invalidate(endpoint)
+
+			return response
+
+		except (requests.ConnectionError, requests.Timeout):
+
+			# Closing the connection of a canceled request is not a connection failure
+			token.check()
+
+			warning_callback.emit("ERROR:  Failed to connect to the Jamf Pro Server.")
+			log.error("Failed to connect to the Jamf Pro Server.")
+
+		except Exception:
+
+			token.check()
+			raise
+
+
+	def fetch_jps_printer(self, printer_id, warning_callback, cache = True):
+		"""Helper function to get a printer's details from Jamf Pro.
+
+		Args:
+			printer_id (str): The id of a printer object to lookup in the JPS
+			warning_callback: A callback function to update the progress and status bars
+			cache (bool, optional): Whether the response cache may be used. Defaults to True.
+
+		Concurrent lookups of the same printer share one request and its parsed result.
+
+		Returns:
+			Printer | None: A Printer object or None if the lookup failed
+		"""
+
+		endpoint = f"{CLASSIC_API_ENDPOINTS.get('printers_by_id')}/{printer_id}"
+
+		def lookup():
+
+			response_get_printer = self.jamf_pro_api(
+				api_account = self.jps_privileged_api_account,
+				method = "get",
+				endpoint = endpoint,
+				receive_content_type = self.response_codec.content_type,
+				hedge = True,
+				cache = cache,
+				warning_callback = warning_callback
+			)
+
+			if response_get_printer is None or response_get_printer.status_code != 200:
+
+				log.warning(
+					f"Failed to get printer ID {printer_id} from Jamf Pro!\n"
+					f"\tStatus Code:  {getattr(response_get_printer, 'status_code', None)}\n"
+					f"\tResponse:  {getattr(response_get_printer, 'text', None)}"
+				)
+				return None
+
+			return Printer.from_jps_record(
+				self.response_codec.printer_record(response_get_printer.content))
+
+		return self.single_flight.do((endpoint, cache), lookup)
+
+
+	def jps_printers(self):
+		"""Helper function to take a snapshot of the JPS printers that workers can iterate over.
+
+		Returns:
+			list: The JPS Printer objects
+		"""
+
+		with self.registry_lock:
+			return list(self.jps_printer_list)
+
+
+	def add_jps_printers(self, printers):
+		"""Helper function to add printers, e.g. newly created ones, to the JPS printers.
+
+		Args:
+			printers (list): Printer objects; None entries are skipped
+		"""
+
+		with self.registry_lock:
+			self.jps_printer_list.extend(printer for printer in printers if printer)
+			self.jps_printers_changed = True
+
+
+	def run_concurrently(self, function, items, progress_callback = None, message = ""):
+		"""Helper function to call a function for each item with bounded parallelism.
+
+		Args:
+			function (callable): Function that is passed each item
+			items (list): Items to process
+			progress_callback (optional): A callback function to update the progress and
+				status bars. Defaults to None.
+			message (str, optional): Status bar message while processing. Defaults to "".
+
+		Returns:
+			list: The result for each item in the same order as the items; None for any
+				item that raised an exception
+
+		Raises:
+			OperationCancelled: The operation was canceled
+		"""
+
+		total = len(items)
+		token = CancellationToken.current()
+
+		def run(item):
+
+			# Queued items are skipped once the operation is canceled
+			with token.activate():
+				token.check()
+				return function(item)
+
+		with concurrent.futures.ThreadPoolExecutor(
+			max_workers = self.settings.get("bulk_workers")
+		) as executor:
+
+			futures = [ executor.submit(run, item) for item in items ]
+
+			for count, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+
+				if future.exception() and not token.cancelled:
+					log.error(f"Failed to process an item:  {future.exception()}")
+
+				if progress_callback:
+
+					# Update Status Bar and Progress Bar
+					progress_callback.emit({
+						"msg": f"{message}  [{count}/{total}]",
+						"total": total,
+						"count": count
+					})
+
+		token.check()
+
+		return [ None if future.exception() else future.result() for future in futures ]
+
+
+	def run_journaled(self, journal, warning_callback, progress_callback = None, message = "",
+		queue_offline = True, park_rejected = False):
+		"""Helper function to run the pending steps of a journaled bulk operation concurrently.
+
+		Each step is journaled before its API request is sent and again with its outcome; the
+		journal is removed once every step has completed.
+
+		Args:
+			journal (OperationJournal): Journal of the operation
+			warning_callback:  A callback function to update the progress and status bars
+			progress_callback (optional): A callback function to update the progress and
+				status bars. Defaults to None.
+			message (str, optional): Status bar message while processing. Defaults to "".
+			queue_offline (bool, optional): Whether steps that fail because the Jamf Pro
+				Server is unreachable are moved to the offline queue. Defaults to True.
+			park_rejected (bool, optional): Whether steps that Jamf Pro rejects with a 4xx
+				status, which will not succeed when sent again, are completed as "Rejected"
+				instead of being retried. Defaults to False.
+
+		Returns:
+			list: The result of each step that was run, in the order the steps were planned
+		"""
+
+		steps = journal.pending()
+
+		def run_step(step):
+
+			interrupted = journal.state(step.get("key")) == "Interrupted"
+
+			journal.begin(step)
+			result = self.apply_journal_step(step, warning_callback)
+
+			# A create whose request was sent before the interruption may have succeeded
+			if (
+				interrupted and
+				step.get("action") == "create" and
+				result.get("status") == "Duplicate"
+			):
+				result = self.recover_interrupted_create(step, result, warning_callback)
+
+			if queue_offline:
+				result = self.queue_if_offline(step, result)
+
+			if (
+				park_rejected and
+				result.get("status") == "Failed" and
+				400 <= (result.get("status_code") or 0) < 500 and
+				result.get("status_code") not in { 408, 429 }
+			):
+				result = dict(
+					result,
+					status = "Rejected",
+					details = (
+						"Jamf Pro rejected the change "
+						f"(Status Code:  {result.get('status_code')}); it will not be sent again"
+					)
+				)
+
+			journal.finish(step, result)
+
+			return result
+
+		results = self.run_concurrently(run_step, steps, progress_callback, message)
+
+		for index, (step, result) in enumerate(zip(steps, results)):
+
+			# Steps that raised are recorded as failures so they are retried when resumed
+			if result is None:
+				results[index] = { "printer": step.get("printer"), "status": "Failed" }
+				journal.finish(step, results[index])
+
+		if not journal.pending():
+			journal.remove()
+
+		return results
+
+
+	def recover_interrupted_create(self, step, result, warning_callback):
+		"""Helper function to find the printer an interrupted create step made in Jamf Pro.
+
+		Args:
+			step (dict): The create step
+			result (dict): The "Duplicate" outcome of sending the step again
+			warning_callback:  A callback function to update the progress and status bars
+
+		Returns:
+			dict: The outcome as "Created" with the printer's "id" if the existing printer
+				has the step's CUPS name, otherwise the original result
+		"""
+
+		response_get_printer = self.jamf_pro_api(
+			api_account = self.jps_privileged_api_account,
+			method = "get",
+			endpoint = (
+				f"{CLASSIC_API_ENDPOINTS.get('printers_by_name')}/"
+				f"{quote(step.get('printer'), safe='')}"
+			),
+			receive_content_type = self.response_codec.content_type,
+			cache = False,
+			warning_callback = warning_callback
+		)
+
+		if response_get_printer is None or response_get_printer.status_code != 200:
+			return result
+
+		existing = Printer.from_jps_record(
+			self.response_codec.printer_record(response_get_printer.content))
+
+		if existing.cups_name != step.get("cups_name"):
+			return result
+
+		log.info(f"'{step.get('printer')}' was created before the operation was interrupted")
+
+		return {
+			"printer": step.get("printer"),
+			"status": "Created",
+			"id": existing.printer_id,
+			"details": "Created before the operation was interrupted"
+		}
+
+
+	def apply_journal_step(self, step, warning_callback):
+		"""Helper function to perform one step of a journaled bulk operation.
+
+		Args:
+			step (dict): Step built by journal_step
+			warning_callback:  A callback function to update the progress and status bars
+
+		Returns:
+			dict of the printer's name, the "status" of the request, and its "details"
+		"""
+
+		local_printer = next(
+			(
+				printer
+				for printer in self.local_printer_list
+				if printer.cups_name == step.get("cups_name")
+			),
+			None
+		)
+
+		with self.registry_lock:
+			jps_printer = next(
+				(
+					printer
+					for printer in self.jps_printer_list
+					if printer.printer_id == step.get("printer_id")
+				),
+				None
+			)
+
+		action = step.get("action")
+
+		# A queued change may have been overtaken by changes made in Jamf Pro since
+		if step.get("queued") and action != "create":
+
+			response_current = self.jamf_pro_api(
+				api_account = self.jps_privileged_api_account,
+				method = "get",
+				endpoint = (
+					f"{CLASSIC_API_ENDPOINTS.get('printers_by_id')}/{step.get('printer_id')}"),
+				receive_content_type = self.response_codec.content_type,
+				cache = False,
+				warning_callback = warning_callback
+			)
+
+			if response_current is None:
+				return {
+					"printer": step.get("printer"),
+					"status": "Failed",
+					"details": "Failed to connect to the Jamf Pro Server",
+					"unreachable": True
+				}
+
+			if response_current.status_code not in { 200, 404 }:
+				return {
+					"printer": step.get("printer"),
+					"status": "Failed",
+					"details": f"Status Code:  {response_current.status_code}",
+					"status_code": response_current.status_code
+				}
+
+			current = (
+				Printer.from_jps_record(
+					self.response_codec.printer_record(response_current.content))
+				if response_current.status_code == 200 else None
+			)
+
+			if current is None and action != "delete":
+				return {
+					"printer": step.get("printer"),
+					"status": "Conflict",
+					"details": "The printer was deleted in Jamf Pro after the change was queued"
+				}
+
+			# The fingerprint covers the printer as stored in Jamf Pro, so edits made outside of
+			# this tool are caught too; older queued changes only recorded the notes stamp
+			if current is not None and (
+				current.fingerprint != step.get("fingerprint")
+				if step.get("fingerprint") else
+				current.updated != step.get("updated")
+			):
+				return {
+					"printer": step.get("printer"),
+					"status": "Conflict",
+					"details": "The printer was changed in Jamf Pro after the change was queued"
+				}
+
+			if current is not None:
+
+				# Apply the change to the current version of the printer
+				with self.registry_lock:
+					for index, printer in enumerate(self.jps_printer_list):
+						if printer.printer_id == current.printer_id:
+							self.jps_printer_list[index] = current
+							self.jps_printers_changed = True
+
+				jps_printer = current
+
+		if action in { "create", "update" } and local_printer is None:
+			return {
+				"printer": step.get("printer"),
+				"status": "Failed",
+				"details": "The printer is no longer installed on this Mac"
+			}
+
+		if action in { "update", "retag" } and jps_printer is None:
+			return {
+				"printer": step.get("printer"),
+				"status": "Failed",
+				"details": "The printer was not found in Jamf Pro"
+			}
+
+		if action == "create":
+			return self.create_jps_printer(local_printer, step.get("site"), warning_callback)
+
+		if action == "update":
+
+			changes = local_printer.differences(jps_printer)
+
+			if jps_printer.site != step.get("site"):
+				changes["site"] = (jps_printer.site, step.get("site"))
+
+			return self.update_jps_printer(
+				local_printer, jps_printer, step.get("site"), warning_callback, changes)
+
+		if action == "delete":
+			return self.delete_jps_printer(
+				jps_printer or Printer(
+					printer_id = step.get("printer_id"), display_name = step.get("printer")),
+				warning_callback
+			)
+
+		if action == "retag":
+			return self.retag_jps_printer(jps_printer, step.get("site"), warning_callback)
+
+		raise ValueError(f"Unknown journal action:  {action}")
+
+
+	def get_offline_queue(self, create = False):
+		"""Helper function to load the queue of changes made while Jamf Pro was unreachable.
+
+		Args:
+			create (bool, optional): Whether to create the queue if it does not exist.
+				Defaults to False.
+
+		Returns:
+			OperationJournal | None: The queue, or None if there is not one
+		"""
+
+		with self.registry_lock:
+
+			path = self.state_path("offline")
+
+			if self.offline_queue is None and (create or os.path.exists(path)):
+				self.offline_queue = OperationJournal(
+					path, "Changes made while Jamf Pro was unreachable")
+
+			return self.offline_queue
+
+
+	def queue_if_offline(self, step, result):
+		"""Helper function to queue a change that failed because Jamf Pro was unreachable.
+
+		Args:
+			step (dict): Step built by journal_step
+			result (dict): The outcome of the step
+
+		Returns:
+			dict: The outcome, marked as "Queued" if the change was queued
+		"""
+
+		if result.get("status") != "Failed" or not result.get("unreachable"):
+			return result
+
+		# Each queued change is a separate step, even for the same printer
+		queued = get_timestamp(datetime.now())
+		self.get_offline_queue(create = True).plan([
+			dict(step, key = f"{step.get('key')}@{time.time_ns()}", queued = queued) ])
+		log.info(
+			f"Queued '{step.get('action')}' of '{step.get('printer')}' until Jamf Pro is reachable")
+
+		return dict(
+			result,
+			status = "Queued",
+			details = "Jamf Pro is unreachable; the change will be sent once it is reachable"
+		)
+
+
+	def jps_is_reachable(self):
+		"""Helper function to check whether the Jamf Pro Server can be reached.
+
+		Returns:
+			bool: Whether the server responded
+		"""
+
+		try:
+			requests.head(self.jps_url, timeout = 10)
+		except Exception:
+			return False
+
+		return True
+
+
+	def record_transfer(self, response):
+		"""Records how many bytes a response used on the wire and after decompression.
+
+		Args:
+			response (requests.Response): A response from the Jamf Pro API
+		"""
+
+		decoded = len(response.content)
+
+		try:
+			# Bytes read from the socket, i.e. before decompression
+			on_wire = response.raw.tell() or decoded
+		except Exception:
+			on_wire = int(response.headers.get("Content-Length", decoded))
+
+		self.api_metrics.increment("responses")
+		self.api_metrics.increment("bytes_on_wire", on_wire)
+		self.api_metrics.increment("bytes_decoded", decoded)
+
+		if response.headers.get("Content-Encoding") == "gzip":
+			self.api_metrics.increment("responses_gzip")
+
+
+	def get_token(self, username: str, password: str):
+		"""A helper function use to obtain a Jamf Pro API Token.
+
+		Args:
+			username (str): Username for a Jamf Pro account
+			password (str): Password for a Jamf Pro account
+
+		Returns:
+			dict: Results of the API Token request
+		"""
+
+		try:
+
+			# Create a token based on user provided credentials
+			response_get_token = requests.post(
+				url = f"{self.jps_url}/{PRO_API_ENDPOINTS.get('auth_token')}",
+				auth = (username, password)
+			)
+
+			if response_get_token.status_code == 200:
+				return {
+					"api_token": response_get_token.json().get("token"),
+					"api_token_expires": self.fixup_token_expiration(
+						response_get_token.json().get("expires"))
+				}
+
+			return { "error": "ERROR:  Failed to authenticate with the Jamf Pro Server." }
+
+		except Exception:
+			return { "error": "ERROR:  Failed to connect to the Jamf Pro Server." }
+
+
+	def fixup_token_expiration(self, token_expires: str):
+		"""Makes the API Token's expiration date into a Python complaint value.
+
+		Args:
+			token_expires (str): A datetime string
+
+		Returns:
+			datetime: A datetime string
+		"""
+
+		return datetime.fromisoformat(
+			token_expires.rsplit(".", maxsplit=1)[0]
+		).replace(tzinfo=timezone.utc)
+
+
+	def is_token_expired(self, token_expires: datetime):
+		"""Checks if the current API Token has expired.
+
+		Args:
+			token_expires (str): A datetime object
+
+		Returns:
+			bool: Whether or not the API Token has expired
+		"""
+
+		if datetime.now(timezone.utc) > (token_expires - timedelta(minutes=5)):
+			log.debug("API Token has expired!")
+			return True
+
+		return False
+
+
+	def display_printer_details(self):
+		"""
+		Handles the displaying printer details in the expanded window details view.
+		"""
+
+		try:
+			# Get the object that called this function
+			sender = self.sender()
+			sender = (
+				"qlist_local_printers"
+				if sender is self.qlist_local_printers.selectionModel() else
+				sender.objectName()
+			)
+
+		except Exception:
+			pass
+
+		# Determine which object to get the selected item in that object
+		if sender == "qlist_local_printers":
+
+			selected_printer = self.selected_list_value(self.qlist_local_printers)
+			printer_list = self.local_printer_list
+
+		elif sender in { "combo_printers", "combo_sites" }:
+
+			selected_printer = self.selected_combo_box_value(self.combo_printers)
+			printer_list = self.jps_printers()
+
+		else:
+			return
+
+		try:
+			# Loop through the list to get the printers details
+			for printer in printer_list:
+
+				if printer.display_name == selected_printer:
+
+					self.lineEdit_printer_display_name.setText(printer.display_name)
+					self.lineEdit_printer_location.setText(printer.location)
+					self.lineEdit_printer_model.setText(printer.model)
+					self.lineEdit_printer_device_uri.setText(printer.device_uri)
+					self.lineEdit_printer_cups_name.setText(printer.cups_name)
+					self.lineEdit_printer_ppd_file_path.setText(printer.ppd_path)
+					self.lineEdit_site.setText(printer.site)
+					self.lineEdit_created_by.setText(printer.created_by)
+					self.lineEdit_updated_by.setText(printer.updated_by)
+					self.queue_ppd(printer.ppd_contents)
+
+		except Exception:
+			log.error("Failed to display printer details.")
+
+
+	def select_best_matches(self, search: str):
+		"""
+		Callback function to select the best match for a search in both printer lists
+
+		Args:
+			search (str):  The search string
+		"""
+
+		if not search.strip():
+			return
+
+		if self.local_printer_proxy.rowCount() > 0:
+			self.qlist_local_printers.setCurrentIndex(self.local_printer_proxy.index(0, 0))
+
+		if self.jps_printer_proxy.rowCount() > 0:
+			self.combo_printers.setCurrentIndex(0)
+
+
+	def queue_ppd(self, ppd_contents: Union[str, None]):
+		"""
+		Helper function to show a PPD in the PPD viewer once the selection settles; only the
+		last PPD queued is loaded
+
+		Args:
+			ppd_contents (str | None):  Contents of the PPD
+		"""
+
+		self.ppd_contents = ppd_contents or ""
+		self.ppd_generation += 1
+		self.label_ppd_summary.setText("Loading PPD...")
+		self.ppd_timer.start()
+
+
+	def load_ppd(self):
+		"""
+		Loads the queued PPD into a document in the background
+		"""
+
+		worker = Worker(self.prepare_ppd, self.ppd_contents, self.ppd_generation)
+		worker.signals.result.connect(self.show_ppd)
+		self.threadpool.start(worker)
+
+
+	def prepare_ppd(
+			self, ppd_contents, generation, progress_callback, finished_callback, warning_callback):
+		"""
+		Builds the text document for a PPD off of the GUI thread
+
+		Args:
+			ppd_contents (str):  Contents of the PPD
+			generation (int):  Which queued PPD this is
+			progress_callback:  A callback function to update the progress and status bars
+			finished_callback:  A callback function to update the progress and status bars
+			warning_callback:  A callback function to update the progress and status bars
+		Returns:
+			dict | None:  The document and its summary, or None if another PPD was queued
+		"""
+
+		# Skip the work if the selection has already moved on
+		if generation != self.ppd_generation:
+			return None
+
+		document = QtGui.QTextDocument()
+		document.setDocumentLayout(QtWidgets.QPlainTextDocumentLayout(document))
+		document.setUndoRedoEnabled(False)
+		document.setPlainText(ppd_contents)
+
+		# Hand the document to the GUI thread, which lays it out as it is scrolled into view
+		document.moveToThread(QtWidgets.QApplication.instance().thread())
+
+		return {
+			"generation": generation,
+			"document": document,
+			"size": len(ppd_contents.encode("utf-8")),
+			"lines": len(ppd_contents.splitlines())
+		}
+
+
+	def show_ppd(self, result):
+		"""
+		Callback function to show a PPD that was loaded in the background
+
+		Args:
+			result (dict | None):  The document and its summary
+		"""
+
+		# Ignore PPDs that are no longer selected
+		if not result or result.get("generation") != self.ppd_generation:
+			if result:
+				result.get("document").deleteLater()
+			return
+
+		previous_document, self.ppd_document = self.ppd_document, result.get("document")
+		self.textEdit_printer_ppd_contents.setDocument(self.ppd_document)
+
+		if previous_document is not None:
+			previous_document.deleteLater()
+
+		self.label_ppd_summary.setText(
+			f"{result.get('size') / 1024:,.1f} KB, {result.get('lines'):,} lines"
+			if result.get("size") else ""
+		)
+
+		if self.lineEdit_ppd_search.text():
+			self.find_in_ppd(from_start=True)
+
+
+	def find_in_ppd(self, *args, from_start: bool = False):
+		"""
+		Finds the next match for the search text in the PPD viewer, wrapping around at the end
+
+		Args:
+			from_start (bool, optional):  Search from the top of the PPD.  Defaults to False.
+		"""
+
+		search = self.lineEdit_ppd_search.text()
+
+		if not search:
+			return
+
+		if from_start:
+			self.textEdit_printer_ppd_contents.moveCursor(QtGui.QTextCursor.Start)
+
+		if not self.textEdit_printer_ppd_contents.find(search):
+
+			self.textEdit_printer_ppd_contents.moveCursor(QtGui.QTextCursor.Start)
+
+			if not self.textEdit_printer_ppd_contents.find(search):
+				self.statusBar.showMessage(f"\"{search}\" was not found in the PPD")
+
+
+	def run_compare_ppd(self):
+		"""
+		Shows how the PPD of the selected local printer differs from the PPD of the selected
+		JPS printer in the PPD viewer; the diff is computed in the background and shown as it
+		is produced
+		"""
+
+		selected_site = self.selected_combo_box_value(self.combo_sites)
+		selected_local_printer = self.selected_list_value(self.qlist_local_printers)
+		selected_jps_printer = self.selected_combo_box_value(self.combo_printers)
+
+		local_printer = next(
+			(
+				printer for printer in self.local_printer_list
+				if printer.display_name == selected_local_printer
+			),
+			None
+		)
+		# Printers in other Sites can share the display name
+		jps_printer = next(
+			(
+				printer for printer in self.jps_printers()
+				if printer.site == selected_site
+				and printer.display_name == selected_jps_printer
+			),
+			None
+		)
+
+		if local_printer is None or jps_printer is None:
+			self.statusBar.showMessage("Select a local printer and a Jamf Pro printer to compare.")
+			return
+
+		# Replace whatever the PPD viewer is showing or loading
+		self.ppd_timer.stop()
+		self.ppd_generation += 1
+		document = QtGui.QTextDocument()
+		document.setDocumentLayout(QtWidgets.QPlainTextDocumentLayout(document))
+		document.setUndoRedoEnabled(False)
+		previous_document, self.ppd_document = self.ppd_document, document
+		self.textEdit_printer_ppd_contents.setDocument(document)
+
+		if previous_document is not None:
+			previous_document.deleteLater()
+
+		self.label_ppd_summary.setText("Comparing PPDs...")
+
+		# Show the details panel
+		if self.width() == self.defaultWidth:
+			self.resize_window()
+
+		worker = Worker(self.compare_ppds, jps_printer, local_printer, self.ppd_generation)
+		worker.signals.progress.connect(self.show_ppd_diff)
+		worker.signals.result.connect(self.show_ppd_diff)
+		self.threadpool.start(worker)
+
+
+	def compare_ppds(
+			self, jps_printer, local_printer, generation,
+			progress_callback, finished_callback, warning_callback):
+		"""
+		Diffs the PPD of a JPS printer against the PPD of a local printer, sending the diff to
+		the PPD viewer in chunks
+
+		Args:
+			jps_printer (Printer):  The printer in Jamf Pro
+			local_printer (Printer):  The local printer
+			generation (int):  Which PPD viewer request this is
+			progress_callback:  A callback function to send chunks of the diff to
+			finished_callback:  A callback function to update the progress and status bars
+			warning_callback:  A callback function to update the progress and status bars
+		Returns:
+			dict | None:  The rest of the diff and its summary, or None if the PPD viewer
+				has moved on
+		"""
+
+		# Identical PPDs are detected without comparing them line by line
+		if jps_printer.ppd_hash == local_printer.ppd_hash:
+			return {
+				"generation": generation,
+				"lines": [ "The local PPD and the PPD in Jamf Pro are identical." ],
+				"identical": True
+			}
+
+		lines = []
+		removed = added = 0
+
+		for line in diff_ppds(
+			jps_printer.ppd_contents or "", local_printer.ppd_contents or "",
+			from_name = f"Jamf Pro:  {jps_printer.display_name}",
+			to_name = f"Local:  {local_printer.display_name}"
+		):
+
+			# Stop if the PPD viewer has moved on
+			if generation != self.ppd_generation:
+				return None
+
+			lines.append(line)
+			removed += line.startswith("-")
+			added += line.startswith("+")
+
+			if len(lines) == 500:
+				progress_callback.emit({ "generation": generation, "lines": lines })
+				lines = []
+
+		# Nothing but line endings differ
+		if not added:
+			return {
+				"generation": generation,
+				"lines": [ "The PPDs only differ in their line endings." ],
+				"identical": True
+			}
+
+		return {
+			"generation": generation,
+			"lines": lines,
+			# Without the file headers, which start with --- and +++
+			"removed": removed - 1,
+			"added": added - 1
+		}
+
+
+	def show_ppd_diff(self, result):
+		"""
+		Callback function to add a chunk of a PPD diff to the PPD viewer
+
+		Args:
+			result (dict | None):  Lines of the diff and, with the last chunk, its summary
+		"""
+
+		# Ignore diffs that are no longer shown
+		if not result or result.get("generation") != self.ppd_generation:
+			return
+
+		if result.get("lines"):
+			self.textEdit_printer_ppd_contents.appendPlainText("\n".join(result.get("lines")))
+
+		if result.get("identical"):
+			self.label_ppd_summary.setText("Identical")
+
+		elif "added" in result:
+			self.label_ppd_summary.setText(
+				f"{result.get('removed'):,} lines removed, {result.get('added'):,} lines added")
+			self.textEdit_printer_ppd_contents.moveCursor(QtGui.QTextCursor.Start)
+
+
+	def get_site_access(self, progress_callback, finished_callback, warning_callback):
+		"""
+		A helper function that retrieves the Sites an account has Enroll Permissions too.
+
+		Sites cached by a previous session are shown right away and then refreshed.
+
+		Args:
+			warning_callback:  A callback function to update the progress and status bars
+		"""
+
+		log.debug("Getting users' Site access...")
+
+		cache = SiteAccessCache(
+			self.state_path(
+				"sites",
+				self.jps_url,
+				self.site_admin_account.get("username"),
+				extension = "cache"
+			),
+			self.site_admin_account,
+			self.settings.get("site_cache_ttl")
+		)
+
+		if (cached_sites := cache.load()) is not None:
+
+			log.debug("Using the cached Site access")
+			self.populate_sites(cached_sites, finished_callback, warning_callback)
+
+		else:
+
+			# Update Status Bar
+			progress_callback.emit({ "msg": "Collecting Site Access Permissions..." })
+
+		if (site_names := self.resolve_site_access(warning_callback)) is None:
+			return
+
+		cache.save(site_names)
+
+		if site_names != cached_sites:
+			self.populate_sites(site_names, finished_callback, warning_callback)
+
+
+	def resolve_site_access(self, warning_callback):
+		"""
+		A helper function that looks up the Sites the Site Admin is authorized for.
+
+		Args:
+			warning_callback:  A callback function to update the progress and status bars
+		Returns:
+			set of the authorized Site names, or None if the lookup failed
+		"""
+
+		# GET All User Details
+		response_user_details = self.jamf_pro_api(
+			api_account = self.site_admin_account,
+			method = "get",
+			endpoint = PRO_API_ENDPOINTS.get("auth_details"),
+			cache = False,
+			warning_callback = warning_callback
+		)
+
+		if response_user_details is None or response_user_details.status_code != 200:
+
+			# Update Status Bar and Pulse Progress Bar
+			warning_callback.emit("ERROR:  Failed to look up user details.")
+			log.error("Failed to look up user details.")
+			return None
+
+		try:
+
+			# Get the response content from the API
+			user_details = response_user_details.json()
+
+			# Old method to limit Sites
+			# Uncomment the below lines if you'd want to use this method
+			# site_ids = []
+			# for key in user_details.get("accountGroups"):
+				# for privilege in key.get("privileges"):
+				#     if privilege == "Enroll Computers and Mobile Devices":
+				# site_ids.append(key.get("siteId"))
+
+			# for key in user_details.get("sites"):
+			#     if key.get("id") in site_ids:
+			#         site_names.add(key.get("name"))
+
+			# New method to limit Sites
+			site_names = {
+				key.get("name")
+				for key in user_details.get("sites")
+				if not (
+					self.sites_unauthorized and self.sites_unauthorized.fullmatch(key.get("name"))
+				)
+			}
+
+			log.debug(f"Authorized Sites:  {site_names}")
+
+		except Exception:
+			# Update Status Bar and Progress Bar
+			warning_callback.emit("Failed to identify authorized Sites!")
+			log.error("Failed to identify any authorized Sites!")
+			return None
+
+		return site_names
+
+
+	def populate_sites(self, site_names, finished_callback, warning_callback):
+		"""
+		A helper function that lists the authorized Sites in the Site ComboBox.
+
+		Args:
+			site_names:  Names of the authorized Sites (set)
+			finished_callback:  A callback function to update the progress and status bars
+			warning_callback:  A callback function to update the progress and status bars
+		"""
+
+		# Add an empty value to the beginning
+		self.site_names = { "" } | site_names
+
+		if len(self.site_names) > 1:
+
+			selected_site = self.selected_combo_box_value(self.combo_sites)
+
+			# Enable the Site ComboBox, clear it,and add the Site names
+			self.combo_sites.setEnabled(True)
+			self.combo_sites.clear()
+			self.combo_sites.addItems(sorted(self.site_names))
+
+			# Keep the Site that was selected
+			if selected_site in self.site_names:
+				self.combo_sites.setCurrentText(selected_site)
+
+			# Update Status Bar and Progress Bar
+			finished_callback.emit("Sites populated")
+
+			# Enable Buttons
+			self.button_get_printers.setEnabled(True)
+
+		else:
+
+			# Remove any Sites shown from the cache, e.g. if access was revoked since
+			self.combo_sites.clear()
+			self.combo_sites.setEnabled(False)
+			self.button_get_printers.setEnabled(False)
+
+			# Update Status Bar and Progress Bar
+			warning_callback.emit("User is not authorized for any Sites.")
+			log.warning("User is not authorized for any Sites.")
+
+
+	def clear_api_token(self):
+		"""
+		Handles clearing the API Token when the Clear API Token Action is selected
+		"""
+
+		self.site_admin_account.update({ "api_token": None, "api_token_expires": None })
+
+
+	def sync_jps_printer_model(self):
+		"""
+		Updates the JPS printer model from a snapshot of the JPS printers, if they changed
+		"""
+
+		with self.registry_lock:
+
+			if not self.jps_printers_changed:
+				return
+
+			self.jps_printers_changed = False
+			printers = list(self.jps_printer_list)
+
+		self.jps_printer_model.set_printers(printers)
+		self.populate_printer_combo_box()
+
+
+	def populate_printer_combo_box(self):
+		"""
+		Handles updating the JPS Printer ComboBox by repopulating the values when the Site
+		combobox value is changed
+		"""
+
+		# Show the selected Site's printers
+		self.jps_printer_proxy.set_site(self.selected_combo_box_value(self.combo_sites) or "")
+		self.combo_printers.setEnabled(self.jps_printer_model.rowCount() > 0)
+
+		# Run the function to update the extended GUI
+		self.display_printer_details()
+
+
+	def button_handler(self):
+		"""
+		Handles enabling the Create, Update, and Delete Buttons depending on if local printers
+		exist and when the JPS Printer ComboBox has a non-null selected value
+		"""
+
+		# Create Button
+		try:
+
+			# Get the selected values
+			selected_site = self.selected_combo_box_value(self.combo_sites)
+			selected_local_printers = self.selected_list_values(self.qlist_local_printers)
+
+			if selected_site and selected_local_printers:
+
+				# Local printers exist, enabling button
+				self.button_create_printers.setEnabled(True)
+
+			else:
+
+				# Local printers do not exist, disabling button
+				self.button_create_printers.setEnabled(False)
+
+		except Exception:
+			pass
+
+		# Update and Delete Buttons
+		try:
+
+			# Get the current value of the combobox
+			selected_printer = self.selected_combo_box_value(self.combo_printers)
+
+			if selected_printer:
+
+				# Printer selected, enabling buttons
+				self.button_update_printer.setEnabled(True)
+				self.button_delete_printer.setEnabled(True)
+
+			else:
+
+				# Printer is not selected, disabling buttons
+				self.button_update_printer.setEnabled(False)
+				self.button_delete_printer.setEnabled(False)
+
+		except Exception:
+			pass
+
+		# Compare PPD Button
+		try:
+
+			self.button_compare_ppd.setEnabled(
+				bool(self.selected_combo_box_value(self.combo_printers))
+				and self.selected_list_value(self.qlist_local_printers) is not None
+			)
+
+		except Exception:
+			pass
+
+
+	def state_path(self, operation, *parts, extension = "journal"):
+		"""Helper function to build the path of a file used to persist an operation's state.
+
+		Args:
+			operation (str): Name of the operation
+			*parts (str): Values that identify this run of the operation
+			extension (str, optional): File extension. Defaults to "journal".
+
+		Returns:
+			str: Path within the state directory
+		"""
+
+		key = hashlib.sha256("|".join(map(str, parts)).encode("utf-8")).hexdigest()[:16]
+
+		return os.path.join(
+			os.path.expanduser(self.settings.get("state_directory")),
+			f"{operation}-{key}.{extension}"
+		)
+
+
+	def log_api_metrics(self):
+		"""
+		Helper function to log a summary of the API activity counters
+		"""
+
+		metrics = self.api_metrics.snapshot()
+
+		log.info(
+			f"Received {metrics.get('responses', 0)} responses "
+			f"({metrics.get('responses_gzip', 0)} gzip compressed):  "
+			f"{metrics.get('bytes_on_wire', 0)} bytes on the wire, "
+			f"{metrics.get('bytes_decoded', 0)} bytes decoded"
+		)
+
+		if self.request_hedger:
+			log.info(
+				f"Hedged {metrics.get('hedges_sent', 0)} of {metrics.get('hedge_requests', 0)} "
+				f"requests; hedges won {metrics.get('hedge_wins', 0)} times"
+			)
+
+		if self.response_cache:
+
+			lookups = metrics.get("cache_hits", 0) + metrics.get("cache_misses", 0)
+
+			log.info(
+				f"Response cache answered {metrics.get('cache_hits', 0)} of {lookups} GETs "
+				f"({metrics.get('cache_hits', 0) / max(lookups, 1):.0%}), saving "
+				f"{metrics.get('cache_bytes_saved', 0)} bytes; "
+				f"{metrics.get('cache_evictions', 0)} evicted, "
+				f"{metrics.get('cache_spills', 0)} spilled to disk"
+			)
+
+		if metrics.get("single_flight_hits"):
+			log.info(
+				f"Shared {metrics.get('single_flight_hits', 0)} lookups with identical requests "
+				f"already in flight ({metrics.get('single_flight_calls', 0)} requests sent)"
+			)
+
+		if self.rate_limiter:
+			log.info(
+				f"Rate limiter queued {metrics.get('rate_limit_waits', 0)} requests for "
+				f"{metrics.get('rate_limit_wait_seconds', 0):.2f}s in total; server requested "
+				f"back off {metrics.get('rate_limit_throttled', 0)} times"
+			)
+
+
+	def lock_mutex(self, lock_it):
+		"""Helper function to handle locking and unlocking a mutex.
+
+		Args:
+			lock_it (bool): Wether to lock or unlock a mutex.
+		"""
+
+		if lock_it:
+			log.debug("Locking mutex")
+			self.mutex.lock()
+			log.debug("Waiting for mutex")
+			self.condition.wait(self.mutex)
+
+		log.debug("Unlocking mutex")
+		self.mutex.unlock()
+
+
+	def build_printer_xml_payload(self, **kwargs):
+		"""Helper function to build an XML payload that
+		can be used as a payload for the Jamf Pro API.
+
+		Keyword Args:
+			include_ppd (bool, optional): Whether to include the PPD. Defaults to True.
+
+		Returns:
+			PrinterPayload: An XML request body that is streamed to the API
+		"""
+
+		custom_notes = self.create_custom_printer_notes(
+			kwargs.get("site"),
+			kwargs.get("created"),
+			kwargs.get("created_by"),
+			kwargs.get("updated"),
+			kwargs.get("updated_by")
+		)
+
+		fields = [
+			("id", kwargs.get("id", "")),
+			("name", kwargs.get("display_name")),
+			("category", "Printers"),
+			("uri", kwargs.get("device_uri")),
+			("CUPS_name", kwargs.get("cups_name")),
+			("location", kwargs.get("location")),
+			("model", kwargs.get("model")),
+			("ppd", f"{kwargs.get('cups_name')}.ppd"),
+			("ppd_contents", None),
+			("notes", custom_notes),
+			("ppd_path", kwargs.get("ppd_path"))
+		]
+
+		# The Classic API only updates the elements that are sent,
+		# so an unchanged PPD can be left out of an update
+		if not kwargs.get("include_ppd", True):
+			fields = [ field for field in fields if field[0] not in { "ppd", "ppd_contents" } ]
+
+		# Build the printer payload xml
+		return PrinterPayload(fields = fields, ppd_contents = kwargs.get("ppd_contents"))
+
+
+	def create_custom_printer_notes(self, site: str, created: str = "", created_by: str = "",
+		updated: str = "", updated_by: str = ""):
+		"""A helper function to create the embedded json notes.
+
+		Args:
+			site (str): Site the printer is assigned
+			created (str, optional): Datetime of printer creation. Defaults to "".
+			created_by (str, optional): Admin that created the printer. Defaults to "".
+			updated (str, optional): Datetime the printer was updated. Defaults to "".
+			updated_by (str, optional): Admin that updated the printer. Defaults to "".
+
+		Returns:
+			str: JSON blob to embed in the notes element
+		"""
+
+		custom_notes = {
+			"Site": site,
+			"Created": created,
+			"Created_by": created_by,
+			"Updated": updated,
+			"Updated_by": updated_by
+		}
+
+		return json.dumps(custom_notes)
+
+
+####################################################################################################
+# Classes
+
+class WorkerSignals(QtCore.QObject):
+	"""
+	Defines the signals available from a running worker thread.
+
+	Supported signals are:
+
+	close
+		Close a window
+	confirm
+		`dict` message and details to display in a confirmation prompt, and where to answer
+	error
+		`tuple` (exctype, value, traceback.format_exc() )
+	finished
+		`str` message to display
+	progress
+		`dict` message to display and value to update the progress bar
+	prompt
+		Open the login window
+	result
+		`object` data returned from processing, anything
+	warning
+		`str` message to display
+	"""
+
+	close = QtCore.Signal()
+	confirm = QtCore.Signal(object)
+	error = QtCore.Signal(tuple)
+	finished = QtCore.Signal(str)
+	progress = QtCore.Signal(dict)
+	prompt = QtCore.Signal()
+	result = QtCore.Signal(object)
+	warning = QtCore.Signal(str)
+
+
+class Worker(QtCore.QRunnable):
+	"""
+	Worker thread
+
+	Inherits from QRunnable to handler worker thread setup, signals and wrap-up.
+
+	:param callback:  The function callback to run on this worker thread. Supplied args and
+					 kwargs will be passed through to the runner.
+	:type callback:  function
+	:param args:  Arguments to pass to the callback function
+	:param kwargs:  Keywords to pass to the callback function; "token" is the
+					 CancellationToken of the operation the worker belongs to
+	"""
+
+	def __init__(self, function, *args, **kwargs):
+		super(Worker, self).__init__()
+
+		# Store constructor arguments (re-used for processing)
+		self.function = function
+		self.args = args
+		self.token = kwargs.pop("token", None) or CancellationToken()
+		self.token.retain()
+		self.kwargs = kwargs
+		self.signals = WorkerSignals()
+
+		# Add the callback to our kwargs
+		self.kwargs["progress_callback"] = self.signals.progress
+		self.kwargs["finished_callback"] = self.signals.finished
+		self.kwargs["warning_callback"] = self.signals.warning
+
+
+	@QtCore.Slot()
+	def run(self):
+		"""
+		Initialise the runner function with passed args, kwargs.
+		"""
+
+		# Retrieve args/kwargs here; and fire processing using them
+
+		# Queued workers of a canceled operation end quietly
+		if self.token.cancelled:
+			self.token.release()
+			return
+
+		try:
+
+			with self.token.activate():
+				result = self.function(*self.args, **self.kwargs)
+
+		except OperationCancelled:
+
+			log.info("The operation was canceled")
+			self.signals.finished.emit("Operation canceled")
+
+		except Exception:
+
+			traceback.print_exc()
+			exctype, value = sys.exc_info()[:2]
+			self.signals.error.emit((exctype, value, traceback.format_exc()))
+
+		else:
+
+			# Return the result of the processing
+			self.signals.result.emit(result)
+
+		finally:
+			self.token.release()
+		# finally:
+		#     self.signals.finished.emit()  # Done
+
+
+class PrinterSearchIndex:
+	"""
+	An in-memory search index over the text fields of printers.
+
+	Each printer's fields are broken into trigrams, plus one and two character word prefixes
+	for short searches.  Postings are compact arrays of document numbers; printers that are
+	removed are skipped until the index is compacted.
+	"""
+
+	fields = ("display_name", "cups_name", "location", "device_uri", "model", "created_by")
+
+	def __init__(self):
+
+		self.clear()
+
+
+	def clear(self):
+		"""
+		Empties the index
+		"""
+
+		self.documents = []
+		self.document_ids = {}
+		self.postings = defaultdict(lambda: array("I"))
+		self.removed = 0
+
+
+	@staticmethod
+	def grams(text: str):
+		"""Breaks text into the grams it is indexed by.
+
+		Args:
+			text (str): Case folded text
+		Returns:
+			set: Trigrams and one and two character word prefixes
+		"""
+
+		grams = { text[index:index + 3] for index in range(len(text) - 2) }
+
+		for word in re.split(r"\W+", text):
+			grams.update({ word[:1], word[:2] })
+
+		grams.discard("")
+
+		return grams
+
+
+	def add(self, key, printer):
+		"""Indexes a printer, replacing the printer previously indexed with the same key.
+
+		Args:
+			key (Hashable): Identifies the printer
+			printer (Printer): The printer
+		"""
+
+		text = "\n".join(
+			str(getattr(printer, field, None) or "") for field in self.fields).casefold()
+		document_id = self.document_ids.get(key)
+
+		if document_id is not None:
+
+			# Printers refreshed without changes keep their entry
+			if self.documents[document_id][2] == text:
+				return
+
+			self.remove(key)
+
+		self.insert(key, (printer.display_name or "").casefold(), text)
+
+
+	def insert(self, key, name: str, text: str):
+		"""Adds a document to the index.
+
+		Args:
+			key (Hashable): Identifies the printer
+			name (str): Case folded display name
+			text (str): Case folded text of the indexed fields
+		"""
+
+		document_id = len(self.documents)
+		self.documents.append((key, name, text))
+		self.document_ids[key] = document_id
+
+		for gram in self.grams(text):
+			self.postings[gram].append(document_id)
+
+
+	def remove(self, key):
+		"""Removes a printer from the index.
+
+		Args:
+			key (Hashable): Identifies the printer
+		"""
+
+		document_id = self.document_ids.pop(key, None)
+
+		if document_id is None:
+			return
+
+		self.documents[document_id] = None
+		self.removed += 1
+
+		# Rebuild once most of the postings point at removed printers
+		if self.removed > len(self.document_ids):
+
+			documents = [ document for document in self.documents if document ]
+			self.clear()
+
+			for document in documents:
+				self.insert(*document)
+
+
+	def candidates(self, term: str):
+		"""Finds the smallest posting that every printer matching a search term is in.
+
+		Args:
+			term (str): Case folded search term without whitespace
+		Returns:
+			array: Document numbers
+		"""
+
+		if len(term) < 3:
+			return self.postings.get(term, ())
+
+		return min(
+			(self.postings.get(gram, ()) for gram in self.grams(term) if len(gram) == 3),
+			key = len
+		)
+
+
+	def lookup(self, term: str):
+		"""Finds the printers a search term matches.
+
+		Args:
+			term (str): Case folded search term without whitespace
+		Returns:
+			set: Document numbers of the printers that contain the term, or for terms shorter
+				than three characters, that have a word starting with it
+		"""
+
+		if len(term) < 3:
+			return {
+				document_id for document_id in self.candidates(term)
+				if self.documents[document_id]
+			}
+
+		return {
+			document_id for document_id in self.candidates(term)
+			if self.documents[document_id] and term in self.documents[document_id][2]
+		}
+
+
+	def fuzzy_lookup(self, query: str):
+		"""Finds the printers that share most of the trigrams of a search, to allow for typos.
+
+		Args:
+			query (str): Case folded search
+		Returns:
+			dict: Maps the document number of each matching printer to the share of the
+				search's trigrams it contains
+		"""
+
+		trigrams = {
+			term[index:index + 3] for term in query.split() for index in range(len(term) - 2) }
+
+		if len(trigrams) < 2:
+			return {}
+
+		counts = Counter()
+
+		for gram in trigrams:
+			counts.update(self.postings.get(gram, ()))
+
+		required = math.ceil(len(trigrams) * 0.6)
+
+		return {
+			document_id: count / len(trigrams) for document_id, count in counts.items()
+			if count >= required and self.documents[document_id]
+		}
+
+
+	def search(self, query: str):
+		"""Searches the index.
+
+		Every whitespace separated term of the query must match.  If nothing does, printers
+		that share most of the query's trigrams are returned instead.
+
+		Args:
+			query (str): The search
+		Returns:
+			dict | None:  Maps the key of each matching printer to its rank, which sorts best
+				matches first; None when the query is empty
+		"""
+
+		terms = query.casefold().split()
+
+		if not terms:
+			return None
+
+		matches = None
+
+		# Start with the term that has the fewest candidates and check the printers it
+		# matched for the other terms
+		for term in sorted(terms, key = lambda term: len(self.candidates(term))):
+
+			if matches is None:
+				matches = self.lookup(term)
+
+			elif len(term) < 3:
+				matches &= self.lookup(term)
+
+			else:
+				matches = {
+					document_id for document_id in matches
+					if term in self.documents[document_id][2]
+				}
+
+			if not matches:
+				break
+
+		query = " ".join(terms)
+		similarity = None
+
+		if not matches:
+			similarity = self.fuzzy_lookup(query)
+			matches = similarity.keys()
+
+		ranks = {}
+
+		for document_id in matches:
+
+			key, name, _ = self.documents[document_id]
+
+			if similarity:
+				rank = 4 - similarity[document_id]
+			elif name.startswith(query):
+				rank = 0
+			elif query in name:
+				rank = 1
+			else:
+				rank = 2
+
+			ranks[key] = (rank, name)
+
+		return ranks
+
+
+class PrinterListModel(QtCore.QAbstractListModel):
+	"""
+	A list model of Printer objects.
+
+	Printers can be queued from any thread; they are inserted in batches on the GUI thread,
+	then indexed for searching a slice at a time so large batches don't block the GUI.
+	"""
+
+	SiteRole = QtCore.Qt.UserRole + 1
+	PrinterRole = QtCore.Qt.UserRole + 2
+
+	# Emitted on the GUI thread with each batch of printers added or replaced
+	printers_added = QtCore.Signal(list)
+
+	# Emitted on the GUI thread once every printer added or replaced can be searched for
+	printers_indexed = QtCore.Signal()
+
+	def __init__(
+			self, parent=None, batch_interval: int = 100, key=id, index_budget: float = 0.02):
+		super().__init__(parent)
+
+		self.printers = []
+		self.pending = []
+		self.lock = threading.Lock()
+
+		# A queued printer replaces the row of the printer with the same key
+		self.key = key
+		self.rows = {}
+		self.search_index = PrinterSearchIndex()
+
+		# Inserts queued printers on the GUI thread
+		self.batch_timer = QtCore.QTimer(self)
+		self.batch_timer.timeout.connect(self.insert_pending)
+		self.batch_timer.start(batch_interval)
+
+		# Indexes inserted printers for up to index_budget seconds each time the event loop
+		# is idle
+		self.unindexed = {}
+		self.index_budget = index_budget
+		self.index_timer = QtCore.QTimer(self)
+		self.index_timer.setInterval(0)
+		self.index_timer.timeout.connect(self.index_pending)
+
+
+	def rowCount(self, parent=QtCore.QModelIndex()):
+
+		return 0 if parent.isValid() else len(self.printers)
+
+
+	def data(self, index, role=QtCore.Qt.DisplayRole):
+
+		if not index.isValid():
+			return None
+
+		printer = self.printers[index.row()]
+
+		if role == QtCore.Qt.DisplayRole:
+			return printer.display_name
+
+		if role == self.SiteRole:
+			return printer.site
+
+		if role == self.PrinterRole:
+			return printer
+
+		return None
+
+
+	def enqueue(self, printers: list):
+		"""Queues printers to be added to the model; safe to call from any thread.
+
+		Args:
+			printers (list): Printer objects
+		"""
+
+		with self.lock:
+			self.pending.extend(printers)
+
+
+	def insert_pending(self):
+		"""
+		Adds the queued printers in one batch, replacing printers that are already listed
+		"""
+
+		with self.lock:
+			batch, self.pending = self.pending, []
+
+		new_printers = {}
+
+		for printer in batch:
+
+			self.unindexed[self.key(printer)] = printer
+			row = self.rows.get(self.key(printer))
+
+			if row is None:
+				new_printers[self.key(printer)] = printer
+
+			else:
+				self.printers[row] = printer
+				self.dataChanged.emit(self.index(row), self.index(row))
+
+		if new_printers:
+			self.beginInsertRows(
+				QtCore.QModelIndex(),
+				len(self.printers), len(self.printers) + len(new_printers) - 1
+			)
+
+			for key, printer in new_printers.items():
+				self.rows[key] = len(self.printers)
+				self.printers.append(printer)
+
+			self.endInsertRows()
+
+		if batch:
+			self.printers_added.emit(batch)
+
+		if self.unindexed and not self.index_timer.isActive():
+			self.index_timer.start()
+
+
+	def index_pending(self):
+		"""
+		Indexes inserted printers until the time budget of one pass runs out; the rest are
+		indexed the next time the event loop is idle
+		"""
+
+		deadline = time.monotonic() + self.index_budget
+
+		while self.unindexed and time.monotonic() < deadline:
+			self.search_index.add(*self.unindexed.popitem())
+
+		if not self.unindexed:
+			self.index_timer.stop()
+			self.printers_indexed.emit()
+
+
+	def set_printers(self, printers: list):
+		"""Makes the model match a list of printers by removing and adding only the printers
+		that changed.  Printers that are still queued are kept and inserted as well.
+
+		Args:
+			printers (list): Printer objects
+		"""
+
+		wanted = { self.key(printer): printer for printer in printers }
+
+		# Remove runs of rows from the bottom up, one call per run, so the rows above keep
+		# their positions
+		row = len(self.printers) - 1
+
+		while row >= 0:
+
+			if self.key(self.printers[row]) in wanted:
+				row -= 1
+				continue
+
+			last = row
+
+			while row >= 0 and self.key(self.printers[row]) not in wanted:
+				self.unindexed.pop(self.key(self.printers[row]), None)
+				self.search_index.remove(self.key(self.printers[row]))
+				row -= 1
+
+			self.beginRemoveRows(QtCore.QModelIndex(), row + 1, last)
+			del self.printers[row + 1:last + 1]
+			self.endRemoveRows()
+
+		self.printers = [ wanted.get(self.key(printer)) for printer in self.printers ]
+
+		# Printers whose indexed text did not change are skipped by the index
+		for printer in self.printers:
+			self.unindexed[self.key(printer)] = printer
+
+		self.rows = { self.key(printer): row for row, printer in enumerate(self.printers) }
+		self.enqueue([ printer for key, printer in wanted.items() if key not in self.rows ])
+		self.insert_pending()
+
+		# Printers that remained may have changed, e.g. moved to another Site
+		if self.printers:
+			self.dataChanged.emit(self.index(0), self.index(len(self.printers) - 1))
+
+
+class PrinterFilterProxyModel(QtCore.QSortFilterProxyModel):
+	"""
+	Filters printers by Site and by a search of the model's search index, without
+	rebuilding the underlying model.  Printers are sorted by how well they match the search,
+	then by name.
+	"""
+
+	def __init__(self, source_model: PrinterListModel, parent=None):
+		super().__init__(parent)
+
+		self.site = None
+		self.search = ""
+		self.ranks = None
+		self.setSourceModel(source_model)
+		self.setDynamicSortFilter(True)
+		self.sort(0)
+
+		# Printers added while searching need to be matched against the search once they
+		# are indexed
+		source_model.printers_indexed.connect(self.refresh_search)
+
+
+	def set_site(self, site: Union[str, None]):
+		"""Only shows printers in a Site; None shows every printer.
+
+		Args:
+			site (str | None): The Site
+		"""
+
+		self.site = site
+		self.invalidateFilter()
+
+
+	def set_search(self, search: str):
+		"""Only shows printers that match a search, best matches first.
+
+		Args:
+			search (str): The search string
+		"""
+
+		self.search = search
+		self.ranks = self.sourceModel().search_index.search(search)
+		self.invalidate()
+
+
+	def refresh_search(self):
+		"""
+		Runs the current search again
+		"""
+
+		if self.ranks is not None:
+			self.set_search(self.search)
+
+
+	def accepts(self, printer):
+		"""Checks if a printer passes the Site and search filters.
+
+		Args:
+			printer (Printer): The printer
+		Returns:
+			bool: True if the printer would be shown
+		"""
+
+		if self.site is not None and printer.site != self.site:
+			return False
+
+		return self.ranks is None or self.sourceModel().key(printer) in self.ranks
+
+
+	def filterAcceptsRow(self, source_row, source_parent):
+
+		index = self.sourceModel().index(source_row, 0, source_parent)
+
+		return self.accepts(index.data(PrinterListModel.PrinterRole))
+
+
+	def lessThan(self, left, right):
+
+		if self.ranks is None:
+			return (left.data() or "").casefold() < (right.data() or "").casefold()
+
+		key = self.sourceModel().key
+
+		return (
+			self.ranks.get(key(left.data(PrinterListModel.PrinterRole)), (4, "")) <
+			self.ranks.get(key(right.data(PrinterListModel.PrinterRole)), (4, ""))
+		)
+
+
+class Printer:
+	"""
+	An object to store printer configuration details in
+	"""
+
+	# Fields compared to detect changes between printer configurations
+	compared_fields = {
+		"display_name": "Display Name",
+		"cups_name": "CUPS Name",
+		"location": "Location",
+		"device_uri": "Device URI",
+		"model": "Model",
+		"ppd_contents": "PPD Contents"
+	}
+
+	# Initializer / Instance Attributes
+	def __init__(self, printer_id="local", ppd_contents="", site="", created="", created_by="",
+		updated="", updated_by="", **kwargs):
+
+		self.printer_id = printer_id
+		self.display_name = kwargs.get("display_name")
+		self.cups_name = kwargs.get("cups_name")
+		self.model = kwargs.get("model")
+		self.location = kwargs.get("location")
+		self.device_uri = kwargs.get("device_uri")
+		self.ppd_path = kwargs.get("ppd_path")
+		self.ppd_contents = ppd_contents
+		self._ppd_hash = None
+		self.site = site
+		self.created = created
+		self.created_by = created_by
+		self.updated = updated
+		self.updated_by = updated_by
+
+
+	def __setattr__(self, name, value):
+
+		# Changing the PPD invalidates its hash
+		if name == "ppd_contents":
+			super().__setattr__("_ppd_hash", None)
+
+		super().__setattr__(name, value)
+
+
+	@property
+	def ppd_hash(self):
+		"""SHA-256 hash of the PPD contents, computed once.
+
+		Returns:
+			str: Hex digest of the PPD contents
+		"""
+
+		if self._ppd_hash is None:
+			self._ppd_hash = hashlib.sha256((self.ppd_contents or "").encode("utf-8")).hexdigest()
+
+		return self._ppd_hash
+
+
+	@property
+	def fingerprint(self):
+		"""Hash of the printer's configuration, Site, and notes stamps, e.g. to detect that
+		a printer was changed in Jamf Pro.
+
+		Returns:
+			str: Hex digest
+		"""
+
+		values = [ getattr(self, field) or "" for field in self.compared_fields ]
+		values[list(self.compared_fields).index("ppd_contents")] = self.ppd_hash
+		values.extend((self.site, self.updated, self.updated_by))
+
+		return hashlib.sha256("\0".join(map(str, values)).encode("utf-8")).hexdigest()
+
+
+	def differences(self, other):
+		"""Compares this printer's configuration to another printer's.
+
+		The PPDs are compared by their hashes rather than their contents.
+
+		Args:
+			other (Printer): The printer to compare against
+
+		Returns:
+			dict: Fields that differ with the (other printer's, this printer's) values
+		"""
+
+		changes = {}
+
+		for field in self.compared_fields:
+
+			if field == "ppd_contents":
+				if self.ppd_hash != other.ppd_hash:
+					changes[field] = (other.ppd_hash, self.ppd_hash)
+
+			elif (getattr(self, field) or "") != (getattr(other, field) or ""):
+				changes[field] = (getattr(other, field) or "", getattr(self, field) or "")
+
+		return changes
+
+
+	@staticmethod
+	def requires_ppd(changes: dict):
+		"""Checks if an update has to send the PPD.
+
+		The PPD's name in Jamf Pro follows the CUPS name, so it is sent for either.
+
+		Args:
+			changes (dict): Fields that differ, as returned by differences()
+
+		Returns:
+			bool: True if the PPD is sent with the update
+		"""
+
+		return not changes.keys().isdisjoint({ "ppd_contents", "cups_name" })
+
+
+	@classmethod
+	def from_jps_record(cls, record: dict):
+		"""Creates a Printer object from a Jamf Pro printer record.
+
+		Args:
+			record (dict): Printer record as normalized by a PrinterCodec
+
+		Returns:
+			Printer: A Printer object
+		"""
+
+		# Doing some hackery to get custom details
+		try:
+			embedded_json = json.loads(record.get("notes"))
+		except Exception:
+			embedded_json = {}
+
+		return cls(
+			printer_id = record.get("id"),
+			display_name = record.get("name"),
+			cups_name = record.get("CUPS_name"),
+			location = record.get("location"),
+			device_uri = record.get("uri"),
+			model = record.get("model"),
+			ppd_path = record.get("ppd"),
+			ppd_contents = record.get("ppd_contents"),
+			site = embedded_json.get("Site", "unassigned"),
+			created = embedded_json.get("Created", "unknown"),
+			created_by = embedded_json.get("Created_by", "unknown"),
+			updated = embedded_json.get("Updated", "unknown"),
+			updated_by = embedded_json.get("Updated_by", "unknown")
+		)
+
+
+	def __repr__(self):
+		return str(self.display_name)
+
+
+	def __str__(self):
+		return str(self.display_name)
+
+
+class ExecuteProcess:
+	"""
+	A class that allows running an external program and returning the results.
+
+	Can also be used as a Context Manager."""
+
+	def __init__(self, program: str, args: list, **kwargs):
+
+		self.program = program
+		self.args = args
+		log.debug(f"Executing external program `{self.program}` with the parameters `{self.args}`")
+
+		self.execute = QtCore.QProcess()
+		self.execute.readyReadStandardOutput.connect(self.handle_stdout)
+		self.execute.readyReadStandardError.connect(self.handle_stderr)
+		self.execute.stateChanged.connect(self.handle_state)
+		self.execute.finished.connect(self.process_finished)  # Clean up once complete.
+		self.results_stdout = ""
+		self.results_stderr = ""
+
+
+	def __enter__(self):
+		"""Context Manager method to start execution of external program
+
+		Returns:
+			dict:  A dictionary of results
+		"""
+
+		self.execute.start(self.program, self.args)
+		self.execute.waitForFinished()
+
+		return {
+			"status": self.execute.exitCode(),
+			"stderr": (self.results_stderr).strip() if self.results_stderr != "" else None,
+			"stdout": (self.results_stdout).strip(),
+			"success": self.execute.exitCode() == 0
+		}
+
+	def __exit__(self, exc_type, exc_value, exc_traceback):
+		"""Context Manager method to handle exiting."""
+
+		self.process_finished()
+
+
+	def handle_stderr(self):
+		data = self.execute.readAllStandardError()
+		stderr = bytes(data).decode("utf8")
+		self.results_stderr = f"{self.results_stderr}{stderr}"
+
+
+	def handle_stdout(self):
+		data = self.execute.readAllStandardOutput()
+		stdout = bytes(data).decode("utf8")
+		self.results_stdout = f"{self.results_stdout}{stdout}"
+
+
+	def handle_state(self, state):
+		states = {
+			QtCore.QProcess.NotRunning: 'Not running',
+			QtCore.QProcess.Starting: 'Starting',
+			QtCore.QProcess.Running: 'Running',
+		}
+		state_name = states[state]
+
+
+	def process_finished(self):
+		pass
+
+
+class PrinterPayload:
+	"""
+	A printer's XML payload for the Classic API that is streamed into the request body.
+
+	Every field is escaped and the PPD is escaped and encoded in chunks, so a large PPD is
+	never copied into one escaped string.  The PPD sent is the in-memory copy that was read
+	at startup, i.e. the same contents that were hashed and compared.  The payload is sized,
+	allowing requests to send a Content-Length, and can be iterated again if the request is
+	retried.
+	"""
+
+	chunk_size = 64 * 1024
+
+	# Carriage returns are sent as character references since XML parsers would otherwise
+	# turn CRLF line endings into LF
+	ppd_entities = { "\r": "&#13;" }
+
+
+	def __init__(self, fields: list, ppd_contents: Union[str, None] = None):
+		"""
+		Args:
+			fields (list): (element, value) tuples in the order they are sent; the value of
+				the `ppd_contents` element is ignored and streamed from ppd_contents instead
+			ppd_contents (str | None, optional): PPD contents. Defaults to None.
+		"""
+
+		self.fields = fields
+		self.ppd_contents = ppd_contents or ""
+		self.length = None
+
+
+	def ppd_chunks(self):
+		"""Yields the PPD contents in chunks.
+
+		Yields:
+			str: A chunk of the PPD contents
+		"""
+
+		for start in range(0, len(self.ppd_contents), self.chunk_size):
+			yield self.ppd_contents[start:start + self.chunk_size]
+
+
+	@staticmethod
+	def field(element: str, value):
+		"""Encodes a field other than the PPD contents.
+
+		Args:
+			element (str): Name of the element
+			value: Value of the element
+
+		Returns:
+			bytes: The element
+		"""
+
+		value = escape("" if value is None else str(value))
+
+		return f"<{element}>{value}</{element}>".encode("utf-8")
+
+
+	def ppd_length(self):
+		"""Counts the bytes of the escaped and encoded PPD contents without escaping them.
+
+		Returns:
+			int: Length of the PPD contents in the payload
+		"""
+
+		if self.ppd_contents.isascii():
+			length = len(self.ppd_contents)
+		else:
+			length = sum(len(chunk.encode("utf-8")) for chunk in self.ppd_chunks())
+
+		# Each escaped character is replaced by its entity
+		return length + sum(
+			self.ppd_contents.count(character)
+			* (len(escape(character, self.ppd_entities)) - 1)
+			for character in ("&", "<", ">", *self.ppd_entities)
+		)
+
+
+	def __iter__(self):
+
+		yield b"<printer>"
+
+		for element, value in self.fields:
+
+			if element == "ppd_contents":
+
+				yield b"<ppd_contents>"
+
+				for chunk in self.ppd_chunks():
+					yield escape(chunk, self.ppd_entities).encode("utf-8")
+
+				yield b"</ppd_contents>"
+
+			else:
+				yield self.field(element, value)
+
+		yield b"</printer>"
+
+
+	def __len__(self):
+
+		# The PPD is counted rather than escaped and encoded a second time
+		if self.length is None:
+			self.length = len(b"<printer></printer>") + sum(
+				len(b"<ppd_contents></ppd_contents>") + self.ppd_length()
+				if element == "ppd_contents" else len(self.field(element, value))
+				for element, value in self.fields
+			)
+
+		return self.length
+
+
+class PrinterCodec(ABC):
+	"""
+	Parses Classic API printer responses into plain Python values.
+
+	Every codec normalizes a printer record into the same dict of strings, keyed by the
+	Classic API's element names, so that there is a single path into a Printer object.
+	"""
+
+	content_type = None
+	fields = (
+		"id", "name", "category", "uri", "CUPS_name", "location",
+		"model", "info", "notes", "ppd", "ppd_path", "ppd_contents"
+	)
+
+
+	@abstractmethod
+	def printer_ids(self, content: bytes):
+		"""Parses the list of all printers.
+
+		Args:
+			content (bytes): Response body of the printers endpoint
+
+		Returns:
+			list: Printer IDs as strings
+		"""
+
+
+	@abstractmethod
+	def printer_record(self, content: bytes):
+		"""Parses a single printer's details.
+
+		Args:
+			content (bytes): Response body of the printers by id endpoint
+
+		Returns:
+			dict: Normalized printer record
+		"""
+
+
+class XmlPrinterCodec(PrinterCodec):
+	"""
+	Parses the Classic API's XML representation
+	"""
+
+	content_type = "xml"
+
+
+	def printer_ids(self, content: bytes):
+
+		printers = ElementTree.fromstring(content).iter("printer")
+
+		return [ printer.findtext("id") for printer in printers ]
+
+
+	def printer_record(self, content: bytes):
+
+		printer = ElementTree.fromstring(content)
+
+		return { field: printer.findtext(field) or "" for field in self.fields }
+
+
+class JsonPrinterCodec(PrinterCodec):
+	"""
+	Parses the Classic API's JSON representation
+	"""
+
+	content_type = "json"
+
+
+	def printer_ids(self, content: bytes):
+
+		return [ str(printer.get("id")) for printer in json.loads(content).get("printers", []) ]
+
+
+	def printer_record(self, content: bytes):
+
+		printer = json.loads(content).get("printer", {})
+
+		return {
+			field: "" if printer.get(field) is None else str(printer.get(field))
+			for field in self.fields
+		}
+
+
+PRINTER_CODECS = { codec.content_type: codec for codec in (XmlPrinterCodec(), JsonPrinterCodec()) }
+
+
+class PPDIndex:
+	"""
+	Metadata parsed from PPDs, kept by PPD hash so each unique PPD is only parsed once, and
+	the printers that use each PPD
+	"""
+
+	def __init__(self):
+
+		self.metadata = {}
+		self.printers = {}
+
+
+	def update(self, inventories: dict, map_function = map):
+		"""Indexes the printers of each inventory, parsing the PPDs that are not indexed yet.
+
+		Args:
+			inventories (dict): Maps the name of an inventory, e.g. "Local", to its printers
+			map_function (callable, optional): Applies a function to a list of items and
+				returns the results in order; used to parse PPDs in parallel. Defaults to map.
+
+		Returns:
+			int: Number of PPDs parsed
+		"""
+
+		printers = defaultdict(list)
+		samples = {}
+
+		for inventory, inventory_printers in inventories.items():
+			for printer in inventory_printers:
+				printers[printer.ppd_hash].append((inventory, printer))
+				samples.setdefault(printer.ppd_hash, printer)
+
+		new_hashes = [ ppd_hash for ppd_hash in samples if ppd_hash not in self.metadata ]
+		parsed = map_function(
+			lambda ppd_hash: parse_ppd_metadata(samples.get(ppd_hash).ppd_contents or ""),
+			new_hashes
+		)
+
+		# Only keep the metadata of PPDs that are still in use
+		metadata = { ppd_hash: self.metadata.get(ppd_hash) for ppd_hash in samples }
+		metadata.update(zip(new_hashes, (result or {} for result in parsed)))
+		self.metadata = metadata
+		self.printers = printers
+
+		return len(new_hashes)
+
+
+	def query(self, driver: str = "*", version_below: Union[str, None] = None):
+		"""Finds the printers using a driver.
+
+		Args:
+			driver (str, optional): Wildcard pattern matched, ignoring case, against the
+				manufacturer, model name, nickname, PC file name, and CUPS filter programs of
+				each PPD. Defaults to "*".
+			version_below (str | None, optional): Only include PPDs whose `*FileVersion` is
+				lower, or unknown. Defaults to None.
+
+		Returns:
+			list: A dict per printer
+		"""
+
+		driver = driver.casefold()
+		results = []
+
+		for ppd_hash, metadata in self.metadata.items():
+
+			filters = metadata.get("cupsFilter", []) + metadata.get("cupsFilter2", [])
+			names = [
+				metadata.get("Manufacturer"),
+				metadata.get("ModelName"),
+				metadata.get("NickName"),
+				metadata.get("PCFileName"),
+				# Filters are listed as "<source type> [<destination type>] <cost> <program>"
+				*(
+					os.path.basename(cups_filter.split()[-1])
+					for cups_filter in filters if cups_filter.split()
+				)
+			]
+
+			if not any(fnmatch.fnmatch(name.casefold(), driver) for name in names if name):
+				continue
+
+			file_version = metadata.get("FileVersion")
+
+			if (
+				version_below and file_version
+				and version_key(file_version) >= version_key(version_below)
+			):
+				continue
+
+			for inventory, printer in self.printers.get(ppd_hash, []):
+				results.append({
+					"printer": printer.display_name,
+					"status": inventory,
+					"details": (
+						f"{metadata.get('NickName') or metadata.get('ModelName') or 'Unknown'}, "
+						f"version {file_version or 'unknown'}"
+					),
+					"site": printer.site,
+					"manufacturer": metadata.get("Manufacturer", ""),
+					"model_name": metadata.get("ModelName", ""),
+					"nickname": metadata.get("NickName", ""),
+					"file_version": file_version or "",
+					"filters": "; ".join(filters),
+					"ppd_hash": ppd_hash
+				})
+
+		return sorted(results, key = lambda result: (result.get("status"), result.get("printer")))
+
+
+class OperationCancelled(Exception):
+	"""
+	Raised inside a worker once its operation has been canceled
+	"""
+
+
+class CancellationToken:
+	"""
+	Cooperative cancellation of one operation and every worker it starts.
+
+	Workers check the token between steps, waits on it end as soon as it is canceled, and
+	canceling closes the HTTP sessions and responses that are still in flight.  The token of
+	the operation a thread is working on is available from CancellationToken.current().
+	"""
+
+	_local = threading.local()
+
+	def __init__(self):
+
+		self.event = threading.Event()
+		self.lock = threading.Lock()
+		self.workers = 0
+		self.in_flight = set()
+		self.callbacks = []
+
+
+	@classmethod
+	def current(cls):
+		"""
+		Returns:
+			CancellationToken: The token of the operation this thread is working on
+		"""
+
+		return getattr(cls._local, "token", None) or NEVER_CANCELED
+
+
+	@contextmanager
+	def activate(self):
+		"""
+		Makes this the token of the operation the current thread is working on
+		"""
+
+		previous = getattr(self._local, "token", None)
+		self._local.token = self
+
+		try:
+			yield self
+		finally:
+			self._local.token = previous
+
+
+	@property
+	def cancelled(self):
+		"""bool: Whether the operation has been canceled"""
+
+		return self.event.is_set()
+
+
+	@property
+	def active(self):
+		"""bool: Whether any worker of the operation is queued or running"""
+
+		return self.workers > 0 and not self.cancelled
+
+
+	def retain(self):
+		"""
+		Records that a worker of the operation was queued
+		"""
+
+		with self.lock:
+			self.workers += 1
+
+
+	def release(self):
+		"""
+		Records that a worker of the operation has finished
+		"""
+
+		with self.lock:
+			self.workers -= 1
+
+
+	def cancel(self):
+		"""
+		Cancels the operation and closes anything it still has in flight
+		"""
+
+		with self.lock:
+
+			if self.event.is_set():
+				return
+
+			self.event.set()
+			in_flight, self.in_flight = self.in_flight, set()
+			callbacks, self.callbacks = self.callbacks, []
+
+		for resource in in_flight:
+			try:
+				resource.close()
+			except Exception:
+				pass
+
+		for callback in callbacks:
+			callback()
+
+
+	def check(self):
+		"""
+		Raises OperationCancelled if the operation has been canceled
+		"""
+
+		if self.cancelled:
+			raise OperationCancelled()
+
+
+	def sleep(self, seconds: float):
+		"""Waits, ending early if the operation is canceled.
+
+		Args:
+			seconds (float): Seconds to wait
+		"""
+
+		if self.event.wait(seconds):
+			raise OperationCancelled()
+
+
+	@contextmanager
+	def on_cancel(self, callback):
+		"""Calls a function if the operation is canceled while the block runs; the function
+		is no longer registered once the block ends.
+
+		Args:
+			callback (callable): The function
+		"""
+
+		with self.lock:
+
+			registered = not self.event.is_set()
+
+			if registered:
+				self.callbacks.append(callback)
+
+		if not registered:
+			callback()
+
+		try:
+			yield
+		finally:
+			with self.lock:
+				if callback in self.callbacks:
+					self.callbacks.remove(callback)
+
+
+	@contextmanager
+	def track(self, resource):
+		"""Closes a session or response if the operation is canceled while it is in use.
+
+		Args:
+			resource: An object with a close() method
+		"""
+
+		with self.lock:
+			self.in_flight.add(resource)
+
+		try:
+			self.check()
+			yield resource
+		finally:
+			with self.lock:
+				self.in_flight.discard(resource)
+
+
+# Used by threads that are not working on a cancelable operation
+NEVER_CANCELED = CancellationToken()
+
+
+class OperationJournal:
+	"""
+	Write-ahead journal of a bulk operation.
+
+	The planned steps are recorded before any request is sent, each step is recorded again
+	before its API mutation and once more with its outcome.  Every entry is synced to disk,
+	so an interrupted run can be resumed or reported on without replaying completed steps.
+
+	A journal belongs to a single run:  new runs are started with OperationJournal.start(),
+	which discards the journal of an earlier run of the same operation instead of merging
+	its steps into the new run.
+	"""
+
+	def __init__(self, path: str, description: str = ""):
+
+		self.path = path
+		self.lock = threading.Lock()
+		self.description = description
+		self.opened = None
+		self.steps = {}
+		self.started = set()
+		self.outcomes = {}
+
+		if os.path.exists(self.path):
+
+			with open(self.path, "r", encoding="utf-8") as journal:
+
+				for line in journal:
+
+					try:
+						entry = json.loads(line)
+					except json.JSONDecodeError:
+						# A partially written last entry; the step is treated as not finished
+						continue
+
+					self.replay(entry)
+
+
+	@classmethod
+	def start(cls, path: str, description: str = ""):
+		"""Starts a new run of an operation.
+
+		The journal of an earlier run with the same path is discarded, so that its steps are
+		neither merged into this run (without being previewed) nor skipped as completed.
+
+		Args:
+			path (str): Path of the journal
+			description (str, optional): Description of the operation. Defaults to "".
+
+		Returns:
+			OperationJournal: An empty journal
+		"""
+
+		previous = cls(path)
+
+		if previous.pending():
+			log.info(f"Discarding the unfinished journal of:  {previous.description}")
+
+		previous.remove()
+
+		return cls(path, description)
+
+
+	def replay(self, entry: dict):
+		"""Applies a journal entry to the in-memory state.
+
+		Args:
+			entry (dict): The journal entry
+		"""
+
+		event = entry.get("event")
+		key = entry.get("key")
+
+		if event == "open":
+			self.description = entry.get("description", self.description)
+			self.opened = entry.get("time")
+
+		elif event == "plan":
+			self.steps[key] = entry.get("step")
+
+		elif event == "begin":
+			self.started.add(key)
+			# The outcome of an earlier attempt no longer applies
+			self.outcomes.pop(key, None)
+
+		elif event == "finish":
+			self.outcomes[key] = entry.get("result")
+
+
+	def write(self, entries: list):
+		"""Appends entries to the journal and syncs them to disk.
+
+		Args:
+			entries (list): Journal entries (dict)
+		"""
+
+		with self.lock:
+
+			os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+			with open(self.path, "a", encoding="utf-8") as journal:
+				journal.writelines(f"{json.dumps(entry)}\n" for entry in entries)
+				journal.flush()
+				os.fsync(journal.fileno())
+
+			for entry in entries:
+				self.replay(entry)
+
+
+	def plan(self, steps: list):
+		"""Records the steps of the operation that are not already in the journal.
+
+		Args:
+			steps (list): Steps built by journal_step (dict)
+		"""
+
+		entries = [] if self.opened else [ {
+			"event": "open",
+			"description": self.description,
+			"time": get_timestamp(datetime.now())
+		} ]
+
+		entries.extend(
+			{ "event": "plan", "key": step.get("key"), "step": step }
+			for step in steps
+			if step.get("key") not in self.steps
+		)
+
+		if entries:
+			self.write(entries)
+
+
+	def begin(self, step: dict):
+		"""Records that a step's API request is about to be sent.
+
+		Args:
+			step (dict): The step
+		"""
+
+		self.write([ { "event": "begin", "key": step.get("key") } ])
+
+
+	def finish(self, step: dict, result: dict):
+		"""Records the outcome of a step, including the ID of any printer it created.
+
+		Args:
+			step (dict): The step
+			result (dict): The outcome of the step
+		"""
+
+		self.write([ { "event": "finish", "key": step.get("key"), "result": result } ])
+
+
+	@property
+	def completed(self):
+		"""set: Keys of the steps that finished; failed steps are retried when resumed"""
+
+		return {
+			key for key, result in self.outcomes.items() if result.get("status") != "Failed" }
+
+
+	def pending(self):
+		"""
+		Returns:
+			list: Planned steps that have not completed
+		"""
+
+		completed = self.completed
+
+		return [ step for key, step in self.steps.items() if key not in completed ]
+
+
+	def state(self, key: str):
+		"""Describes how far a step got.
+
+		Args:
+			key (str): Key of the step
+
+		Returns:
+			str: The status of the step's outcome, "Interrupted", or "Not Started"
+		"""
+
+		if key in self.outcomes:
+			return self.outcomes[key].get("status")
+
+		return "Interrupted" if key in self.started else "Not Started"
+
+
+	def report(self):
+		"""
+		Returns:
+			str: A line for each step with how far it got
+		"""
+
+		return "\n".join(
+			f"[{self.state(key)}]  {step.get('action').title()} {step.get('printer')}"
+			for key, step in self.steps.items()
+		)
+
+
+	def remove(self):
+		"""
+		Deletes the journal once the operation has fully completed or is discarded
+		"""
+
+		with self.lock:
+
+			if os.path.exists(self.path):
+				os.remove(self.path)
+
+
+	@classmethod
+	def find(cls, directory: str):
+		"""Loads the journals of operations that did not complete.
+
+		Args:
+			directory (str): The state directory
+
+		Returns:
+			list: OperationJournal objects with pending steps, oldest first
+		"""
+
+		if not os.path.isdir(directory):
+			return []
+
+		journals = [
+			cls(os.path.join(directory, file_name))
+			for file_name in sorted(
+				os.listdir(directory),
+				key = lambda file_name: os.path.getmtime(os.path.join(directory, file_name))
+			)
+			if file_name.endswith(".journal")
+		]
+
+		return [ journal for journal in journals if journal.pending() ]
+
+
+class ConsoleCallback:
+	"""
+	Stands in for a worker signal when running without the GUI; messages are logged
+	"""
+
+	def emit(self, message=None):
+
+		if isinstance(message, dict):
+			log.debug(message.get("msg"))
+		elif message:
+			log.info(message)
+
+
+class ApiMetrics:
+	"""
+	Thread safe counters used to report on Jamf Pro API activity
+	"""
+
+	def __init__(self):
+
+		self.lock = threading.Lock()
+		self.counters = {}
+
+
+	def increment(self, name: str, amount: Union[int, float] = 1):
+		"""Increments a named counter.
+
+		Args:
+			name (str): Name of the counter
+			amount (int | float, optional): Value to add to the counter. Defaults to 1.
+		"""
+
+		with self.lock:
+			self.counters[name] = self.counters.get(name, 0) + amount
+
+
+	def get(self, name: str):
+		"""Returns the current value of a named counter.
+
+		Args:
+			name (str): Name of the counter
+
+		Returns:
+			int | float: Value of the counter
+		"""
+
+		with self.lock:
+			return self.counters.get(name, 0)
+
+
+	def snapshot(self):
+		"""Returns a copy of all counters.
+
+		Returns:
+			dict: Counter names and their values
+		"""
+
+		with self.lock:
+			return dict(self.counters)
+
+
+class SingleFlight:
+	"""
+	Collapses concurrent calls for the same key into one call; callers that arrive while it
+	is in flight wait for it and share its result
+	"""
+
+	def __init__(self, metrics: Union[ApiMetrics, None] = None):
+
+		self.lock = threading.Lock()
+		self.calls = {}
+		self.metrics = metrics or ApiMetrics()
+
+
+	def do(self, key, function):
+		"""Calls a function unless a call for the same key is already in flight.
+
+		Args:
+			key: Identifies the call, e.g. the endpoint and ID being requested
+			function (callable): Makes the call
+
+		Returns:
+			The result of the call
+		"""
+
+		while True:
+
+			with self.lock:
+
+				call = self.calls.get(key)
+
+				if leader := call is None:
+					call = self.calls[key] = { "done": threading.Event() }
+
+			if leader:
+				break
+
+			self.metrics.increment("single_flight_hits")
+
+			# Wait for the call in flight, unless this caller's operation is canceled
+			while not call.get("done").wait(0.1):
+				CancellationToken.current().check()
+
+			if not isinstance(call.get("error"), OperationCancelled):
+
+				if "error" in call:
+					raise call.get("error")
+
+				return call.get("result")
+
+			# The call was canceled by another operation; make it again
+
+		self.metrics.increment("single_flight_calls")
+
+		try:
+			call["result"] = function()
+
+		except Exception as error:
+			call["error"] = error
+			raise
+
+		finally:
+
+			with self.lock:
+				del self.calls[key]
+
+			call.get("done").set()
+
+		return call.get("result")
+
+
+class CachedResponse:
+	"""
+	A response served from the ResponseCache; provides the parts of a requests.Response
+	that the application uses
+	"""
+
+	def __init__(self, status_code: int, content: bytes, headers: dict):
+
+		self.status_code = status_code
+		self.content = content
+		self.headers = headers
+
+
+	@property
+	def text(self):
+		"""str: The content of the response"""
+
+		return self.content.decode("utf-8", errors="replace")
+
+
+	def json(self):
+		"""
+		Returns:
+			The content of the response parsed as JSON
+		"""
+
+		return json.loads(self.content)
+
+
+class ResponseCache:
+	"""
+	Caches successful GET responses in memory, bounded in size with least recently used
+	eviction; evicted responses can spill to disk.  Lists expire sooner than individual
+	records and any write to a resource invalidates what is cached for it.
+
+	Each endpoint has a generation that invalidating it bumps, so a GET that was sent before
+	a write, but answered after it, is not cached.
+	"""
+
+	def __init__(self, max_bytes: int = 32 * 1024 * 1024, list_ttl: float = 30,
+		detail_ttl: float = 300, spill_directory: Union[str, None] = None,
+		spill_max_bytes: int = 0, metrics: Union[ApiMetrics, None] = None):
+
+		self.max_bytes = max_bytes
+		self.list_ttl = list_ttl
+		self.detail_ttl = detail_ttl
+		self.spill_directory = spill_directory if spill_max_bytes > 0 else None
+		self.spill_max_bytes = spill_max_bytes
+		self.metrics = metrics or ApiMetrics()
+		self.lock = threading.Lock()
+
+		# key:  (expires, CachedResponse)
+		self.entries = OrderedDict()
+		self.size = 0
+
+		# key:  (expires, path, size)
+		self.spilled = OrderedDict()
+		self.spilled_size = 0
+
+		# endpoint:  times it was invalidated
+		self.generations = defaultdict(int)
+
+		if self.spill_directory:
+
+			# Spilled responses from a previous session are not trusted
+			shutil.rmtree(self.spill_directory, ignore_errors=True)
+			os.makedirs(self.spill_directory, exist_ok=True)
+
+
+	def ttl(self, endpoint: str):
+		"""
+		Returns:
+			float: Seconds a response from the endpoint is kept
+		"""
+
+		return self.detail_ttl if "/id/" in endpoint else self.list_ttl
+
+
+	def get(self, key: tuple):
+		"""Looks up a cached response.
+
+		Args:
+			key (tuple): The account scope, endpoint, and content type of the request
+
+		Returns:
+			CachedResponse | None: The response, or None if it is not cached or has expired
+		"""
+
+		now = time.monotonic()
+
+		with self.lock:
+
+			if key in self.entries:
+
+				expires, response = self.entries.get(key)
+
+				if expires > now:
+					self.entries.move_to_end(key)
+					self.metrics.increment("cache_hits")
+					self.metrics.increment("cache_bytes_saved", len(response.content))
+					return response
+
+				self.discard(key)
+
+			elif key in self.spilled:
+
+				expires, path, _ = self.spilled.get(key)
+				response = self.read_spilled(path) if expires > now else None
+				self.discard(key)
+
+				if response:
+					self.store(key, expires, response)
+					self.metrics.increment("cache_hits")
+					self.metrics.increment("cache_bytes_saved", len(response.content))
+					return response
+
+			self.metrics.increment("cache_misses")
+
+
+	def generation(self, endpoint: str):
+		"""
+		Returns:
+			int: The endpoint's generation, to pass to put() once its response arrives
+		"""
+
+		with self.lock:
+			return self.generations.get(endpoint, 0)
+
+
+	def put(self, key: tuple, response, generation: Union[int, None] = None):
+		"""Caches a response.
+
+		Args:
+			key (tuple): The account scope, endpoint, and content type of the request
+			response (requests.Response): The response
+			generation (int | None, optional): The endpoint's generation when the request
+				was sent; the response is dropped if the endpoint was invalidated since.
+				Defaults to None.
+		"""
+
+		if response.status_code != 200 or len(response.content) > self.max_bytes:
+			return
+
+		cached = CachedResponse(
+			response.status_code,
+			response.content,
+			{ "Content-Type": response.headers.get("Content-Type") }
+		)
+
+		with self.lock:
+
+			if generation is not None and generation != self.generations.get(key[1], 0):
+				self.metrics.increment("cache_stale_drops")
+				return
+
+			self.discard(key)
+			self.store(key, time.monotonic() + self.ttl(key[1]), cached)
+
+
+	def invalidate(self, endpoint: str):
+		"""Drops what is cached for a resource and the list it belongs to.
+
+		Args:
+			endpoint (str): The endpoint that was written to
+		"""
+
+		collection = endpoint.split("/id/")[0]
+
+		with self.lock:
+
+			self.generations[endpoint] += 1
+			self.generations[collection] += 1
+
+			for key in [
+				key
+				for key in list(self.entries) + list(self.spilled)
+				if key[1] in { endpoint, collection }
+			]:
+				self.discard(key)
+
+
+	def store(self, key: tuple, expires: float, response: CachedResponse):
+		"""Adds a response to memory, evicting the least recently used responses to make room.
+		The lock must be held.
+		"""
+
+		self.entries[key] = (expires, response)
+		self.size += len(response.content)
+
+		while self.size > self.max_bytes:
+
+			evicted_key, (evicted_expires, evicted) = self.entries.popitem(last=False)
+			self.size -= len(evicted.content)
+			self.metrics.increment("cache_evictions")
+
+			if self.spill_directory and evicted_expires > time.monotonic():
+				self.spill(evicted_key, evicted_expires, evicted)
+
+
+	def spill(self, key: tuple, expires: float, response: CachedResponse):
+		"""Writes an evicted response to disk.  The lock must be held."""
+
+		path = os.path.join(
+			self.spill_directory, f"{hashlib.sha256(repr(key).encode()).hexdigest()}.cache")
+
+		try:
+
+			with open(path, "wb") as spill_file:
+				spill_file.write(
+					json.dumps({ "status": response.status_code, "headers": response.headers })
+					.encode() + b"\n"
+				)
+				spill_file.write(response.content)
+
+		except OSError:
+			log.debug(f"Unable to spill a cached response to:  {path}")
+			return
+
+		self.spilled[key] = (expires, path, len(response.content))
+		self.spilled_size += len(response.content)
+		self.metrics.increment("cache_spills")
+
+		while self.spilled_size > self.spill_max_bytes:
+			self.discard(next(iter(self.spilled)))
+
+
+	def read_spilled(self, path: str):
+		"""
+		Returns:
+			CachedResponse | None: A response read back from disk
+		"""
+
+		try:
+
+			with open(path, "rb") as spill_file:
+				metadata = json.loads(spill_file.readline())
+				return CachedResponse(
+					metadata.get("status"), spill_file.read(), metadata.get("headers"))
+
+		except (OSError, ValueError):
+			return None
+
+
+	def discard(self, key: tuple):
+		"""Removes a response from memory and disk.  The lock must be held."""
+
+		if key in self.entries:
+			_, response = self.entries.pop(key)
+			self.size -= len(response.content)
+
+		if key in self.spilled:
+
+			_, path, size = self.spilled.pop(key)
+			self.spilled_size -= size
+
+			try:
+				os.remove(path)
+			except OSError:
+				pass
+
+
+class SiteAccessCache:
+	"""
+	Remembers the Sites a Site Admin is authorized for between sessions.  The file is
+	encrypted with a key derived from the admin's credentials and expires after a TTL.
+	"""
+
+	def __init__(self, path: str, account: dict, ttl: int):
+
+		self.path = path
+		self.ttl = ttl
+		self.fernet = Fernet(
+			base64.urlsafe_b64encode(
+				hashlib.pbkdf2_hmac(
+					"sha256",
+					f"{account.get('password')}".encode(),
+					f"{account.get('username')}|{path}".encode(),
+					100000
+				)
+			)
+		)
+
+
+	def load(self):
+		"""
+		Returns:
+			set | None: The cached Site names, or None if there are none or they expired
+		"""
+
+		try:
+
+			with open(self.path, "rb") as cache_file:
+				return set(json.loads(self.fernet.decrypt(cache_file.read(), ttl=self.ttl)))
+
+		except FileNotFoundError:
+			return None
+
+		except Exception:
+			log.debug("The cached Site access has expired or cannot be read")
+			return None
+
+
+	def save(self, site_names: set):
+		"""Caches the Site names.
+
+		Args:
+			site_names (set): Names of the authorized Sites
+		"""
+
+		try:
+
+			os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+			with open(self.path, "wb") as cache_file:
+				cache_file.write(self.fernet.encrypt(json.dumps(sorted(site_names)).encode()))
+
+			os.chmod(self.path, 0o600)
+
+		except OSError:
+			log.debug(f"Unable to cache the Site access to:  {self.path}")
+
+
+class RequestHedger:
+	"""
+	Sends a duplicate (hedged) request when an idempotent request has not answered within
+	a percentile of recently observed latencies.  The first response wins and the loser is
+	canceled, which closes its session and response so its transfer stops.
+	"""
+
+	def __init__(self, percentile: float = 95, window: int = 200, min_samples: int = 20,
+		min_delay: float = 0.05, metrics: Union[ApiMetrics, None] = None):
+
+		self.percentile = percentile
+		self.min_samples = min_samples
+		self.min_delay = min_delay
+		self.latencies = deque(maxlen=window)
+		self.lock = threading.Lock()
+		self.metrics = metrics if metrics is not None else ApiMetrics()
+
+
+	def record(self, latency: float):
+		"""Records the latency of a completed request.
+
+		Args:
+			latency (float): Seconds the request took to complete
+		"""
+
+		with self.lock:
+			self.latencies.append(latency)
+
+
+	def threshold(self):
+		"""Determines how long to wait before sending a hedged request.
+
+		Returns:
+			float | None: Seconds to wait or None if too few latencies have been recorded
+		"""
+
+		with self.lock:
+
+			if len(self.latencies) < self.min_samples:
+				return None
+
+			ordered = sorted(self.latencies)
+
+		# Nearest-rank percentile
+		rank = max(math.ceil(self.percentile / 100 * len(ordered)) - 1, 0)
+
+		return max(ordered[rank], self.min_delay)
+
+
+	def execute(self, send, acquire = None):
+		"""Executes a request, hedging it if it is slower than the current threshold.
+
+		Args:
+			send (callable): Sends the request; it is passed the CancellationToken of the
+				attempt and must track its session and response with it
+			acquire (callable, optional): Waits until a request may be sent, e.g. on a rate
+				limiter.  It is called before each attempt is timed.  Defaults to None.
+
+		Returns:
+			requests.Response: The first successful response
+		"""
+
+		self.metrics.increment("hedge_requests")
+
+		acquire = acquire or (lambda: None)
+
+		if (delay := self.threshold()) is None:
+
+			# Not enough samples yet to know what "slow" looks like
+			acquire()
+			start = time.perf_counter()
+			response = send(NEVER_CANCELED)
+			self.record(time.perf_counter() - start)
+
+			return response
+
+		results = queue.Queue()
+		tokens = [ CancellationToken(), CancellationToken() ]
+		starts = [ None, None ]
+
+		def attempt(index):
+
+			try:
+				# The original waited on acquire() before its thread was started
+				if index:
+					acquire()
+
+				starts[index] = time.perf_counter()
+				results.put((index, send(tokens[index]), time.perf_counter() - starts[index]))
+			except Exception as error:
+				results.put((index, None, error))
+
+		acquire()
+		threading.Thread(target=attempt, args=(0,), daemon=True).start()
+		attempts = 1
+
+		try:
+			outcome = results.get(timeout=delay)
+
+		except queue.Empty:
+
+			# The original request is slow, send the hedge
+			self.metrics.increment("hedges_sent")
+			threading.Thread(target=attempt, args=(1,), daemon=True).start()
+			attempts = 2
+			outcome = results.get()
+
+		# If the first answer was a failure, wait on the other attempt
+		if outcome[1] is None and attempts == 2:
+			outcome = results.get()
+			loser = None
+		else:
+			loser = 1 - outcome[0] if attempts == 2 else None
+
+		index, response, latency = outcome
+
+		if loser is not None:
+
+			# Stop the loser's transfer; it has taken at least as long as it has been running,
+			# which keeps slow originals in the window instead of only the faster winners
+			tokens[loser].cancel()
+
+			if (started := starts[loser]) is not None:
+				self.record(time.perf_counter() - started)
+
+		if response is None:
+			raise latency
+
+		if index == 1:
+			self.metrics.increment("hedge_wins")
+
+		self.record(latency)
+
+		return response
+
+
+class TokenBucket:
+	"""
+	A token bucket that paces requests to a sustained rate while allowing short bursts
+	"""
+
+	def __init__(self, rate: float, capacity: Union[float, None] = None):
+
+		self.rate = float(rate)
+		self.capacity = float(capacity or max(rate, 1))
+		self.tokens = self.capacity
+		self.updated = time.monotonic()
+		self.paused_until = 0.0
+		self.lock = threading.Lock()
+
+
+	def acquire(self, cancel_token = None):
+		"""Blocks until a token is available and spends it.
+
+		Args:
+			cancel_token (CancellationToken, optional): Ends the wait if its operation is
+				canceled. Defaults to None.
+
+		Returns:
+			float: Seconds spent waiting for the token
+		"""
+
+		start = time.monotonic()
+
+		while True:
+
+			with self.lock:
+
+				now = time.monotonic()
+				self.tokens = min(
+					self.capacity, self.tokens + max(now - self.updated, 0) * self.rate)
+				self.updated = max(now, self.updated)
+
+				if now >= self.paused_until and self.tokens >= 1:
+					self.tokens -= 1
+					return now - start
+
+				delay = max(self.paused_until - now, (1 - self.tokens) / self.rate)
+
+			(cancel_token or NEVER_CANCELED).sleep(delay)
+
+
+	def pause(self, seconds: float):
+		"""Stops handing out tokens for a period of time.
+
+		Args:
+			seconds (float): Seconds to pause for
+		"""
+
+		with self.lock:
+			self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+			# Don't let tokens accumulate while paused
+			self.tokens = 0
+			self.updated = self.paused_until
+
+
+	def set_rate(self, rate: float):
+		"""Changes the sustained rate of the bucket.
+
+		Args:
+			rate (float): Tokens per second
+		"""
+
+		with self.lock:
+			self.rate = float(rate)
+
+
+class RateLimiter:
+	"""
+	Paces all Jamf Pro API traffic with separate token buckets for reads and writes.
+
+	When the server responds with 429 or 503, the affected bucket is paused for the
+	Retry-After period (at most max_retry_after seconds) and its rate is halved; successful
+	responses slowly restore the configured rate.
+	"""
+
+	def __init__(self, read_rate: float, write_rate: float, max_retries: int = 3,
+		max_retry_after: float = 60, metrics: Union[ApiMetrics, None] = None):
+
+		self.rates = { "read": float(read_rate), "write": float(write_rate) }
+		self.buckets = { name: TokenBucket(rate) for name, rate in self.rates.items() }
+		self.max_retries = max_retries
+		self.max_retry_after = max_retry_after
+		self.metrics = metrics if metrics is not None else ApiMetrics()
+
+
+	def budget(self, method: str):
+		"""Returns the name of the budget a HTTP method is charged against.
+
+		Args:
+			method (str): HTTP Method
+
+		Returns:
+			str: "read" or "write"
+		"""
+
+		return "read" if method == "get" else "write"
+
+
+	def acquire(self, method: str, cancel_token = None):
+		"""Blocks until the request is allowed to be sent.
+
+		Args:
+			method (str): HTTP Method of the request
+			cancel_token (CancellationToken, optional): Ends the wait if its operation is
+				canceled. Defaults to None.
+		"""
+
+		if (waited := self.buckets[self.budget(method)].acquire(cancel_token)) > 0:
+			self.metrics.increment("rate_limit_waits")
+			self.metrics.increment("rate_limit_wait_seconds", waited)
+
+
+	def throttle(self, method: str, retry_after: Union[str, None] = None):
+		"""Backs off after the server reported it is overloaded.
+
+		Args:
+			method (str): HTTP Method of the request that was rejected
+			retry_after (str | None, optional): Value of the Retry-After header.
+				Defaults to None.
+		"""
+
+		name = self.budget(method)
+		bucket = self.buckets[name]
+		delay = parse_retry_after(retry_after, maximum = self.max_retry_after)
+
+		bucket.pause(delay)
+		bucket.set_rate(max(bucket.rate / 2, self.rates[name] / 20))
+		self.metrics.increment("rate_limit_throttled")
+		log.warning(
+			f"Jamf Pro asked to slow down; pausing {name}s for {delay:.1f}s "
+			f"at {bucket.rate:.2f} requests/second"
+		)
+
+
+	def recover(self, method: str):
+		"""Gradually restores the configured rate after a successful request.
+
+		Args:
+			method (str): HTTP Method of the request that succeeded
+		"""
+
+		name = self.budget(method)
+		bucket = self.buckets[name]
+
+		if bucket.rate < self.rates[name]:
+			bucket.set_rate(min(self.rates[name], bucket.rate + self.rates[name] * 0.05))
+
+
+####################################################################################################
+# Utility Helpers
+
+class DeviceURIProber:
+	"""
+	Checks whether the device URIs of printers accept TCP connections.
+
+	Hosts are resolved and connected to concurrently on an asyncio event loop, with a limit
+	on how many connections are attempted at once and a timeout for each.  Each host and
+	port is only probed once per batch and results are cached for a short time.
+	"""
+
+	# Port used by each scheme that can be probed when the URI does not specify one
+	default_ports = {
+		"http": 80,
+		"https": 443,
+		"ipp": 631,
+		"ipps": 631,
+		"lpd": 515,
+		"socket": 9100
+	}
+
+	def __init__(self, concurrency: int = 64, timeout: float = 2.0, ttl: float = 60):
+
+		self.concurrency = concurrency
+		self.timeout = timeout
+		self.ttl = ttl
+		self.cache = {}
+		self.lock = threading.Lock()
+
+
+	@staticmethod
+	def parse(device_uri: Union[str, None]):
+		"""Splits a device URI into its parts.
+
+		Args:
+			device_uri (str | None): The device URI
+
+		Returns:
+			tuple | None: The URI's parts and port, or None if the URI is malformed, e.g.
+				has an unclosed IPv6 address or a port that is not a number
+		"""
+
+		try:
+			parts = urlsplit(device_uri or "")
+			return parts, parts.port
+		except ValueError:
+			return None
+
+
+	@classmethod
+	def endpoint(cls, device_uri: Union[str, None]):
+		"""Finds the host and port a device URI connects to.
+
+		Args:
+			device_uri (str | None): The device URI
+
+		Returns:
+			tuple | None: The host and port, or None if the URI cannot be probed
+		"""
+
+		parsed = cls.parse(device_uri)
+
+		if parsed is None:
+			return None
+
+		parts, port = parsed
+		scheme = parts.scheme.lower()
+
+		if scheme not in cls.default_ports or not parts.hostname:
+			return None
+
+		return parts.hostname, port or cls.default_ports.get(scheme)
+
+
+	def probe(self, device_uris: list, cancel_token = NEVER_CANCELED):
+		"""Checks whether each device URI accepts connections.
+
+		Args:
+			device_uris (list): Device URIs
+			cancel_token (CancellationToken, optional): Stops probing when canceled.
+				Defaults to NEVER_CANCELED.
+
+		Returns:
+			dict: Maps each device URI to a dict with its "status" (Reachable, Unreachable,
+				or Not Probed), "latency_ms", and "details"
+
+		Raises:
+			OperationCancelled: The operation was canceled
+		"""
+
+		results = {}
+		endpoints = defaultdict(list)
+
+		for device_uri in set(device_uris):
+
+			endpoint = self.endpoint(device_uri)
+
+			if endpoint is None:
+
+				parsed = self.parse(device_uri)
+				scheme = parsed[0].scheme.lower() if parsed else ""
+
+				if parsed is None:
+					details = "The device URI is malformed"
+				elif scheme in { "dnssd", "mdns" }:
+					details = "Bonjour queues are resolved when printing"
+				else:
+					details = f"{scheme or 'The'} device URI does not name a network host"
+
+				results[device_uri] = {
+					"status": "Not Probed",
+					"latency_ms": None,
+					"details": details
+				}
+				continue
+
+			endpoints[endpoint].append(device_uri)
+
+		now = time.monotonic()
+
+		with self.lock:
+			cached = {
+				endpoint: result
+				for endpoint, (expires, result) in self.cache.items()
+				if endpoint in endpoints and expires > now
+			}
+
+		pending = [ endpoint for endpoint in endpoints if endpoint not in cached ]
+
+		if pending:
+
+			probed = asyncio.run(self.probe_endpoints(pending, cancel_token))
+
+			with self.lock:
+
+				# Drop expired results while storing the new ones
+				self.cache = {
+					endpoint: entry
+					for endpoint, entry in self.cache.items()
+					if entry[0] > now
+				}
+				self.cache.update({
+					endpoint: (time.monotonic() + self.ttl, result)
+					for endpoint, result in probed.items()
+				})
+
+			cached.update(probed)
+
+		for endpoint, endpoint_uris in endpoints.items():
+			for device_uri in endpoint_uris:
+				results[device_uri] = cached.get(endpoint)
+
+		return results
+
+
+	async def probe_endpoints(self, endpoints: list, cancel_token):
+		"""Probes hosts concurrently.
+
+		Args:
+			endpoints (list): Host and port tuples
+			cancel_token (CancellationToken): Stops probing when canceled
+
+		Returns:
+			dict: Maps each host and port to its result
+		"""
+
+		loop = asyncio.get_running_loop()
+		semaphore = asyncio.Semaphore(self.concurrency)
+		probes = asyncio.gather(
+			*( self.probe_endpoint(host, port, semaphore) for host, port in endpoints ))
+
+		def cancel():
+			try:
+				loop.call_soon_threadsafe(probes.cancel)
+			except RuntimeError:
+				# The probes already finished
+				pass
+
+		with cancel_token.on_cancel(cancel):
+			try:
+				return dict(zip(endpoints, await probes))
+			except asyncio.CancelledError:
+				raise OperationCancelled()
+
+
+	async def probe_endpoint(self, host: str, port: int, semaphore):
+		"""Resolves a host and opens a TCP connection to it.
+
+		Args:
+			host (str): The host
+			port (int): The port
+			semaphore (asyncio.Semaphore): Limits the connections attempted at once
+
+		Returns:
+			dict: The "status", "latency_ms", and "details" of the probe
+		"""
+
+		async with semaphore:
+
+			started = time.perf_counter()
+
+			try:
+				_, writer = await asyncio.wait_for(
+					asyncio.open_connection(host, port), self.timeout)
+
+			except asyncio.TimeoutError:
+				return {
+					"status": "Unreachable",
+					"latency_ms": None,
+					"details": f"{host}:{port} did not answer within {self.timeout:g} seconds"
+				}
+
+			except OSError as error:
+				return {
+					"status": "Unreachable",
+					"latency_ms": None,
+					"details": f"{host}:{port}:  {error.strerror or error}"
+				}
+
+			latency = round((time.perf_counter() - started) * 1000, 1)
+			writer.close()
+
+			try:
+				await writer.wait_closed()
+			except OSError:
+				pass
+
+			return {
+				"status": "Reachable",
+				"latency_ms": latency,
+				"details": f"{host}:{port} answered in {latency:g} ms"
+			}
+
+
+class LpadminInstaller:
+	"""
+	Installs printers on this Mac with lpadmin.
+
+	Each printer's PPD is written to a temporary file and lpadmin is run as an asyncio
+	subprocess, with a limit on how many run at once, so a slow install does not hold up
+	the others.
+	"""
+
+	def __init__(self, lpadmin_path: str = "/usr/sbin/lpadmin", workers: int = 4,
+		timeout: float = 60):
+
+		self.lpadmin_path = lpadmin_path
+		self.workers = workers
+		self.timeout = timeout
+
+
+	@staticmethod
+	def arguments(printer, ppd_file: str):
+		"""Builds the lpadmin arguments that install a printer.
+
+		Args:
+			printer (Printer): The printer
+			ppd_file (str): Path to the printer's PPD
+
+		Returns:
+			list: The arguments
+		"""
+
+		return [
+			"-p", printer.cups_name,
+			"-E",
+			"-v", printer.device_uri,
+			"-P", ppd_file,
+			"-D", printer.display_name or printer.cups_name,
+			"-L", printer.location or "",
+			"-o", "printer-is-shared=false"
+		]
+
+
+	def install(self, printers: list, cancel_token = NEVER_CANCELED, progress = None):
+		"""Installs printers.
+
+		Args:
+			printers (list): Printer objects
+			cancel_token (CancellationToken, optional): Stops installing when canceled.
+				Defaults to NEVER_CANCELED.
+			progress (callable, optional): Called with the result of each printer as it
+				finishes. Defaults to None.
+
+		Returns:
+			list: A dict with the "printer", "status" (Installed or Failed), and "details" of
+				each printer, in the same order as the printers
+
+		Raises:
+			OperationCancelled: The operation was canceled
+		"""
+
+		with tempfile.TemporaryDirectory(prefix="PrinterTool-") as directory:
+			return asyncio.run(self.install_all(printers, directory, cancel_token, progress))
+
+
+	async def install_all(self, printers: list, directory: str, cancel_token, progress):
+		"""Installs printers concurrently.
+
+		Args:
+			printers (list): Printer objects
+			directory (str): Where to write the PPDs
+			cancel_token (CancellationToken): Stops installing when canceled
+			progress (callable | None): Called with the result of each printer
+
+		Returns:
+			list: The result of each printer
+		"""
+
+		loop = asyncio.get_running_loop()
+		semaphore = asyncio.Semaphore(self.workers)
+		tasks = [
+			asyncio.ensure_future(
+				self.install_printer(printer, os.path.join(directory, f"{index}.ppd"), semaphore))
+			for index, printer in enumerate(printers)
+		]
+
+		if progress:
+			for task in tasks:
+				task.add_done_callback(
+					lambda task: task.cancelled() or task.exception() or progress(task.result()))
+
+		installs = asyncio.gather(*tasks)
+
+		def cancel():
+			try:
+				loop.call_soon_threadsafe(installs.cancel)
+			except RuntimeError:
+				# The installs already finished
+				pass
+
+		with cancel_token.on_cancel(cancel):
+			try:
+				return await installs
+			except asyncio.CancelledError:
+				raise OperationCancelled()
+
+
+	async def install_printer(self, printer, ppd_file: str, semaphore):
+		"""Installs a printer.
+
+		Args:
+			printer (Printer): The printer
+			ppd_file (str): Path to write the printer's PPD to
+			semaphore (asyncio.Semaphore): Limits how many installs run at once
+
+		Returns:
+			dict: The "printer", "status", and "details" of the install
+		"""
+
+		result = {
+			"printer": printer.display_name,
+			"status": "Failed",
+			"cups_name": printer.cups_name,
+			"id": printer.printer_id
+		}
+
+		if not printer.cups_name or not printer.device_uri:
+			return { **result, "details": "The printer does not have a CUPS name and device URI" }
+
+		if not printer.ppd_contents:
+			return { **result, "details": "Jamf Pro does not have a PPD for the printer" }
+
+		with open(ppd_file, "w", encoding="utf-8") as ppd:
+			ppd.write(printer.ppd_contents)
+
+		async with semaphore:
+
+			log.debug(f"Installing '{printer.display_name}' with `{self.lpadmin_path}`")
+
+			try:
+				process = await asyncio.create_subprocess_exec(
+					self.lpadmin_path, *self.arguments(printer, ppd_file),
+					stdout = asyncio.subprocess.PIPE,
+					stderr = asyncio.subprocess.PIPE
+				)
+
+			except OSError as error:
+				return { **result, "details": f"Failed to run {self.lpadmin_path}:  {error}" }
+
+			try:
+				_, stderr = await asyncio.wait_for(process.communicate(), self.timeout)
+
+			except (asyncio.TimeoutError, asyncio.CancelledError) as error:
+
+				# Stop lpadmin rather than leave it running
+				try:
+					process.kill()
+				except ProcessLookupError:
+					pass
+
+				await process.wait()
+
+				if isinstance(error, asyncio.CancelledError):
+					raise
+
+				return {
+					**result, "details": f"lpadmin did not finish in {self.timeout:g} seconds" }
+
+		if process.returncode != 0:
+			return {
+				**result,
+				"details": stderr.decode("utf-8", "replace").strip()
+					or f"lpadmin exited with status {process.returncode}"
+			}
+
+		return { **result, "status": "Installed", "details": "" }
+
+
+def decrypt_string(key, encrypted_string):
+	"""
+	A helper function to decrypt a string with a given secret key.
+
+	Args:
+		key:  Secret key used to decrypt the passed string.  (str)
+		string:  String to decrypt. (str)
+	Returns:
+		The unencrypted string as a str.
+	"""
+
+	f = Fernet(key.encode())
+	decrypted_string = f.decrypt(encrypted_string.encode())
+
+	return decrypted_string.decode()
+
+
+def get_timestamp(
+		date: Union[datetime, None] = None, format_string: str = "%Y-%m-%d %I:%M:%S"):
+	"""Helper function to generate a datetime string.
+
+	Args:
+		date (datetime | None, optional): A datetime object to convert to a string.
+			Defaults to None, the current time.
+		format_string (str, optional): Format to convert the datetime object to.
+			Defaults to "%Y-%m-%d %I:%M:%S".
+
+	Returns:
+		str: A string formatted datetime object
+	"""
+
+	if date is None:
+		date = datetime.now()
+
+	return datetime.fromisoformat(str(date)).strftime(format_string)
+
 
-			if method == "get":
+def build_sample_ppd(size: int):
+	"""Helper function to generate PPD-like content for benchmarking.
 
-				return requests.get(url=url, headers=headers)
+	Args:
+		size (int): Approximate size of the content in bytes
 
-			elif method in { "post", "create" }:
+	Returns:
+		str: PPD formatted content
+	"""
 
-				return requests.post(
-					url = url,
-					headers = headers,
-					data = data
-				)
+	lines = [
+		'*PPD-Adobe: "4.3"',
+		'*FormatVersion: "4.3"',
+		'*FileVersion: "2.1.0"',
+		'*Manufacturer: "HP"',
+		'*ModelName: "HP LaserJet Enterprise M607"',
+		'*NickName: "HP LaserJet Enterprise M607, driver 2.1.0"',
+		'*cupsFilter: "application/vnd.cups-raster 0 /usr/libexec/cups/filter/rastertohp"'
+	]
+	length = sum(len(line) + 1 for line in lines)
+	option = 0
+
+	while length < size:
+		line = (
+			f'*PageSize Custom{option}/Custom Size {option}: '
+			f'"<</PageSize[{612 + option} 792]/ImagingBBox null>>setpagedevice"'
+		)
+		lines.append(line)
+		length += len(line) + 1
+		option += 1
 
-			elif method in { "put", "update" }:
+	return "\n".join(lines)
 
-				return requests.put(
-					url = url,
-					headers = headers,
-					data = data
-				)
 
-			elif method == "delete":
+def benchmark_codecs(printer_count: int = 400, ppd_size: int = 256 * 1024, repeat: int = 5):
+	"""Helper function to compare the cost of the Classic API's XML and JSON representations.
 
-				return requests.delete(
-					url = url,
-					headers = headers
-				)
+	Synthetic, PPD-sized printer records are used to measure parse time, peak memory
+	allocated while parsing, and bytes on the wire with and without gzip.
 
-		except Exception:
+	Args:
+		printer_count (int, optional): Printers in the list of all printers. Defaults to 400.
+		ppd_size (int, optional): Size of the PPD in the printer details. Defaults to 256 KB.
+		repeat (int, optional): Times to parse each payload; the fastest is kept. Defaults to 5.
 
-			warning_callback.emit("ERROR:  Failed to connect to the Jamf Pro Server.")
-			log.error("Failed to connect to the Jamf Pro Server.")
+	Returns:
+		list: A dict of measurements for each codec and payload
+	"""
 
+	record = {
+		"id": "1",
+		"name": "Library 1st Floor",
+		"category": "Printers",
+		"uri": "ipp://printer.example.com/ipp/print",
+		"CUPS_name": "Library_1st_Floor",
+		"location": "Library",
+		"model": "HP LaserJet Enterprise M607",
+		"info": "",
+		"notes": json.dumps({ "Site": "Library", "Created": get_timestamp() }),
+		"ppd": "Library_1st_Floor.ppd",
+		"ppd_path": "/private/etc/cups/ppd/Library_1st_Floor.ppd",
+		"ppd_contents": build_sample_ppd(ppd_size)
+	}
+
+	# Build the list of all printers and a printer's details in both representations
+	printers_xml = ElementTree.Element("printers")
+	ElementTree.SubElement(printers_xml, "size").text = str(printer_count)
+	printers_json = { "printers": [] }
+
+	for printer_id in range(1, printer_count + 1):
+		printer = ElementTree.SubElement(printers_xml, "printer")
+		ElementTree.SubElement(printer, "id").text = str(printer_id)
+		ElementTree.SubElement(printer, "name").text = f"Printer {printer_id}"
+		printers_json["printers"].append({ "id": printer_id, "name": f"Printer {printer_id}" })
+
+	printer_xml = ElementTree.Element("printer")
+
+	for field, value in record.items():
+		ElementTree.SubElement(printer_xml, field).text = value
+
+	payloads = {
+		"xml": {
+			"printers": ElementTree.tostring(printers_xml),
+			"printer details": ElementTree.tostring(printer_xml)
+		},
+		"json": {
+			"printers": json.dumps(printers_json).encode("utf-8"),
+			"printer details": json.dumps({ "printer": record }).encode("utf-8")
+		}
+	}
 
-	def get_token(self, username: str, password: str):
-		"""A helper function use to obtain a Jamf Pro API Token.
+	results = []
 
-		Args:
-			username (str): Username for a Jamf Pro account
-			password (str): Password for a Jamf Pro account
+	for content_type, codec in PRINTER_CODECS.items():
 
-		Returns:
-			dict: Results of the API Token request
-		"""
+		for payload, parse in (
+			("printers", codec.printer_ids), ("printer details", codec.printer_record)
+		):
 
-		try:
+			content = payloads[content_type][payload]
+			timings = []
+
+			for _ in range(repeat):
+				start = time.perf_counter()
+				parse(content)
+				timings.append(time.perf_counter() - start)
+
+			tracemalloc.start()
+			parse(content)
+			_, peak_allocated = tracemalloc.get_traced_memory()
+			tracemalloc.stop()
+
+			results.append({
+				"codec": content_type,
+				"payload": payload,
+				"parse_ms": round(min(timings) * 1000, 3),
+				"peak_allocated_bytes": peak_allocated,
+				"bytes": len(content),
+				"gzip_bytes": len(gzip.compress(content))
+			})
 
-			# Create a token based on user provided credentials
-			response_get_token = requests.post(
-				url = f"{self.jps_url}/{PRO_API_ENDPOINTS.get('auth_token')}",
-				auth = (username, password)
-			)
+	return results
 
-			if response_get_token.status_code == 200:
-				return {
-					"api_token": response_get_token.json().get("token"),
-					"api_token_expires": self.fixup_token_expiration(
-						response_get_token.json().get("expires"))
-				}
 
-			return { "error": "ERROR:  Failed to authenticate with the Jamf Pro Server." }
+def describe_changes(changes: dict):
+	"""Helper function to describe the differences between two printer configurations.
 
-		except Exception:
-			return { "error": "ERROR:  Failed to connect to the Jamf Pro Server." }
+	Args:
+		changes (dict): Field names and their (current, new) values
 
+	Returns:
+		str: A line per changed field
+	"""
 
-	def fixup_token_expiration(self, token_expires: str):
-		"""Makes the API Token's expiration date into a Python complaint value.
+	labels = Printer.compared_fields | { "site": "Site" }
+	lines = []
 
-		Args:
-			token_expires (str): A datetime string
+	for field, (current, new) in changes.items():
 
-		Returns:
-			datetime: A datetime string
-		"""
+		if field == "ppd_contents":
+			lines.append(f"{labels.get(field)}:  changed (SHA-256 {current[:12]} -> {new[:12]})")
+		else:
+			lines.append(f"{labels.get(field, field)}:  '{current}' -> '{new}'")
 
-		return datetime.fromisoformat(
-			token_expires.rsplit(".", maxsplit=1)[0]
-		).replace(tzinfo=timezone.utc)
+	return "\n".join(lines)
 
 
-	def is_token_expired(self, token_expires: datetime):
-		"""Checks if the current API Token has expired.
+def index_printers(printers: list):
+	"""Helper function to index printers by their display and CUPS names.
 
-		Args:
-			token_expires (str): A datetime object
+	Args:
+		printers (list): Printer objects
 
-		Returns:
-			bool: Whether or not the API Token has expired
-		"""
+	Returns:
+		tuple: dicts mapping display names and CUPS names to Printer objects
+	"""
 
-		if datetime.now(timezone.utc) > (token_expires - timedelta(minutes=5)):
-			log.debug("API Token has expired!")
-			return True
+	by_display_name = {}
+	by_cups_name = {}
 
-		return False
+	for printer in printers:
+		by_display_name.setdefault(printer.display_name, printer)
+		by_cups_name.setdefault(printer.cups_name, printer)
 
+	return by_display_name, by_cups_name
 
-	def display_printer_details(self):
-		"""
-		Handles the displaying printer details in the expanded window details view.
-		"""
 
-		try:
-			# Get the object that called this function
-			sender = self.sender().objectName()
+def match_printer(printer, index: tuple):
+	"""Helper function to find a printer's counterpart in an index.
 
-		except Exception:
-			pass
+	Args:
+		printer (Printer): The printer to find a match for
+		index (tuple): Indexes as returned by index_printers()
 
-		# Determine which object to get the selected item in that object
-		if sender == "qlist_local_printers":
+	Returns:
+		Printer | None: The matching printer, preferring a display name match
+	"""
 
-			selected_printer = self.selected_list_value(self.qlist_local_printers)
-			printer_list = self.local_printer_list
+	by_display_name, by_cups_name = index
 
-		elif sender in { "combo_printers", "combo_sites" }:
+	return by_display_name.get(printer.display_name) or by_cups_name.get(printer.cups_name)
 
-			selected_printer = self.selected_combo_box_value(self.combo_printers)
-			printer_list = self.jps_printer_list
 
-		else:
-			return
+def reconcile_printers(local_printers: list, jps_printers: list, site: str):
+	"""Helper function to plan how to bring a Site in line with the local printers.
 
-		try:
-			# Loop through the list to get the printers details
-			for printer in printer_list:
+	Each local printer is classified as:
+		Identical:  matches its JPS printer
+		Drifted:  differs from its JPS printer
+		Missing:  does not exist in Jamf Pro
+		Conflict:  the name is already used by a printer in another Site, or the JPS printer
+			it matches was already matched by another local printer
 
-				if printer.display_name == selected_printer:
+	A JPS printer is only matched to one local printer, so it is never updated twice.  Display
+	name matches are claimed before CUPS name matches.
 
-					self.lineEdit_printer_display_name.setText(printer.display_name)
-					self.lineEdit_printer_location.setText(printer.location)
-					self.lineEdit_printer_model.setText(printer.model)
-					self.lineEdit_printer_device_uri.setText(printer.device_uri)
-					self.lineEdit_printer_cups_name.setText(printer.cups_name)
-					self.lineEdit_printer_ppd_file_path.setText(printer.ppd_path)
-					self.lineEdit_site.setText(printer.site)
-					self.lineEdit_created_by.setText(printer.created_by)
-					self.lineEdit_updated_by.setText(printer.updated_by)
-					self.textEdit_printer_ppd_contents.setText(printer.ppd_contents)
+	Args:
+		local_printers (list): Local Printer objects
+		jps_printers (list): JPS Printer objects
+		site (str): The Site being reconciled
 
-		except Exception:
-			log.error("Failed to display printer details.")
+	Returns:
+		list: A dict for each local printer with its "status", the "printer", the matched
+			"jps_printer", and any "changes"
+	"""
 
+	site_index = index_printers([ printer for printer in jps_printers if printer.site == site ])
+	all_index = index_printers(jps_printers)
+	plan = []
 
-	def get_site_access(self, progress_callback, finished_callback, warning_callback):
-		"""
-		A helper function that retrieves the Sites an account has Enroll Permissions too.
+	# JPS printer IDs mapped to the local printer that matched them
+	claimed = {}
 
-		Args:
-			warning_callback:  A callback function to update the progress and status bars
-		"""
+	for printer in local_printers:
+		if jps_printer := site_index[0].get(printer.display_name):
+			claimed.setdefault(jps_printer.printer_id, printer)
 
-		log.debug("Getting users' Site access...")
+	for printer in local_printers:
 
-		# Update Status Bar
-		progress_callback.emit({ "msg": "Collecting Site Access Permissions..." })
+		jps_printer = match_printer(printer, site_index)
 
-		# site_ids = []
-		self.site_names = [""] # Add an empty value to the beginning
-		sites_unauthorized = (
-			"Site A",
-			"Site 2",
-			"Site C3"
-		)
+		if jps_printer and claimed.setdefault(jps_printer.printer_id, printer) is not printer:
 
-		# GET All User Details
-		response_user_details = self.jamf_pro_api(
-			api_account = self.site_admin_account,
-			method = "get",
-			endpoint = PRO_API_ENDPOINTS.get("auth_details"),
-			warning_callback = warning_callback
-		)
+			plan.append({
+				"status": "Conflict",
+				"printer": printer,
+				"jps_printer": jps_printer,
+				"details": (
+					f"'{jps_printer.display_name}' is already matched by local printer "
+					f"'{claimed[jps_printer.printer_id].display_name}'"
+				)
+			})
 
-		if response_user_details.status_code != 200:
+		elif jps_printer:
 
-			# Update Status Bar and Pulse Progress Bar
-			warning_callback.emit("ERROR:  Failed to look up user details.")
-			log.error("Failed to look up user details.")
-			return
+			changes = printer.differences(jps_printer)
+			plan.append({
+				"status": "Drifted" if changes else "Identical",
+				"printer": printer,
+				"jps_printer": jps_printer,
+				"changes": changes
+			})
 
-		try:
+		elif jps_printer := all_index[0].get(printer.display_name):
 
-			# Get the response content from the API
-			user_details = response_user_details.json()
+			plan.append({
+				"status": "Conflict",
+				"printer": printer,
+				"jps_printer": jps_printer,
+				"details": f"Name is used by a printer in Site '{jps_printer.site}'"
+			})
 
-			# Old method to limit Sites
-			# Uncomment the below lines if you'd want to use this method
-			# for key in user_details.get("accountGroups"):
-				# for privilege in key.get("privileges"):
-				#     if privilege == "Enroll Computers and Mobile Devices":
-				# site_ids.append(key.get("siteId"))
+		else:
+			plan.append({ "status": "Missing", "printer": printer })
 
-			# for key in user_details.get("sites"):
-			#     if key.get("id") in site_ids:
-			#         self.site_names.append(key.get("name"))
+	return plan
 
-			# New method to limit Sites
-			self.site_names.extend(
-				key.get("name")
-				for key in user_details.get("sites")
-				if key.get("name") not in sites_unauthorized
-			)
 
-			log.debug(f"Authorized Sites:  {self.site_names}")
+def parse_ppd_metadata(ppd_contents: str):
+	"""Helper function to pull the attributes that identify a driver out of a PPD.
 
-		except Exception:
-			# Update Status Bar and Progress Bar
-			warning_callback.emit("Failed to identify authorized Sites!")
-			log.error("Failed to identify any authorized Sites!")
-			return
+	Args:
+		ppd_contents (str): Contents of the PPD
 
-		if len(self.site_names) > 1:
+	Returns:
+		dict: The value of each attribute found; attributes in PPD_LIST_ATTRIBUTES map to a
+			list of every value
+	"""
 
-			# Update Status Bar
-			progress_callback.emit({ "msg": "Collecting Site Access Permissions...  [SUCCESS]" })
+	metadata = {}
 
-			# Enable the Site ComboBox, clear it,and add the Site names
-			self.combo_sites.setEnabled(True)
-			self.combo_sites.clear()
-			self.combo_sites.addItems(sorted(self.site_names))
+	for match in PPD_ATTRIBUTE_PATTERN.finditer(ppd_contents):
 
-			# Update Status Bar and Progress Bar
-			finished_callback.emit("Sites populated")
+		attribute, value = match.group(1), match.group(2).strip()
 
-			# Enable Buttons
-			self.button_get_printers.setEnabled(True)
+		if attribute in PPD_LIST_ATTRIBUTES:
+			metadata.setdefault(attribute, []).append(value)
 
 		else:
-			# Update Status Bar and Progress Bar
-			warning_callback.emit("User is not authorized for any Sites.")
-			log.warning("User is not authorized for any Sites.")
-			return
+			metadata.setdefault(attribute, value)
 
+	return metadata
 
-	def clear_api_token(self):
-		"""
-		Handles clearing the API Token when the Clear API Token Action is selected
-		"""
 
-		self.site_admin_account.update({ "api_token": None, "api_token_expires": None })
+def version_key(version: str):
+	"""Helper function to compare version strings, e.g. "1.10" is newer than "1.9".
 
+	Args:
+		version (str): A version
 
-	def populate_printer_combo_box(self):
-		"""
-		Handles updating the JPS Printer ComboBox by repopulating the values when the Site
-		combobox value is changed
-		"""
+	Returns:
+		tuple: The numbers in the version
+	"""
 
-		try:
+	return tuple(int(number) for number in re.findall(r"\d+", version))
 
-			# Ensure there are JPS Printers before continuing.
-			if len(self.jps_printer_list) > 0:
 
-				selected_site = self.selected_combo_box_value(self.combo_sites)
+def diff_ppds(
+		from_ppd: str, to_ppd: str, from_name: str = "", to_name: str = "", context: int = 3):
+	"""Helper function to produce a unified diff of two PPDs.
 
-				# List to collect printers that are "assigned" to the selected Site.
-				matching_printers = [
-					printer.display_name
-					for printer in self.jps_printer_list
-					if printer.site == selected_site
-				]
+	Lines are hashed to integers once, so the matcher compares integers instead of strings,
+	and the lines both PPDs start and end with are skipped before matching.  This keeps
+	diffs of 10k line PPDs that differ in a few places fast.  The skipped lines are added
+	back as unchanged blocks before hunks are grouped, so every hunk has its full context.
 
-				# Enable ComboBox and clear its current items
-				self.combo_printers.setEnabled(True)
-				self.combo_printers.clear()
+	The output is a unified diff that patches from_ppd into to_ppd; where a change can be
+	aligned more than one way it may be aligned differently than difflib.unified_diff().
 
-				# If there were printers for the select Site, add them to the ComboBox Widget
-				if len(matching_printers) > 0:
+	Args:
+		from_ppd (str): Contents of the original PPD
+		to_ppd (str): Contents of the changed PPD
+		from_name (str, optional): Name of the original PPD. Defaults to "".
+		to_name (str, optional): Name of the changed PPD. Defaults to "".
+		context (int, optional): Lines of context around each change. Defaults to 3.
+
+	Yields:
+		str: Lines of the diff
+	"""
 
-					self.combo_printers.addItems(sorted(matching_printers))
+	from_lines = from_ppd.splitlines()
+	to_lines = to_ppd.splitlines()
 
-				# Run the function to update the extended GUI
-				self.display_printer_details()
+	line_ids = {}
+	from_ids = [ line_ids.setdefault(line, len(line_ids)) for line in from_lines ]
+	to_ids = [ line_ids.setdefault(line, len(line_ids)) for line in to_lines ]
 
-			else:
+	if from_ids == to_ids:
+		return
 
-				# Clear the ComboBoxes current items
-				self.combo_printers.clear()
+	# Skip the common start and end
+	shortest = min(len(from_ids), len(to_ids))
+	prefix = 0
 
-		except Exception:
-			pass
+	while prefix < shortest and from_ids[prefix] == to_ids[prefix]:
+		prefix += 1
 
+	suffix = 0
 
-	def button_handler(self):
-		"""
-		Handles enabling the Create, Update, and Delete Buttons depending on if local printers
-		exist and when the JPS Printer ComboBox has a non-null selected value
-		"""
+	while suffix < shortest - prefix and from_ids[-1 - suffix] == to_ids[-1 - suffix]:
+		suffix += 1
 
-		# Create Button
-		try:
+	from_end = len(from_ids) - suffix
+	to_end = len(to_ids) - suffix
 
-			# Get the selected values
-			selected_site = self.selected_combo_box_value(self.combo_sites)
-			selected_local_printer = self.selected_list_value(self.qlist_local_printers)
+	matcher = difflib.SequenceMatcher(
+		None, from_ids[prefix:from_end], to_ids[prefix:to_end], autojunk=False)
 
-			if selected_site and selected_local_printer:
+	# Add the skipped start and end back as unchanged blocks, so hunks are grouped (and
+	# given context) across the whole PPDs
+	opcodes = [ ("equal", 0, prefix, 0, prefix) ]
 
-				# Local printers exist, enabling button
-				self.button_create_printers.setEnabled(True)
+	for tag, from_start, from_stop, to_start, to_stop in matcher.get_opcodes():
+		opcodes.append(
+			(tag, prefix + from_start, prefix + from_stop, prefix + to_start, prefix + to_stop))
 
-			else:
+	opcodes.append(("equal", from_end, len(from_ids), to_end, len(to_ids)))
 
-				# Local printers do not exist, disabling button
-				self.button_create_printers.setEnabled(False)
+	merged = []
 
-		except Exception:
-			pass
+	for opcode in opcodes:
 
-		# Update and Delete Buttons
-		try:
+		if opcode[1] == opcode[2] and opcode[3] == opcode[4]:
+			continue
 
-			# Get the current value of the combobox
-			selected_printer = self.selected_combo_box_value(self.combo_printers)
+		if merged and merged[-1][0] == opcode[0] == "equal":
+			merged[-1] = ("equal", merged[-1][1], opcode[2], merged[-1][3], opcode[4])
+		else:
+			merged.append(opcode)
 
-			if selected_printer:
+	matcher.opcodes = merged
 
-				# Printer selected, enabling buttons
-				self.button_update_printer.setEnabled(True)
-				self.button_delete_printer.setEnabled(True)
+	def hunk_range(first, last):
+		return (
+			f"{first + 1}" if last - first == 1
+			else f"{first + 1 if last > first else first},{last - first}"
+		)
 
-			else:
+	yield f"--- {from_name}"
+	yield f"+++ {to_name}"
 
-				# Printer is not selected, disabling buttons
-				self.button_update_printer.setEnabled(False)
-				self.button_delete_printer.setEnabled(False)
+	for group in matcher.get_grouped_opcodes(context):
 
-		except Exception:
-			pass
+		from_first, from_last = group[0][1], group[-1][2]
+		to_first, to_last = group[0][3], group[-1][4]
+		yield f"@@ -{hunk_range(from_first, from_last)} +{hunk_range(to_first, to_last)} @@"
 
+		for tag, from_start, from_stop, to_start, to_stop in group:
 
-	def lock_mutex(self, lock_it):
-		"""Helper function to handle locking and unlocking a mutex.
+			if tag == "equal":
+				for line in from_lines[from_start:from_stop]:
+					yield f" {line}"
+				continue
 
-		Args:
-			lock_it (bool): Wether to lock or unlock a mutex.
-		"""
+			for line in from_lines[from_start:from_stop]:
+				yield f"-{line}"
 
-		if lock_it:
-			log.debug("Locking mutex")
-			self.mutex.lock()
-			log.debug("Waiting for mutex")
-			self.condition.wait(self.mutex)
+			for line in to_lines[to_start:to_stop]:
+				yield f"+{line}"
 
-		log.debug("Unlocking mutex")
-		self.mutex.unlock()
 
+def drift_report(local_printers: list, jps_printers: list):
+	"""Helper function to compare local printers to JPS printers field by field.
 
-	def build_printer_xml_payload(self, **kwargs):
-		"""Helper function to build an XML payload that
-		can be used as a payload for the Jamf Pro API.
+	Printers are matched through hashed indexes, so the comparison is linear in the number
+	of printers.  PPDs are compared by hash.
 
-		Returns:
-			str: XML formatted string
-		"""
+	Args:
+		local_printers (list): Local Printer objects
+		jps_printers (list): JPS Printer objects
 
-		custom_notes = self.create_custom_printer_notes(
-			kwargs.get("site"),
-			kwargs.get("created"),
-			kwargs.get("created_by"),
-			kwargs.get("updated"),
-			kwargs.get("updated_by")
-		)
+	Returns:
+		list: A flat dict per printer with its "status" (Identical, Drifted, Missing in
+			Jamf Pro, or Missing locally), the differing "fields", and their "details"
+	"""
 
-		# Build the printer payload xml
-		return (
-			"<printer>"
-				f"<id>{kwargs.get('id', '')}</id>"
-				f"<name>{kwargs.get('display_name')}</name>"
-				f"<category>Printers</category>"
-				f"<uri>{kwargs.get('device_uri')}</uri>"
-				f"<CUPS_name>{kwargs.get('cups_name')}</CUPS_name>"
-				f"<location>{kwargs.get('location')}</location>"
-				f"<model>{kwargs.get('model')}</model>"
-				f"<ppd>{kwargs.get('cups_name')}.ppd</ppd>"
-				f"<ppd_contents>{escape(kwargs.get('ppd_contents'))}</ppd_contents>"
-				f"{custom_notes}"
-				f"<ppd_path>{kwargs.get('ppd_path')}</ppd_path>"
-			"</printer>"
-		)
+	jps_index = index_printers(jps_printers)
+	matched = set()
+	report = []
+
+	for printer in local_printers:
+
+		if jps_printer := match_printer(printer, jps_index):
+
+			matched.add(id(jps_printer))
+			changes = printer.differences(jps_printer)
+			report.append({
+				"printer": printer.display_name,
+				"status": "Drifted" if changes else "Identical",
+				"site": jps_printer.site,
+				"printer_id": jps_printer.printer_id,
+				"fields": ", ".join(changes),
+				"details": describe_changes(changes).replace("\n", ";  "),
+				"local_ppd_hash": printer.ppd_hash,
+				"jps_ppd_hash": jps_printer.ppd_hash
+			})
+
+		else:
+			report.append({
+				"printer": printer.display_name,
+				"status": "Missing in Jamf Pro",
+				"site": "",
+				"printer_id": "",
+				"fields": "",
+				"details": "",
+				"local_ppd_hash": printer.ppd_hash,
+				"jps_ppd_hash": ""
+			})
+
+	report.extend(
+		{
+			"printer": jps_printer.display_name,
+			"status": "Missing locally",
+			"site": jps_printer.site,
+			"printer_id": jps_printer.printer_id,
+			"fields": "",
+			"details": "",
+			"local_ppd_hash": "",
+			"jps_ppd_hash": jps_printer.ppd_hash
+		}
+		for jps_printer in jps_printers
+		if id(jps_printer) not in matched
+	)
 
+	return report
 
-	def create_custom_printer_notes(self, site: str, created: str = "", created_by: str = "",
-		updated: str = "", updated_by: str = ""):
-		"""A helper function to create the embedded json notes.
 
-		Args:
-			site (str): Site the printer is assigned
-			created (str, optional): Datetime of printer creation. Defaults to "".
-			created_by (str, optional): Admin that created the printer. Defaults to "".
-			updated (str, optional): Datetime the printer was updated. Defaults to "".
-			updated_by (str, optional): Admin that updated the printer. Defaults to "".
+def normalize_device_uri(device_uri: Union[str, None]):
+	"""Helper function to normalize a device URI so the same queue is recognized however
+	it was typed.
 
-		Returns:
-			str: String quoted JSON blob
-		"""
+	Args:
+		device_uri (str | None): A device URI, e.g. lpd://Printer.Example.com/queue/
 
-		custom_notes = {
-			"Site": site,
-			"Created": created,
-			"Created_by": created_by,
-			"Updated": updated,
-			"Updated_by": updated_by
-		}
+	Returns:
+		str: The URI with its scheme and host in lower case and without a trailing slash
+	"""
 
-		return f"<notes>{json.dumps(custom_notes)}</notes>"
+	device_uri = (device_uri or "").strip()
 
+	try:
+		parts = urlsplit(device_uri)
+	except ValueError:
+		return device_uri.rstrip("/")
 
-####################################################################################################
-# Classes
+	if not parts.scheme:
+		return device_uri.rstrip("/")
 
-class WorkerSignals(QtCore.QObject):
-	"""
-	Defines the signals available from a running worker thread.
+	return parts._replace(
+		scheme = parts.scheme.lower(), netloc = parts.netloc.lower()).geturl().rstrip("/")
 
-	Supported signals are:
 
-	close
-		Close a window
-	error
-		`tuple` (exctype, value, traceback.format_exc() )
-	finished
-		`str` message to display
-	progress
-		`dict` message to display and value to update the progress bar
-	prompt
-		Open the login window
-	result
-		`object` data returned from processing, anything
-	warning
-		`str` message to display
-	"""
+def find_conflicts(printers: list):
+	"""Helper function to find printers that duplicate or collide with other printers.
 
-	close = QtCore.Signal()
-	error = QtCore.Signal(tuple)
-	finished = QtCore.Signal(str)
-	progress = QtCore.Signal(dict)
-	prompt = QtCore.Signal()
-	result = QtCore.Signal(object)
-	warning = QtCore.Signal(str)
+	Printers are grouped with hash indexes by device URI, CUPS name, and display name
+	(ignoring case), so the analysis is linear in the number of printers.
 
+	Args:
+		printers (list): Printer objects
 
-class Worker(QtCore.QRunnable):
+	Returns:
+		list: A dict per printer in conflict; its status is one of:
+			Clone:  the same queue and PPD as another printer
+			Duplicate URI:  the same queue as another printer, with a different PPD
+			CUPS Name Collision:  the same CUPS name as another printer
+			Name Collision:  the same display name as another printer, ignoring case
 	"""
-	Worker thread
 
-	Inherits from QRunnable to handler worker thread setup, signals and wrap-up.
+	indexes = {
+		"Duplicate URI": defaultdict(list),
+		"CUPS Name Collision": defaultdict(list),
+		"Name Collision": defaultdict(list)
+	}
 
-	:param callback:  The function callback to run on this worker thread. Supplied args and
-					 kwargs will be passed through to the runner.
-	:type callback:  function
-	:param args:  Arguments to pass to the callback function
-	:param kwargs:  Keywords to pass to the callback function
-	"""
+	for printer in printers:
 
-	def __init__(self, function, *args, **kwargs):
-		super(Worker, self).__init__()
+		if printer.device_uri:
+			indexes.get("Duplicate URI")[normalize_device_uri(printer.device_uri)].append(printer)
 
-		# Store constructor arguments (re-used for processing)
-		self.function = function
-		self.args = args
-		self.kwargs = kwargs
-		self.signals = WorkerSignals()
+		if printer.cups_name:
+			indexes.get("CUPS Name Collision")[printer.cups_name.casefold()].append(printer)
 
-		# Add the callback to our kwargs
-		self.kwargs["progress_callback"] = self.signals.progress
-		self.kwargs["finished_callback"] = self.signals.finished
-		self.kwargs["warning_callback"] = self.signals.warning
+		if printer.display_name:
+			indexes.get("Name Collision")[printer.display_name.casefold()].append(printer)
 
+	conflicts = []
 
-	@QtCore.Slot()
-	def run(self):
-		"""
-		Initialise the runner function with passed args, kwargs.
-		"""
+	for conflict, index in indexes.items():
+		for value, group in index.items():
 
-		# Retrieve args/kwargs here; and fire processing using them
+			if len(group) < 2:
+				continue
 
-		try:
+			sites = sorted({ printer.site or "None" for printer in group })
+			ppd_hashes = Counter(printer.ppd_hash for printer in group)
+			labels = [
+				f"{member.display_name} (ID:  {member.printer_id}, Site:  {member.site or 'None'})"
+				for member in group
+			]
 
-			result = self.function(*self.args, **self.kwargs)
+			for position, printer in enumerate(group):
 
-		except Exception:
+				status = conflict
 
-			traceback.print_exc()
-			exctype, value = sys.exc_info()[:2]
-			self.signals.error.emit((exctype, value, traceback.format_exc()))
+				if conflict == "Duplicate URI" and ppd_hashes.get(printer.ppd_hash) > 1:
+					status = "Clone"
 
-		else:
+				others = ", ".join(labels[:position] + labels[position + 1:])
 
-			# Return the result of the processing
-			self.signals.result.emit(result)
-		# finally:
-		#     self.signals.finished.emit()  # Done
+				conflicts.append({
+					"printer": printer.display_name,
+					"status": status,
+					"details": f"Shares {value} with {others}",
+					"id": printer.printer_id,
+					"site": printer.site,
+					"shared_value": value,
+					"across_sites": len(sites) > 1,
+					"sites": ", ".join(sites)
+				})
 
+	return conflicts
 
-class Printer:
-	"""
-	An object to store printer configuration details in
+
+def write_report(rows: list, report_file: str):
+	"""Helper function to save report rows as JSON or CSV, based on the file extension.
+
+	Args:
+		rows (list): A dict per row
+		report_file (str): Path to save the report to; `.csv` files are saved as CSV,
+			anything else as JSON
 	"""
 
-	# Initializer / Instance Attributes
-	def __init__(self, printer_id="local", ppd_contents="", site="", created="", created_by="",
-		updated="", updated_by="", **kwargs):
+	if report_file.lower().endswith(".csv"):
 
-		self.printer_id = printer_id
-		self.display_name = kwargs.get("display_name")
-		self.cups_name = kwargs.get("cups_name")
-		self.model = kwargs.get("model")
-		self.location = kwargs.get("location")
-		self.device_uri = kwargs.get("device_uri")
-		self.ppd_path = kwargs.get("ppd_path")
-		self.ppd_contents = ppd_contents
-		self.site = site
-		self.created = created
-		self.created_by = created_by
-		self.updated = updated
-		self.updated_by = updated_by
+		# Use every key, in the order first seen, as the columns
+		columns = list(dict.fromkeys(key for row in rows for key in row))
 
+		with open(report_file, "w", newline="", encoding="utf-8") as report:
+			writer = csv.DictWriter(report, fieldnames=columns)
+			writer.writeheader()
+			writer.writerows(rows)
 
-	def __repr__(self):
-		return str(self.display_name)
+	else:
 
+		with open(report_file, "w", encoding="utf-8") as report:
+			json.dump(rows, report, indent=4)
 
-	def __str__(self):
-		return str(self.display_name)
 
+def journal_step(action: str, printer, site: str = "", jps_printer = None):
+	"""Helper function to describe one step of a journaled bulk operation.
 
-class ExecuteProcess:
+	Steps only hold identifiers so they can be resolved against the printer lists when an
+	interrupted operation is resumed.
+
+	Args:
+		action (str): One of "create", "update", "delete", or "retag"
+		printer (Printer): The local printer (create, update) or JPS printer (delete, retag)
+		site (str, optional): Site the printer is assigned to. Defaults to "".
+		jps_printer (Printer | None, optional): The JPS printer an update applies to.
+			Defaults to None.
+
+	Returns:
+		dict: The step
 	"""
-	A class that allows running an external program and returning the results.
 
-	Can also be used as a Context Manager."""
+	jps_printer = jps_printer or printer
+
+	step = {
+		"action": action,
+		"printer": printer.display_name,
+		"cups_name": printer.cups_name,
+		"printer_id": jps_printer.printer_id,
+		"site": site,
+		# When and how the JPS printer was last changed, to detect conflicting changes
+		"updated": jps_printer.updated,
+		"fingerprint": jps_printer.fingerprint if jps_printer.printer_id != "local" else None
+	}
+
+	if action in { "create", "update" }:
+		step["key"] = f"{action}:{printer.cups_name}"
+	else:
+		step["key"] = f"{action}:{printer.printer_id}"
 
-	def __init__(self, program: str, args: list, **kwargs):
+	return step
 
-		self.program = program
-		self.args = args
-		log.debug(f"Executing external program `{self.program}` with the parameters `{self.args}`")
 
-		self.execute = QtCore.QProcess()
-		self.execute.readyReadStandardOutput.connect(self.handle_stdout)
-		self.execute.readyReadStandardError.connect(self.handle_stderr)
-		self.execute.stateChanged.connect(self.handle_state)
-		self.execute.finished.connect(self.process_finished)  # Clean up once complete.
-		self.results_stdout = ""
-		self.results_stderr = ""
+def compile_site_patterns(patterns: Union[list, None]):
+	"""Helper function to compile Site names, which may contain wildcards, into one pattern.
 
+	Args:
+		patterns (list | None): Site names or wildcard patterns
 
-	def __enter__(self):
-		"""Context Manager method to start execution of external program
+	Returns:
+		re.Pattern | None: Matches any of the Sites, or None if there are none
+	"""
 
-		Returns:
-			dict:  A dictionary of results
-		"""
+	if not patterns:
+		return None
 
-		self.execute.start(self.program, self.args)
-		self.execute.waitForFinished()
+	return re.compile("|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns))
 
-		return {
-			"status": self.execute.exitCode(),
-			"stderr": (self.results_stderr).strip() if self.results_stderr != "" else None,
-			"stdout": (self.results_stdout).strip(),
-			"success": self.execute.exitCode() == 0
-		}
 
-	def __exit__(self, exc_type, exc_value, exc_traceback):
-		"""Context Manager method to handle exiting."""
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 8.0):
+	"""Helper function to calculate an exponential backoff with jitter.
 
-		self.process_finished()
+	Args:
+		attempt (int): The retry number, starting at 1
+		base (float, optional): Delay of the first retry in seconds. Defaults to 0.5.
+		cap (float, optional): Maximum delay in seconds. Defaults to 8.0.
 
+	Returns:
+		float: Seconds to wait
+	"""
 
-	def handle_stderr(self):
-		data = self.execute.readAllStandardError()
-		stderr = bytes(data).decode("utf8")
-		self.results_stderr = f"{self.results_stderr}{stderr}"
+	return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
 
 
-	def handle_stdout(self):
-		data = self.execute.readAllStandardOutput()
-		stdout = bytes(data).decode("utf8")
-		self.results_stdout = f"{self.results_stdout}{stdout}"
+def load_reference_printers(reference_files: Union[list, None]):
+	"""Helper function to collect the printers installed on other reference Macs.
 
+	Each file contains the output of `jamf listprinters` from a reference Mac.
 
-	def handle_state(self, state):
-		states = {
-			QtCore.QProcess.NotRunning: 'Not running',
-			QtCore.QProcess.Starting: 'Starting',
-			QtCore.QProcess.Running: 'Running',
-		}
-		state_name = states[state]
+	Args:
+		reference_files (list | None): Paths to the files
 
+	Returns:
+		set: Display and CUPS names of the installed printers
+	"""
 
-	def process_finished(self):
-		pass
+	names = set()
 
+	for reference_file in reference_files or []:
 
-####################################################################################################
-# Utility Helpers
+		try:
+			printers = ElementTree.parse(os.path.expanduser(reference_file)).getroot()
+		except (OSError, ElementTree.ParseError):
+			log.warning(f"Unable to read reference printers from:  {reference_file}")
+			continue
 
-def decrypt_string(key, encrypted_string):
-	"""
-	A helper function to decrypt a string with a given secret key.
+		for printer in printers.iter("printer"):
+			names.add(printer.findtext("display_name"))
+			names.add(printer.findtext("cups_name"))
+
+	names.discard(None)
+
+	return names
+
+
+def parse_retry_after(value: Union[str, None], default: float = 1.0, maximum: float = 60.0):
+	"""Helper function to convert a Retry-After header into seconds.
 
 	Args:
-		key:  Secret key used to decrypt the passed string.  (str)
-		string:  String to decrypt. (str)
+		value (str | None): Value of the header; either seconds or a HTTP-date
+		default (float, optional): Seconds to use when the header is missing or invalid.
+			Defaults to 1.0.
+		maximum (float, optional): Longest wait to honor, so a bad header cannot hold a
+			worker for hours. Defaults to 60.0.
+
 	Returns:
-		The unencrypted string as a str.
+		float: Seconds to wait
 	"""
 
-	f = Fernet(key.encode())
-	decrypted_string = f.decrypt(encrypted_string.encode())
+	if not value:
+		return min(default, maximum)
 
-	return decrypted_string.decode()
+	try:
+		seconds = float(value)
+	except ValueError:
+
+		try:
+			seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+		except (TypeError, ValueError):
+			seconds = default
 
+	if not math.isfinite(seconds):
+		seconds = default
 
-def get_timestamp(date: datetime = datetime.now(), format_string: str = "%Y-%m-%d %I:%M:%S"):
-	"""Helper function to generate a datetime string.
+	return min(max(seconds, 0.0), maximum)
+
+
+def load_settings(config_file: Union[str, None] = None, overrides: Union[dict, None] = None):
+	"""Helper function to build the application settings.
+
+	Settings are layered:  the defaults, then a JSON config file, then command line arguments.
 
 	Args:
-		date (datetime, optional): A datetime object to convert to a string.
-			Defaults to datetime.now().
-		format_string (str, optional): Format to convert the datetime object to.
-			Defaults to "%Y-%m-%d %I:%M:%S".
+		config_file (str | None, optional): Path to a JSON config file. Defaults to None.
+		overrides (dict | None, optional): Values that take precedence over the config file;
+			keys with a value of None are ignored. Defaults to None.
 
 	Returns:
-		str: A string formatted datetime object
+		dict: Application settings
 	"""
 
-	return datetime.fromisoformat(str(date)).strftime(format_string)
+	settings = dict(DEFAULT_SETTINGS)
+
+	if config_file:
+
+		with open(config_file, "r") as config:
+			settings |= json.load(config)
+
+	settings |= { key: value for key, value in (overrides or {}).items() if value is not None }
+
+	return settings
 
 
 if __name__ == "__main__":
@@ -2360,6 +8554,25 @@ if __name__ == "__main__":
 		if len(arg) != 0:
 			parser_args.extend(arg.split(" ", 1))
 
+	# Benchmarks do not require credentials or a Jamf Pro Server
+	benchmark_parser = argparse.ArgumentParser(add_help=False)
+	benchmark_parser.add_argument("--benchmark-codecs", action="store_true")
+	benchmark_args, _ = benchmark_parser.parse_known_args(parser_args)
+
+	if benchmark_args.benchmark_codecs:
+
+		print(f"{'Codec':<6}{'Payload':<17}{'Parse (ms)':>12}{'Peak Alloc':>14}"
+			f"{'Bytes':>12}{'Gzip Bytes':>12}")
+
+		for result in benchmark_codecs():
+			print(
+				f"{result.get('codec'):<6}{result.get('payload'):<17}"
+				f"{result.get('parse_ms'):>12}{result.get('peak_allocated_bytes'):>14}"
+				f"{result.get('bytes'):>12}{result.get('gzip_bytes'):>12}"
+			)
+
+		sys.exit(0)
+
 	# Setup Arg Parser
 	parser = argparse.ArgumentParser(
 		description="This script defines a GUI application to create printers within Jamf Pro.  "
@@ -2376,6 +8589,82 @@ if __name__ == "__main__":
 	)
 	parser.add_argument("--secret", "-s", help="Provide the encrypted secret", required=True)
 	parser.add_argument("--log_level", help="Enable debug logging", required=False)
+	parser.add_argument(
+		"--hedge-percentile",
+		help="Send a duplicate printer details request when the original is slower than this "
+			"percentile of recent latencies (e.g. 95).  Disabled by default.",
+		type=float,
+		required=False
+	)
+	parser.add_argument(
+		"--read-rate",
+		help=f"Maximum API reads per second (default:  {DEFAULT_SETTINGS.get('read_rate')})",
+		type=float,
+		required=False
+	)
+	parser.add_argument(
+		"--write-rate",
+		help=f"Maximum API writes per second (default:  {DEFAULT_SETTINGS.get('write_rate')})",
+		type=float,
+		required=False
+	)
+	parser.add_argument(
+		"--response-format",
+		help="Representation to request from the Classic API when reading printers "
+			f"(default:  {DEFAULT_SETTINGS.get('response_format')})",
+		choices=PRINTER_CODECS.keys(),
+		required=False
+	)
+	parser.add_argument(
+		"--benchmark-codecs",
+		help="Compare parse time, allocations, and size of the XML and JSON printer "
+			"representations, then exit",
+		action="store_true"
+	)
+	parser.add_argument(
+		"--bulk-workers",
+		help="Maximum concurrent requests for bulk operations "
+			f"(default:  {DEFAULT_SETTINGS.get('bulk_workers')})",
+		type=int,
+		required=False
+	)
+	parser.add_argument(
+		"--drift-report",
+		help="Save a report comparing the local printers to the printers in the --site(s) to "
+			"this path (.json or .csv), then exit",
+		required=False
+	)
+	parser.add_argument(
+		"--driver-report",
+		help="Save a report of the local printers and the printers in the --site(s) that use "
+			"the --driver to this path (.json or .csv), then exit",
+		required=False
+	)
+	parser.add_argument(
+		"--driver",
+		help="Wildcard pattern matched against the manufacturer, model, nickname, and CUPS "
+			"filters of each PPD for the driver report (default:  *)",
+		default="*"
+	)
+	parser.add_argument(
+		"--driver-version-below",
+		help="Only include PPDs with a lower (or unknown) *FileVersion in the driver report",
+		required=False
+	)
+	parser.add_argument(
+		"--conflict-report",
+		help="Save a report of the duplicate printers in the --site(s) to this path "
+			"(.json or .csv), then exit",
+		required=False
+	)
+	parser.add_argument(
+		"--site",
+		help="Site to include in the drift, driver, or conflict report; can be specified "
+			"multiple times",
+		action="append",
+		default=[]
+	)
+	parser.add_argument("--config", help="Path to a JSON config file", required=False)
 	args, unknown = parser.parse_known_args(parser_args)
 
 	# If specified, set the desired log level
@@ -2397,13 +8686,90 @@ if __name__ == "__main__":
 		parser.print_help()
 		sys.exit(0)
 
+	# Load settings, command line arguments take precedence over the config file
+	settings = load_settings(
+		args.config,
+		{
+			"hedge_percentile": args.hedge_percentile,
+			"read_rate": args.read_rate,
+			"write_rate": args.write_rate,
+			"response_format": args.response_format,
+			"bulk_workers": args.bulk_workers
+		}
+	)
+
 	# Setup the GUI
 	gui = MainWindow()
+	gui.settings = settings
 	app.aboutToQuit.connect(gui.shutdown)
 
+	# Enable request hedging, if desired
+	if settings.get("hedge_percentile"):
+		gui.request_hedger = RequestHedger(
+			percentile=settings.get("hedge_percentile"), metrics=gui.api_metrics)
+
+	# Set the representation used to read printers
+	gui.response_codec = PRINTER_CODECS.get(settings.get("response_format"))
+
+	# Sites that are never listed
+	gui.sites_unauthorized = compile_site_patterns(settings.get("sites_unauthorized"))
+
+	# Cache GET responses, unless disabled
+	if settings.get("cache_max_bytes"):
+		gui.response_cache = ResponseCache(
+			max_bytes=settings.get("cache_max_bytes"),
+			list_ttl=settings.get("cache_list_ttl"),
+			detail_ttl=settings.get("cache_detail_ttl"),
+			spill_directory=os.path.join(
+				os.path.expanduser(settings.get("state_directory")), "cache"),
+			spill_max_bytes=settings.get("cache_spill_bytes"),
+			metrics=gui.api_metrics
+		)
+
+	# Check printer connectivity
+	gui.uri_prober = DeviceURIProber(
+		concurrency=settings.get("probe_concurrency"),
+		timeout=settings.get("probe_timeout"),
+		ttl=settings.get("probe_cache_ttl")
+	)
+
+	# Install printers on this Mac
+	gui.lpadmin_installer = LpadminInstaller(
+		lpadmin_path=settings.get("lpadmin_path"),
+		workers=settings.get("bulk_workers")
+	)
+
+	# Pace API traffic
+	gui.rate_limiter = RateLimiter(
+		read_rate=settings.get("read_rate"),
+		write_rate=settings.get("write_rate"),
+		metrics=gui.api_metrics
+	)
+
 	# Call functions on load
 	gui.jamf_pro_url()
 
+	# Save a drift report without displaying the GUI
+	if args.drift_report:
+
+		if not args.site:
+			parser.error("--drift-report requires at least one --site")
+
+		sys.exit(gui.export_drift_report(args.drift_report, args.site))
+
+	# Save a report of duplicate printers without displaying the GUI
+	if args.conflict_report:
+
+		if not args.site:
+			parser.error("--conflict-report requires at least one --site")
+
+		sys.exit(gui.export_conflict_report(args.conflict_report, args.site))
+
+	# Save a driver report without displaying the GUI
+	if args.driver_report:
+		sys.exit(gui.export_driver_report(
+			args.driver_report, args.site, args.driver, args.driver_version_below))
+
 	# Set the App Icon URL
 	app_icon_url = f"{gui.jps_url}ui/images/settings/Printer.png"
 
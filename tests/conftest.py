@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+
+# PrinterTool.py is a script rather than a package; make it importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
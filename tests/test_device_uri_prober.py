@@ -0,0 +1,88 @@
+import socket
+import threading
+
+import pytest
+
+
+PrinterTool = pytest.importorskip("PrinterTool")
+DeviceURIProber = PrinterTool.DeviceURIProber
+
+
+@pytest.fixture
+def listening_port():
+
+	with socket.socket() as server:
+		server.bind(("127.0.0.1", 0))
+		server.listen()
+		yield server.getsockname()[1]
+
+
+@pytest.fixture
+def closed_port():
+
+	with socket.socket() as unused:
+		unused.bind(("127.0.0.1", 0))
+		return unused.getsockname()[1]
+
+
+@pytest.mark.parametrize("device_uri, endpoint", [
+	("socket://10.0.0.1", ("10.0.0.1", 9100)),
+	("IPP://Printer.Example.com/ipp/print", ("printer.example.com", 631)),
+	("lpd://10.0.0.1:1515/queue", ("10.0.0.1", 1515)),
+	("ipp://[::1]/ipp", ("::1", 631)),
+	("dnssd://Printer._ipp._tcp.local./", None),
+	("usb://HP/LaserJet", None),
+	("ipp://[::1", None),
+	("lpd://host:port/queue", None),
+	(None, None)
+])
+def test_endpoint(device_uri, endpoint):
+
+	assert DeviceURIProber.endpoint(device_uri) == endpoint
+
+
+def test_probe(listening_port, closed_port):
+
+	reachable = f"socket://127.0.0.1:{listening_port}"
+	unreachable = f"ipp://127.0.0.1:{closed_port}/ipp"
+	results = DeviceURIProber(timeout=2).probe(
+		[ reachable, unreachable, "dnssd://Printer._ipp._tcp.local./", "ipp://[::1" ])
+
+	assert results.get(reachable).get("status") == "Reachable"
+	assert results.get(reachable).get("latency_ms") is not None
+	assert results.get(unreachable).get("status") == "Unreachable"
+	assert results.get("dnssd://Printer._ipp._tcp.local./").get("status") == "Not Probed"
+	assert results.get("ipp://[::1") == {
+		"status": "Not Probed", "latency_ms": None, "details": "The device URI is malformed" }
+
+
+def test_probes_each_endpoint_once_and_caches_it(listening_port):
+
+	prober = DeviceURIProber()
+	uris = [ f"socket://127.0.0.1:{listening_port}", f"socket://127.0.0.1:{listening_port}/" ]
+	results = prober.probe(uris)
+
+	assert results.get(uris[0]) is results.get(uris[1])
+	assert list(prober.cache) == [ ("127.0.0.1", listening_port) ]
+	assert prober.probe(uris[:1]).get(uris[0]) is results.get(uris[0])
+
+
+def test_cancel_callbacks_are_deregistered(listening_port):
+
+	token = PrinterTool.CancellationToken()
+	DeviceURIProber(ttl=0).probe([ f"socket://127.0.0.1:{listening_port}" ], token)
+
+	assert token.callbacks == []
+
+
+def test_canceling_stops_the_probe(monkeypatch):
+
+	async def never_answers(self, host, port, semaphore):
+		await PrinterTool.asyncio.sleep(30)
+
+	monkeypatch.setattr(DeviceURIProber, "probe_endpoint", never_answers)
+	token = PrinterTool.CancellationToken()
+	threading.Timer(0.1, token.cancel).start()
+
+	with pytest.raises(PrinterTool.OperationCancelled):
+		DeviceURIProber().probe([ "socket://192.0.2.1" ], token)
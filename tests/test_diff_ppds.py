@@ -0,0 +1,117 @@
+import difflib
+import random
+import re
+
+import pytest
+
+
+PrinterTool = pytest.importorskip("PrinterTool")
+
+
+def apply_diff(lines, diff):
+	"""Applies a unified diff to a list of lines."""
+
+	patched = []
+	position = 0
+
+	for line in diff[2:]:
+
+		if hunk := re.match(r"@@ -(\d+)(?:,(\d+))? \+", line):
+			start = int(hunk[1])
+			start = start if hunk[2] == "0" else start - 1
+			patched.extend(lines[position:start])
+			position = start
+		elif line.startswith(" "):
+			patched.append(lines[position])
+			position += 1
+		elif line.startswith("-"):
+			position += 1
+		else:
+			patched.append(line[1:])
+
+	return patched + lines[position:]
+
+
+def hunks(diff):
+	"""Splits a unified diff into its hunks."""
+
+	split = []
+
+	for line in diff[2:]:
+
+		if line.startswith("@@"):
+			split.append([ line ])
+		else:
+			split[-1].append(line)
+
+	return split
+
+
+def test_identical_ppds_have_no_diff():
+
+	assert list(PrinterTool.diff_ppds("a\nb\n", "a\nb\n")) == []
+
+
+def test_matches_difflib():
+
+	from_lines = [ f"*Option{number}: True" for number in range(40) ]
+	to_lines = list(from_lines)
+	to_lines[5] = "*Option5: False"
+	to_lines.insert(30, "*NewOption: True")
+
+	assert list(
+		PrinterTool.diff_ppds("\n".join(from_lines), "\n".join(to_lines), "a", "b")
+	) == list(difflib.unified_diff(from_lines, to_lines, "a", "b", lineterm=""))
+
+
+def test_keeps_trailing_context():
+
+	# The change can be aligned after the common end; its context must still be included
+	from_lines = [ "c", "c", "a", "c", "a", "c", "a", "a", "c" ]
+	to_lines = [ "c", "c", "c", "c", "a", "c", "a", "c", "c", "a", "a", "c" ]
+	diff = list(PrinterTool.diff_ppds("\n".join(from_lines), "\n".join(to_lines), context=1))
+
+	assert apply_diff(from_lines, diff) == to_lines
+
+	for hunk in hunks(diff):
+		assert hunk[1].startswith(" ") or hunk[0].startswith("@@ -1")
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_random_edits(seed):
+
+	generator = random.Random(seed)
+	alphabet = "abcx"[:generator.randint(1, 4)]
+	from_lines = [ generator.choice(alphabet) for _ in range(generator.randint(0, 40)) ]
+	to_lines = list(from_lines)
+
+	for _ in range(generator.randint(1, 4)):
+
+		index = generator.randint(0, len(to_lines))
+		edit = generator.randint(0, 2)
+
+		if edit == 0:
+			to_lines.insert(index, generator.choice(f"{alphabet}yz"))
+		elif to_lines and edit == 1:
+			del to_lines[min(index, len(to_lines) - 1)]
+		elif to_lines:
+			to_lines[min(index, len(to_lines) - 1)] = generator.choice(f"{alphabet}z")
+
+	context = generator.randint(0, 4)
+	diff = list(PrinterTool.diff_ppds(
+		"\n".join(from_lines), "\n".join(to_lines), "a", "b", context=context))
+
+	assert apply_diff(from_lines, diff) == to_lines
+
+	# Every hunk has the full context, unless it reaches the start or end of the PPD
+	for hunk in hunks(diff):
+
+		header = re.match(r"@@ -(\d+)(?:,(\d+))?", hunk[0])
+		length = int(header[2] or 1)
+		start = int(header[1]) - 1 if length else int(header[1])
+		body = [ line[0] for line in hunk[1:] ]
+		leading = len(body) - len("".join(body).lstrip(" "))
+		trailing = len(body) - len("".join(body).rstrip(" "))
+
+		assert leading == context or start == 0
+		assert trailing == context or start + length == len(from_lines)
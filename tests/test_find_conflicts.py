@@ -0,0 +1,46 @@
+import pytest
+
+
+PrinterTool = pytest.importorskip("PrinterTool")
+Printer = PrinterTool.Printer
+
+
+def printer(printer_id, display_name, **kwargs):
+	"""Creates a printer; its CUPS name defaults to its display name."""
+
+	kwargs.setdefault("cups_name", display_name)
+
+	return Printer(printer_id=printer_id, display_name=display_name, **kwargs)
+
+
+def test_find_conflicts_groups_by_normalized_uri():
+
+	conflicts = PrinterTool.find_conflicts([
+		printer(1, "A", device_uri="lpd://Host.Example/q/", ppd_contents="x", site="S1"),
+		printer(2, "B", device_uri="lpd://host.example/q", ppd_contents="x", site="S2"),
+		printer(3, "C", device_uri="lpd://host.example/q", ppd_contents="y", site="S1"),
+		printer(4, "D", device_uri="ipp://other", ppd_contents="y", site="S1")
+	])
+	statuses = { conflict.get("id"): conflict.get("status") for conflict in conflicts }
+
+	assert statuses == { 1: "Clone", 2: "Clone", 3: "Duplicate URI" }
+	assert all(conflict.get("across_sites") for conflict in conflicts)
+	assert conflicts[0].get("details") == (
+		"Shares lpd://host.example/q with B (ID:  2, Site:  S2), C (ID:  3, Site:  S1)")
+
+
+def test_find_conflicts_reports_name_collisions_ignoring_case():
+
+	conflicts = PrinterTool.find_conflicts([
+		printer(1, "Lobby", cups_name="lobby_1", site="S1"),
+		printer(2, "LOBBY", cups_name="Lobby_1", site="S1"),
+		printer(3, "Annex", site="S1")
+	])
+
+	assert sorted(
+		(conflict.get("status"), conflict.get("id")) for conflict in conflicts
+	) == [
+		("CUPS Name Collision", 1), ("CUPS Name Collision", 2),
+		("Name Collision", 1), ("Name Collision", 2)
+	]
+	assert not any(conflict.get("across_sites") for conflict in conflicts)
@@ -0,0 +1,99 @@
+import os
+import stat
+import sys
+
+import pytest
+
+
+PrinterTool = pytest.importorskip("PrinterTool")
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="lpadmin is a shell script")
+
+
+LPADMIN = """#!/bin/sh
+echo "$@" >> "{log}"
+case "$2" in
+	bad*) echo "lpadmin: Bad device-uri" >&2; exit 1;;
+	slow*) exec sleep 30;;
+esac
+"""
+
+
+@pytest.fixture
+def lpadmin(tmp_path):
+	"""Writes a stand-in lpadmin that logs its arguments."""
+
+	path = tmp_path / "lpadmin"
+	path.write_text(LPADMIN.format(log=tmp_path / "lpadmin.log"))
+	path.chmod(path.stat().st_mode | stat.S_IXUSR)
+
+	return str(path)
+
+
+def printer(cups_name, **kwargs):
+	"""Creates a printer that can be installed."""
+
+	kwargs.setdefault("device_uri", "lpd://10.0.0.1/queue")
+	kwargs.setdefault("ppd_contents", '*PPD-Adobe: "4.3"\n')
+
+	return PrinterTool.Printer(
+		printer_id=cups_name, display_name=cups_name.title(), cups_name=cups_name, **kwargs)
+
+
+def test_installs_printers(lpadmin):
+
+	progress = []
+	results = PrinterTool.LpadminInstaller(lpadmin, workers=2).install(
+		[ printer("lobby", location="Lobby"), printer("annex") ], progress=progress.append)
+
+	assert [ result.get("status") for result in results ] == [ "Installed", "Installed" ]
+	assert sorted(result.get("printer") for result in progress) == [ "Annex", "Lobby" ]
+
+	with open(os.path.join(os.path.dirname(lpadmin), "lpadmin.log"), encoding="utf-8") as log:
+		arguments = sorted(line.split() for line in log)
+
+	# Every argument but the path of the temporary PPD
+	assert arguments[1][:6] + arguments[1][7:] == [
+		"-p", "lobby", "-E", "-v", "lpd://10.0.0.1/queue", "-P",
+		"-D", "Lobby", "-L", "Lobby", "-o", "printer-is-shared=false"
+	]
+	assert arguments[1][6].endswith(".ppd")
+
+
+def test_reports_failures(lpadmin):
+
+	results = PrinterTool.LpadminInstaller(lpadmin, timeout=1).install([
+		printer("bad"),
+		printer("slow"),
+		printer("no_ppd", ppd_contents=""),
+		printer("no_uri", device_uri="")
+	])
+
+	assert [ result.get("status") for result in results ] == [ "Failed" ] * 4
+	assert [ result.get("details") for result in results ] == [
+		"lpadmin: Bad device-uri",
+		"lpadmin did not finish in 1 seconds",
+		"Jamf Pro does not have a PPD for the printer",
+		"The printer does not have a CUPS name and device URI"
+	]
+
+
+def test_reports_a_missing_lpadmin(tmp_path):
+
+	result = PrinterTool.LpadminInstaller(str(tmp_path / "missing")).install(
+		[ printer("lobby") ])[0]
+
+	assert result.get("status") == "Failed"
+	assert result.get("details").startswith(f"Failed to run {tmp_path / 'missing'}")
+
+
+def test_canceling_stops_lpadmin(lpadmin):
+
+	token = PrinterTool.CancellationToken()
+	installer = PrinterTool.LpadminInstaller(lpadmin, timeout=30)
+	PrinterTool.threading.Timer(0.5, token.cancel).start()
+
+	with pytest.raises(PrinterTool.OperationCancelled):
+		installer.install([ printer("slow") ], token)
+
+	assert token.callbacks == []
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+
+PrinterTool = pytest.importorskip("PrinterTool")
+OperationJournal = PrinterTool.OperationJournal
+
+
+STEPS = [
+	{ "key": "create:A", "action": "create", "printer": "A" },
+	{ "key": "create:B", "action": "create", "printer": "B" },
+	{ "key": "create:C", "action": "create", "printer": "C" }
+]
+
+
+@pytest.fixture
+def path(tmp_path):
+
+	return str(tmp_path / "state" / "create.journal")
+
+
+def test_resumes_with_the_steps_that_did_not_complete(path):
+
+	journal = OperationJournal.start(path, "Create printers")
+	journal.plan(STEPS)
+	journal.begin(STEPS[0])
+	journal.finish(STEPS[0], { "status": "Created", "id": 10 })
+	journal.begin(STEPS[1])
+
+	resumed = OperationJournal(path)
+
+	assert resumed.description == "Create printers"
+	assert [ step.get("key") for step in resumed.pending() ] == [ "create:B", "create:C" ]
+	assert resumed.state("create:A") == "Created"
+	assert resumed.state("create:B") == "Interrupted"
+	assert resumed.state("create:C") == "Not Started"
+
+
+def test_failed_steps_are_retried(path):
+
+	journal = OperationJournal.start(path)
+	journal.plan(STEPS[:1])
+	journal.begin(STEPS[0])
+	journal.finish(STEPS[0], { "status": "Failed" })
+
+	assert OperationJournal(path).pending() == STEPS[:1]
+
+
+def test_beginning_a_step_again_clears_its_outcome(path):
+
+	journal = OperationJournal.start(path)
+	journal.plan(STEPS[:1])
+	journal.begin(STEPS[0])
+	journal.finish(STEPS[0], { "status": "Failed" })
+	journal.begin(STEPS[0])
+
+	assert OperationJournal(path).state("create:A") == "Interrupted"
+
+
+def test_start_discards_the_previous_run(path):
+
+	journal = OperationJournal.start(path)
+	journal.plan(STEPS)
+	journal.begin(STEPS[0])
+
+	restarted = OperationJournal.start(path, "Create printers again")
+
+	assert restarted.steps == {}
+	assert OperationJournal(path).pending() == []
+
+
+def test_a_partially_written_entry_is_ignored(path):
+
+	journal = OperationJournal.start(path)
+	journal.plan(STEPS[:1])
+	journal.begin(STEPS[0])
+
+	with open(path, "a", encoding="utf-8") as journal_file:
+		journal_file.write(json.dumps({ "event": "finish", "key": "create:A" })[:20])
+
+	assert OperationJournal(path).state("create:A") == "Interrupted"
+
+
+def test_find_returns_unfinished_journals(tmp_path):
+
+	unfinished = OperationJournal.start(str(tmp_path / "unfinished.journal"))
+	unfinished.plan(STEPS[:1])
+	finished = OperationJournal.start(str(tmp_path / "finished.journal"))
+	finished.plan(STEPS[:1])
+	finished.finish(STEPS[0], { "status": "Created" })
+
+	assert [ journal.path for journal in OperationJournal.find(str(tmp_path)) ] == [
+		unfinished.path ]
+	assert OperationJournal.find(str(tmp_path / "missing")) == []
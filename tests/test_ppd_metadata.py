@@ -0,0 +1,47 @@
+import pytest
+
+
+PrinterTool = pytest.importorskip("PrinterTool")
+
+
+PPD = """*PPD-Adobe: "4.3"
+*FileVersion: "1.10"
+*Manufacturer: "HP"
+*ModelName: "HP LaserJet 4250"
+*NickName: "HP LaserJet 4250, hpcups 3.22"
+*Product: "(HP LaserJet 4250)"
+*Product: "(HP LaserJet 4250n)"
+*cupsFilter: "application/vnd.cups-raster 0 hpcups"
+*%NickName: "commented out"
+*OpenUI *PageSize: PickOne
+"""
+
+
+def test_parse_ppd_metadata():
+
+	metadata = PrinterTool.parse_ppd_metadata(PPD)
+
+	assert metadata.get("FileVersion") == "1.10"
+	assert metadata.get("Manufacturer") == "HP"
+	assert metadata.get("NickName") == "HP LaserJet 4250, hpcups 3.22"
+	assert metadata.get("Product") == [ "(HP LaserJet 4250)", "(HP LaserJet 4250n)" ]
+	assert metadata.get("cupsFilter") == [ "application/vnd.cups-raster 0 hpcups" ]
+	assert "PageSize" not in metadata
+
+
+def test_parse_ppd_metadata_keeps_the_first_value():
+
+	metadata = PrinterTool.parse_ppd_metadata('*ModelName: "First"\n*ModelName: "Second"\n')
+
+	assert metadata.get("ModelName") == "First"
+
+
+@pytest.mark.parametrize("older, newer", [
+	("1.9", "1.10"),
+	("1.2", "1.2.1"),
+	("v3.21.2", "3.22.0"),
+	("", "0.1")
+])
+def test_version_key(older, newer):
+
+	assert PrinterTool.version_key(older) < PrinterTool.version_key(newer)
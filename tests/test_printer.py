@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import pytest
+
+
+PrinterTool = pytest.importorskip("PrinterTool")
+Printer = PrinterTool.Printer
+
+
+def printer(**kwargs):
+	"""Creates a printer with every compared field set."""
+
+	fields = {
+		"display_name": "Lobby",
+		"cups_name": "Lobby",
+		"location": "Main Building",
+		"device_uri": "lpd://10.0.0.1/queue",
+		"model": "HP LaserJet 4250",
+		"ppd_contents": '*PPD-Adobe: "4.3"\n'
+	}
+	fields.update(kwargs)
+
+	return Printer(**fields)
+
+
+def test_identical_printers_have_no_changes():
+
+	changes = printer().differences(printer(printer_id=1, site="Library", updated="never"))
+
+	assert changes == {}
+	assert not Printer.requires_ppd(changes)
+
+
+def test_metadata_change():
+
+	changes = printer(location="Annex").differences(printer())
+
+	assert changes == { "location": ("Main Building", "Annex") }
+	assert not Printer.requires_ppd(changes)
+
+
+def test_ppd_change_is_detected_by_hash():
+
+	local_printer = printer(ppd_contents='*PPD-Adobe: "4.3"\n*FileVersion: "2.0"\n')
+	jps_printer = printer()
+	changes = local_printer.differences(jps_printer)
+
+	assert changes == { "ppd_contents": (jps_printer.ppd_hash, local_printer.ppd_hash) }
+	assert Printer.requires_ppd(changes)
+
+
+def test_changing_the_ppd_invalidates_its_hash():
+
+	jps_printer = printer()
+	original_hash = jps_printer.ppd_hash
+	jps_printer.ppd_contents = '*PPD-Adobe: "4.3"\n*FileVersion: "2.0"\n'
+
+	assert jps_printer.ppd_hash != original_hash
+	assert jps_printer.ppd_hash == printer(ppd_contents=jps_printer.ppd_contents).ppd_hash
+	assert "ppd_contents" in printer().differences(jps_printer)
+
+
+def test_missing_ppd_hashes_like_an_empty_one():
+
+	assert printer(ppd_contents=None).ppd_hash == printer(ppd_contents="").ppd_hash
+
+
+def test_cups_rename_sends_the_ppd():
+
+	changes = printer(cups_name="Lobby_2").differences(printer())
+
+	assert changes == { "cups_name": ("Lobby", "Lobby_2") }
+	assert Printer.requires_ppd(changes)
+
+
+def test_timestamp_is_taken_when_called(monkeypatch):
+
+	class Later(datetime):
+
+		@classmethod
+		def now(cls, tz=None):
+			return cls(2030, 5, 6, 17, 8, 9)
+
+	monkeypatch.setattr(PrinterTool, "datetime", Later)
+
+	assert PrinterTool.get_timestamp() == "2030-05-06 05:08:09"
+	assert PrinterTool.get_timestamp(datetime(2024, 1, 2, 3, 4, 5)) == "2024-01-02 03:04:05"
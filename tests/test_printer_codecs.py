@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+
+PrinterTool = pytest.importorskip("PrinterTool")
+
+
+NOTES = json.dumps({ "Site": "Library", "Created": "2024-01-02 03:04:05", "Created_by": "admin" })
+
+XML_RECORD = f"""<?xml version="1.0" encoding="UTF-8"?>
+<printer>
+	<id>7</id>
+	<name>Library &amp; Lobby</name>
+	<category/>
+	<uri>lpd://10.0.0.7/queue</uri>
+	<CUPS_name>Library_Lobby</CUPS_name>
+	<model></model>
+	<notes>{NOTES.replace('"', "&quot;")}</notes>
+	<ppd>Library_Lobby.ppd</ppd>
+	<ppd_contents></ppd_contents>
+</printer>
+""".encode()
+
+JSON_RECORD = json.dumps({
+	"printer": {
+		"id": 7,
+		"name": "Library & Lobby",
+		"category": None,
+		"uri": "lpd://10.0.0.7/queue",
+		"CUPS_name": "Library_Lobby",
+		"model": None,
+		"notes": NOTES,
+		"ppd": "Library_Lobby.ppd",
+		"ppd_contents": ""
+	}
+}).encode()
+
+
+def test_codecs_are_registered_by_content_type():
+
+	assert set(PrinterTool.PRINTER_CODECS) == { "xml", "json" }
+
+
+def test_codecs_produce_the_same_record():
+
+	xml_record = PrinterTool.PRINTER_CODECS.get("xml").printer_record(XML_RECORD)
+	json_record = PrinterTool.PRINTER_CODECS.get("json").printer_record(JSON_RECORD)
+
+	assert xml_record == json_record
+	assert set(xml_record) == set(PrinterTool.PrinterCodec.fields)
+
+	# Missing and null fields are empty strings
+	assert xml_record.get("location") == ""
+	assert xml_record.get("model") == ""
+	assert xml_record.get("ppd_contents") == ""
+
+
+def test_codecs_produce_the_same_printer():
+
+	xml_printer = PrinterTool.Printer.from_jps_record(
+		PrinterTool.PRINTER_CODECS.get("xml").printer_record(XML_RECORD))
+	json_printer = PrinterTool.Printer.from_jps_record(
+		PrinterTool.PRINTER_CODECS.get("json").printer_record(JSON_RECORD))
+
+	assert vars(xml_printer) == vars(json_printer)
+	assert xml_printer.printer_id == "7"
+	assert xml_printer.display_name == "Library & Lobby"
+	assert xml_printer.site == "Library"
+	assert xml_printer.updated == "unknown"
+	assert not xml_printer.differences(json_printer)
+
+
+def test_codecs_parse_the_same_printer_ids():
+
+	xml_list = b"""<printers><size>2</size>
+		<printer><id>1</id><name>A</name></printer>
+		<printer><id>22</id><name>B</name></printer>
+	</printers>"""
+	json_list = json.dumps(
+		{ "printers": [ { "id": 1, "name": "A" }, { "id": 22, "name": "B" } ] }).encode()
+
+	assert PrinterTool.PRINTER_CODECS.get("xml").printer_ids(xml_list) == [ "1", "22" ]
+	assert PrinterTool.PRINTER_CODECS.get("json").printer_ids(json_list) == [ "1", "22" ]
+	assert PrinterTool.PRINTER_CODECS.get("json").printer_ids(b"{}") == []
@@ -0,0 +1,75 @@
+from xml.etree import ElementTree
+
+import pytest
+
+
+PrinterTool = pytest.importorskip("PrinterTool")
+
+
+PPD = '*PPD-Adobe: "4.3"\r\n*NickName: "Lobby <A&B> é"\r\n*% 100% > 99%\r\n'
+
+
+def payload(ppd_contents=PPD, chunk_size=None):
+	"""Builds a payload with fields that need escaping."""
+
+	printer_payload = PrinterTool.PrinterPayload(
+		fields = [
+			("name", "Lobby & Annex <2nd floor>"),
+			("location", None),
+			("notes", '{"Site": "Library"}'),
+			("ppd_contents", "ignored"),
+			("model", 4250)
+		],
+		ppd_contents = ppd_contents
+	)
+
+	if chunk_size:
+		printer_payload.chunk_size = chunk_size
+
+	return printer_payload
+
+
+def test_body_parses_back_to_the_fields():
+
+	printer = ElementTree.fromstring(b"".join(payload()))
+
+	assert [ element.tag for element in printer ] == [
+		"name", "location", "notes", "ppd_contents", "model" ]
+	assert printer.findtext("name") == "Lobby & Annex <2nd floor>"
+	assert printer.findtext("location") == ""
+	assert printer.findtext("notes") == '{"Site": "Library"}'
+	assert printer.findtext("model") == "4250"
+
+
+def test_crlf_line_endings_survive_parsing():
+
+	# Split into small chunks, so entities and CRLFs fall across chunk boundaries
+	printer = ElementTree.fromstring(b"".join(payload(chunk_size=7)))
+
+	assert printer.findtext("ppd_contents") == PPD
+
+
+@pytest.mark.parametrize("ppd_contents", [
+	PPD, "", None, "*ASCII only\n", "&&&<<<>>>\r\r", "é中\U0001f5a8\r\n" * 50
+])
+@pytest.mark.parametrize("chunk_size", [ None, 5 ])
+def test_length_is_the_bytes_sent(ppd_contents, chunk_size):
+
+	printer_payload = payload(ppd_contents, chunk_size)
+
+	assert len(printer_payload) == len(b"".join(printer_payload))
+
+
+def test_can_be_sent_again():
+
+	printer_payload = payload()
+
+	assert b"".join(printer_payload) == b"".join(printer_payload)
+
+
+def test_payload_without_a_ppd():
+
+	printer_payload = PrinterTool.PrinterPayload(fields = [ ("notes", "a") ])
+
+	assert b"".join(printer_payload) == b"<printer><notes>a</notes></printer>"
+	assert len(printer_payload) == 35
@@ -0,0 +1,108 @@
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+
+PrinterTool = pytest.importorskip("PrinterTool")
+
+
+def test_bucket_allows_a_burst_then_paces():
+
+	bucket = PrinterTool.TokenBucket(rate=20, capacity=5)
+	started = time.monotonic()
+
+	for _ in range(5):
+		bucket.acquire()
+
+	assert time.monotonic() - started < 0.04
+
+	# The sixth token takes 1 / rate seconds to refill
+	assert bucket.acquire() == pytest.approx(0.05, abs=0.03)
+
+
+def test_bucket_pause_does_not_accumulate_tokens():
+
+	bucket = PrinterTool.TokenBucket(rate=50, capacity=5)
+	bucket.pause(0.2)
+
+	assert bucket.acquire() == pytest.approx(0.2, abs=0.05)
+
+	# Without the pause filling the bucket, the next token still has to be waited for
+	assert bucket.acquire() == pytest.approx(0.02, abs=0.015)
+
+
+def test_throttle_halves_the_rate_down_to_a_floor():
+
+	limiter = PrinterTool.RateLimiter(read_rate=20, write_rate=5)
+	rates = []
+
+	for _ in range(6):
+		limiter.throttle("get", "0")
+		rates.append(limiter.buckets.get("read").rate)
+
+	assert rates == [ 10, 5, 2.5, 1.25, 1, 1 ]
+	assert limiter.buckets.get("write").rate == 5
+	assert limiter.metrics.get("rate_limit_throttled") == 6
+
+
+def test_recover_restores_the_rate_in_steps():
+
+	limiter = PrinterTool.RateLimiter(read_rate=20, write_rate=5)
+
+	for _ in range(5):
+		limiter.throttle("put", "0")
+
+	rates = []
+
+	for _ in range(22):
+		limiter.recover("put")
+		rates.append(limiter.buckets.get("write").rate)
+
+	# 5% of the configured rate per successful request, never above the configured rate
+	assert rates[:3] == pytest.approx([ 0.5, 0.75, 1.0 ])
+	assert rates[-1] == 5
+	assert max(rates) == 5
+
+
+def test_throttle_pauses_for_retry_after():
+
+	limiter = PrinterTool.RateLimiter(read_rate=100, write_rate=5)
+	limiter.throttle("get", "0.2")
+
+	started = time.monotonic()
+	limiter.acquire("get")
+
+	assert time.monotonic() - started == pytest.approx(0.2, abs=0.05)
+
+
+@pytest.mark.parametrize("value, seconds", [
+	(None, 1.0),
+	("", 1.0),
+	("5", 5.0),
+	("2.5", 2.5),
+	("0", 0.0),
+	("-3", 0.0),
+	("120", 60.0),
+	("inf", 1.0),
+	("nan", 1.0),
+	("soon", 1.0),
+	("Wed, 21 Oct 2015 07:28:00 GMT", 0.0)
+])
+def test_parse_retry_after(value, seconds):
+
+	assert PrinterTool.parse_retry_after(value) == seconds
+
+
+def test_parse_retry_after_http_date():
+
+	retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+
+	assert PrinterTool.parse_retry_after(retry_at) == pytest.approx(30, abs=2)
+	assert PrinterTool.parse_retry_after(retry_at, maximum=10) == 10
+
+
+def test_parse_retry_after_default_is_capped():
+
+	assert PrinterTool.parse_retry_after(None, default=90) == 60
@@ -0,0 +1,49 @@
+import pytest
+
+
+PrinterTool = pytest.importorskip("PrinterTool")
+Printer = PrinterTool.Printer
+
+
+def printer(printer_id, display_name, **kwargs):
+	"""Creates a printer; its CUPS name defaults to its display name."""
+
+	kwargs.setdefault("cups_name", display_name)
+
+	return Printer(printer_id=printer_id, display_name=display_name, **kwargs)
+
+
+def test_reconcile_printers_classifies_local_printers():
+
+	jps_printers = [
+		printer(1, "Same", location="Lobby", ppd_contents="ppd", site="Site"),
+		printer(2, "Drifted", location="Lobby", ppd_contents="ppd", site="Site"),
+		printer(3, "Elsewhere", site="Other Site")
+	]
+	local_printers = [
+		printer("local", "Same", location="Lobby", ppd_contents="ppd"),
+		printer("local", "Drifted", location="Annex", ppd_contents="ppd"),
+		printer("local", "Elsewhere"),
+		printer("local", "New")
+	]
+	plan = PrinterTool.reconcile_printers(local_printers, jps_printers, "Site")
+
+	assert [ step.get("status") for step in plan ] == [
+		"Identical", "Drifted", "Conflict", "Missing" ]
+	assert plan[1].get("changes") == { "location": ("Lobby", "Annex") }
+
+
+def test_reconcile_printers_matches_a_jps_printer_once():
+
+	jps_printers = [ printer(1, "Lobby", cups_name="lobby", site="Site") ]
+	local_printers = [
+		# Matches by CUPS name, but the display name match below claims the printer first
+		printer("local", "Lobby Copy", cups_name="lobby"),
+		printer("local", "Lobby", cups_name="lobby_2")
+	]
+	plan = PrinterTool.reconcile_printers(local_printers, jps_printers, "Site")
+
+	assert plan[0].get("status") == "Conflict"
+	assert plan[0].get("details") == "'Lobby' is already matched by local printer 'Lobby'"
+	assert plan[1].get("status") == "Drifted"
+	assert plan[1].get("jps_printer") is jps_printers[0]
@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+
+
+PrinterTool = pytest.importorskip("PrinterTool")
+
+
+def hedger(samples=5, latency=0.01):
+	"""Creates a hedger that has already recorded some latencies."""
+
+	request_hedger = PrinterTool.RequestHedger(min_samples=5, min_delay=0.05)
+
+	for _ in range(samples):
+		request_hedger.record(latency)
+
+	return request_hedger
+
+
+def test_no_hedge_before_enough_samples():
+
+	request_hedger = hedger(samples=4)
+	tokens = []
+
+	def send(token):
+		tokens.append(token)
+		return "response"
+
+	assert request_hedger.threshold() is None
+	assert request_hedger.execute(send) == "response"
+	assert tokens == [ PrinterTool.NEVER_CANCELED ]
+	assert request_hedger.metrics.get("hedges_sent") == 0
+	assert len(request_hedger.latencies) == 5
+
+
+def test_fast_requests_are_not_hedged():
+
+	request_hedger = hedger()
+	sent = []
+
+	assert request_hedger.execute(lambda token: sent.append(token) or "response") == "response"
+	assert len(sent) == 1
+	assert request_hedger.metrics.get("hedges_sent") == 0
+
+
+def test_slow_request_is_hedged_and_the_loser_canceled():
+
+	request_hedger = hedger()
+	tokens = []
+	lock = threading.Lock()
+
+	def send(token):
+
+		with lock:
+			tokens.append(token)
+			first = len(tokens) == 1
+
+		if first:
+			# Only answers once it is canceled
+			token.event.wait(5)
+			return "slow"
+
+		return "fast"
+
+	assert request_hedger.execute(send) == "fast"
+	assert len(tokens) == 2
+	assert tokens[0].cancelled
+	assert not tokens[1].cancelled
+	assert request_hedger.metrics.get("hedges_sent") == 1
+	assert request_hedger.metrics.get("hedge_wins") == 1
+
+	# Both the winner's and the canceled loser's latency are recorded
+	recorded = list(request_hedger.latencies)[5:]
+	assert len(recorded) == 2
+	assert max(recorded) >= 0.05
+
+
+def test_failed_original_waits_for_the_hedge():
+
+	request_hedger = hedger()
+	calls = []
+
+	def send(token):
+
+		calls.append(token)
+
+		if len(calls) == 1:
+			token.sleep(0.1)
+			raise OSError("connection reset")
+
+		# Answers after the original failed
+		threading.Event().wait(0.2)
+		return "hedge"
+
+	assert request_hedger.execute(send) == "hedge"
+
+
+def test_errors_are_raised_when_every_attempt_fails():
+
+	def send(token):
+		raise OSError("connection reset")
+
+	with pytest.raises(OSError):
+		hedger(samples=4).execute(send)
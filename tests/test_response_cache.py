@@ -0,0 +1,92 @@
+import pytest
+
+
+PrinterTool = pytest.importorskip("PrinterTool")
+CachedResponse = PrinterTool.CachedResponse
+
+
+LIST = "JSSResource/printers"
+DETAIL = "JSSResource/printers/id/1"
+
+
+def response(content=b"<printer/>", status_code=200):
+	"""Builds a response to cache."""
+
+	return CachedResponse(status_code, content, { "Content-Type": "text/xml" })
+
+
+def key(endpoint):
+	"""Builds the cache key of a request."""
+
+	return ("https://jps.example.com|admin", endpoint, "application/xml")
+
+
+def test_caches_successful_responses():
+
+	cache = PrinterTool.ResponseCache()
+	cache.put(key(DETAIL), response())
+	cache.put(key(LIST), response(status_code=404))
+
+	assert cache.get(key(DETAIL)).content == b"<printer/>"
+	assert cache.get(key(LIST)) is None
+	assert cache.metrics.get("cache_hits") == 1
+
+
+def test_expired_responses_are_not_served():
+
+	cache = PrinterTool.ResponseCache(list_ttl=0)
+	cache.put(key(LIST), response())
+
+	assert cache.get(key(LIST)) is None
+
+
+def test_evicts_the_least_recently_used_response():
+
+	cache = PrinterTool.ResponseCache(max_bytes=20)
+	cache.put(key("JSSResource/printers/id/1"), response(b"1" * 10))
+	cache.put(key("JSSResource/printers/id/2"), response(b"2" * 10))
+	cache.get(key("JSSResource/printers/id/1"))
+	cache.put(key("JSSResource/printers/id/3"), response(b"3" * 10))
+
+	assert cache.get(key("JSSResource/printers/id/2")) is None
+	assert cache.get(key("JSSResource/printers/id/1")) is not None
+	assert cache.size == 20
+
+
+def test_evicted_responses_spill_to_disk(tmp_path):
+
+	cache = PrinterTool.ResponseCache(
+		max_bytes=10, spill_directory=str(tmp_path), spill_max_bytes=100)
+	cache.put(key("JSSResource/printers/id/1"), response(b"1" * 10))
+	cache.put(key("JSSResource/printers/id/2"), response(b"2" * 10))
+
+	assert cache.get(key("JSSResource/printers/id/1")).content == b"1" * 10
+	assert cache.metrics.get("cache_spills") >= 1
+
+
+def test_invalidate_drops_the_resource_and_its_list():
+
+	cache = PrinterTool.ResponseCache()
+	cache.put(key(LIST), response())
+	cache.put(key(DETAIL), response())
+	cache.invalidate(DETAIL)
+
+	assert cache.get(key(LIST)) is None
+	assert cache.get(key(DETAIL)) is None
+
+
+def test_responses_that_raced_a_write_are_dropped():
+
+	cache = PrinterTool.ResponseCache()
+	generation = cache.generation(LIST)
+
+	# The GET was sent before the write, but answered after it
+	cache.invalidate(DETAIL)
+	cache.put(key(LIST), response(), generation)
+
+	assert cache.get(key(LIST)) is None
+	assert cache.metrics.get("cache_stale_drops") == 1
+
+	cache.put(key(LIST), response(), cache.generation(LIST))
+
+	assert cache.get(key(LIST)) is not None
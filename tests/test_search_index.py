@@ -0,0 +1,86 @@
+import pytest
+
+
+PrinterTool = pytest.importorskip("PrinterTool")
+Printer = PrinterTool.Printer
+
+
+def printer(printer_id, display_name, **kwargs):
+	"""Creates a printer; its CUPS name defaults to its display name."""
+
+	kwargs.setdefault("cups_name", display_name)
+
+	return Printer(printer_id=printer_id, display_name=display_name, **kwargs)
+
+
+def index_of(printers):
+	"""Indexes printers by ID."""
+
+	index = PrinterTool.PrinterSearchIndex()
+
+	for jps_printer in printers:
+		index.add(jps_printer.printer_id, jps_printer)
+
+	return index
+
+
+def test_search_matches_substrings_of_every_term():
+
+	index = index_of([
+		printer(1, "ENG-101 HP", location="Engineering Room 101"),
+		printer(2, "LIB-202 Xerox", location="Library"),
+		printer(3, "ENG-303 Xerox", location="Engineering Room 303")
+	])
+
+	assert set(index.search("xerox")) == { 2, 3 }
+	assert set(index.search("eng xerox")) == { 3 }
+	assert index.search("   ") is None
+
+
+def test_search_ranks_name_prefixes_first():
+
+	index = index_of([
+		printer(1, "Lobby HP", location="Main"),
+		printer(2, "Main Lobby", location="Main"),
+		printer(3, "Annex", location="Main Lobby")
+	])
+	ranks = index.search("lobby")
+
+	assert sorted(ranks, key=ranks.get) == [ 1, 2, 3 ]
+
+
+def test_short_terms_match_word_prefixes():
+
+	index = index_of([ printer(1, "ENG-101"), printer(2, "Library") ])
+
+	assert set(index.search("li")) == { 2 }
+	assert set(index.search("10")) == { 1 }
+
+
+def test_search_falls_back_to_similar_printers():
+
+	index = index_of([ printer(1, "Xerox WorkCentre"), printer(2, "Canon") ])
+
+	assert set(index.search("xerx workcentre")) == { 1 }
+
+
+def test_readding_a_changed_printer_replaces_it():
+
+	jps_printer = printer(1, "Old Name")
+	index = index_of([ jps_printer ])
+	index.add(1, printer(1, "New Name"))
+
+	assert set(index.search("new")) == { 1 }
+	assert not index.search("old")
+
+
+def test_removed_printers_are_not_found_after_compaction():
+
+	index = index_of([ printer(number, f"Printer {number}") for number in range(10) ])
+
+	for number in range(8):
+		index.remove(number)
+
+	# The index was compacted once most of its printers had been removed
+	assert set(index.search("printer")) == { 8, 9 }
+	assert len(index.documents) < 10